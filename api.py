@@ -0,0 +1,221 @@
+# api.py
+# 🔌 여행 일정 HTTP API (ASGI, 프레임워크 없이) — 파트너 연동용. streamlit 없이 travel_core / export 만 사용
+#  - GET /v1/itinerary[.json|.csv|.md]?mbti=ENFP&days=5&start_date=2026-05-01&dest_count=2&seed=42
+#    (확장자 대신 ?format=json|csv|md 도 가능. 기본 json = export 의 {"columns", "rows"})
+#  - GET /v1/mbti: 유형 목록, GET /healthz, GET /metrics (metrics.py 의 Prometheus 텍스트)
+#  - start_date 를 생략하면 오늘 날짜 (이때 Cache-Control 은 private, 짧은 max-age)
+#  - 응답 캐시: 정규화한 파라미터의 trip_id(+형식) 키로 LRU (같은 일정이면 앱의 공유 링크 id 와도 같다)
+#    동시에 들어온 같은 요청은 한 번만 만든다. ETag = trip_id → If-None-Match 면 304
+#  - 일정 생성/렌더링(CPU 작업)은 크기가 정해진 스레드 풀에서. 대기열이 꽉 차면 503 + Retry-After
+#    (이벤트 루프는 요청 파싱과 캐시 적중 응답만 처리)
+# 실행: uvicorn api:app --port 8000  (또는 python api.py)
+# API_WORKERS / API_MAX_PENDING / API_CACHE_SIZE 환경변수로 풀 크기, 대기열 길이, 캐시 크기를 바꾼다.
+# ---------------------------------------------------------------
+
+import asyncio
+import codecs
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import parse_qsl
+
+import export
+import metrics
+from itinerary_store import normalize_params, trip_id
+from lru import LRUCache
+from route import plan_route
+from travel_core import DATA, generate_itinerary, sample_destinations, trip_rng
+
+WORKERS = int(os.environ.get("API_WORKERS", str(min(8, os.cpu_count() or 1))))
+MAX_PENDING = int(os.environ.get("API_MAX_PENDING", "64"))
+CACHE_SIZE = int(os.environ.get("API_CACHE_SIZE", "4096"))
+MAX_DAYS = 60
+MAX_DEST_COUNT = 3
+DEFAULTS = {"days": "5", "dest_count": "2", "seed": "42"}
+
+API_FORMATS = {"json": "application/json", "csv": "text/csv", "md": "text/markdown"}
+_REBUILD = object()  # 만들던 요청이 취소됐을 때 기다리던 쪽에 주는 값 → 취소 대신 다시 만들기
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_params(query):
+    """쿼리 dict → 정규화한 일정 파라미터 (잘못된 값이면 BadRequest)."""
+    q = {**DEFAULTS, **query}
+    if "mbti" not in q:
+        raise BadRequest("mbti 는 필수입니다")
+    try:
+        p = normalize_params(q["mbti"], q["days"], q.get("start_date") or date.today(),
+                             q["dest_count"], q["seed"])
+        # 20260501 과 2026-05-01 이 같은 trip_id/ETag/캐시 키가 되도록 표준 형식으로
+        p["start_date"] = date.fromisoformat(p["start_date"]).isoformat()
+    except ValueError as e:
+        raise BadRequest(f"잘못된 값: {e}") from None
+    if p["mbti"] not in DATA:
+        raise BadRequest(f"알 수 없는 MBTI: {p['mbti']}")
+    if not 1 <= p["days"] <= MAX_DAYS:
+        raise BadRequest(f"days 는 1~{MAX_DAYS}")
+    if not 1 <= p["dest_count"] <= MAX_DEST_COUNT:
+        raise BadRequest(f"dest_count 는 1~{MAX_DEST_COUNT}")
+    if p["seed"] < 0:
+        raise BadRequest("seed 는 0 이상")
+    return p
+
+
+def build_itinerary(p):
+    # main.py 와 같은 순서: trip_rng(mbti, seed) → 도시 고르기 → 경로 → 일정 (같은 파라미터면 같은 결과)
+    with metrics.span("api.generate"):
+        rng = trip_rng(p["mbti"], p["seed"])
+        route = plan_route(sample_destinations(p["mbti"], p["dest_count"], rng))
+        return generate_itinerary(p["mbti"], p["days"], date.fromisoformat(p["start_date"]),
+                                  list(route.destinations), rng)
+
+
+def render_itinerary(p, fmt):
+    df = build_itinerary(p)
+    body = export.render(df, fmt)
+    if fmt == "csv":
+        body = body.removeprefix(codecs.BOM_UTF8)  # 엑셀용 BOM 은 API 응답에는 빼고
+    return body
+
+
+def _response(status, body, content_type="application/json", extra=()):
+    if isinstance(body, (dict, list)):
+        body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    headers = [(b"content-type", f"{content_type}; charset=utf-8".encode()),
+               (b"content-length", str(len(body)).encode())]
+    return status, headers + [(k.encode(), v.encode()) for k, v in extra], body
+
+
+class ItineraryAPI:
+    def __init__(self, workers=WORKERS, max_pending=MAX_PENDING, cache_size=CACHE_SIZE):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.cache = LRUCache(maxsize=cache_size)
+        self.stats = {"requests": 0, "built": 0, "coalesced": 0, "rejected": 0, "not_modified": 0}
+        self._pool = None
+        self._inflight = {}   # 만드는 중인 키 → asyncio.Future (같은 요청은 기다렸다 같이 받는다)
+        self._pending = 0
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="api-worker")
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _cached(self, key, build):
+        while True:
+            body = self.cache.get(key)
+            if body is not None:
+                return body
+            fut = self._inflight.get(key)
+            if fut is None:
+                break
+            self.stats["coalesced"] += 1
+            body = await asyncio.shield(fut)
+            if body is not _REBUILD:
+                return body
+        if self._pending >= self.max_pending:
+            return None
+        loop = asyncio.get_running_loop()
+        fut = self._inflight[key] = loop.create_future()
+        self._pending += 1
+        try:
+            body = await loop.run_in_executor(self.pool, build)
+            self.cache.put(key, body)
+            self.stats["built"] += 1
+            fut.set_result(body)
+            return body
+        except asyncio.CancelledError:
+            # 클라이언트가 끊긴 건 이 요청만의 일 → 기다리던 요청은 취소하지 않고 처음부터 다시 (하나가 새로 만든다)
+            fut.set_result(_REBUILD)
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # 기다리는 쪽이 없어도 경고가 남지 않도록
+            raise
+        finally:
+            self._pending -= 1
+            del self._inflight[key]
+
+    async def handle(self, method, path, query, headers):
+        self.stats["requests"] += 1
+        if method not in ("GET", "HEAD"):
+            return _response(405, {"error": "GET 만 지원합니다"}, extra=[("allow", "GET, HEAD")])
+        if path == "/healthz":
+            return _response(200, {"ok": True, "cache": self.cache.stats(), **self.stats})
+        if path == "/metrics":
+            return _response(200, metrics.render_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+        if path == "/v1/mbti":
+            return _response(200, [{"mbti": k, "style": v["style"], "description": v["description"]}
+                                   for k, v in sorted(DATA.items())])
+        base, _, ext = path.partition(".")
+        if base != "/v1/itinerary":
+            return _response(404, {"error": f"없는 경로: {path}"})
+        fmt = ext or query.get("format", "json")
+        if fmt not in API_FORMATS:
+            return _response(400, {"error": f"format 은 {', '.join(API_FORMATS)} 중 하나"})
+        try:
+            p = parse_params(query)
+        except BadRequest as e:
+            return _response(400, {"error": str(e)})
+
+        tid = trip_id(**p)
+        etag = f'"{tid}-{fmt}"'
+        # start_date 를 안 주면 오늘 날짜 → 자정이 지나면 바뀌므로 공유 캐시에 오래 두지 않는다
+        cache_control = "public, max-age=86400" if query.get("start_date") else "private, max-age=60"
+        extra = [("etag", etag), ("x-trip-id", tid), ("cache-control", cache_control)]
+        if headers.get("if-none-match") == etag:
+            self.stats["not_modified"] += 1
+            status, hdrs, _ = _response(304, b"", API_FORMATS[fmt], extra)
+            return status, [h for h in hdrs if h[0] != b"content-length"], b""
+        body = await self._cached((tid, fmt), lambda: render_itinerary(p, fmt))
+        if body is None:
+            self.stats["rejected"] += 1
+            return _response(503, {"error": "요청이 많습니다. 잠시 후 다시 시도하세요"}, extra=[("retry-after", "1")])
+        return _response(200, body, API_FORMATS[fmt], extra)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                msg = await receive()
+                if msg["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif msg["type"] == "lifespan.shutdown":
+                    self.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", ())}
+        with metrics.span("api.request"):
+            try:
+                status, hdrs, body = await self.handle(scope["method"], scope["path"], query, headers)
+            except Exception as e:  # 예상 못 한 오류도 JSON 500 으로
+                status, hdrs, body = _response(500, {"error": type(e).__name__})
+        await send({"type": "http.response.start", "status": status, "headers": hdrs})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+app = ItineraryAPI()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    ap = argparse.ArgumentParser(description="여행 일정 HTTP API")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    args = ap.parse_args()
+    uvicorn.run("api:app", host=args.host, port=args.port, log_level="warning")
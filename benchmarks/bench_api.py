@@ -0,0 +1,145 @@
+# bench_api.py
+# 🔌 일정 HTTP API (api.py) 부하 벤치마크 — uvicorn 을 별도 프로세스로 띄우고 로컬에서 요청
+#  - 클라이언트: asyncio 연결 --concurrency 개, 각각 keep-alive 로 요청을 연달아 보냄 (HTTP/1.1 직접 구현)
+#  - 시나리오
+#      hot   : 인기 일정 20개 × 형식 3개만 반복 (거의 전부 캐시 적중)
+#      cold  : 매 요청 새 시드 (전부 생성 → 스레드 풀 + 대기열 한도)
+#      mixed : 80% hot / 20% cold
+#  - 시나리오별 req/s, p50/p99 지연, 상태 코드 분포(503 = 대기열 초과)
+# 사용법:
+#   python benchmarks/bench_api.py
+#   python benchmarks/bench_api.py --concurrency 64 --duration 10 --workers 4
+# ---------------------------------------------------------------
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from travel_core import DATA  # noqa: E402
+
+TYPES = sorted(DATA)
+FORMATS = ("json", "csv", "md")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, workers, max_pending):
+    env = dict(os.environ, API_WORKERS=str(workers), API_MAX_PENDING=str(max_pending))
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "api:app", "--port", str(port),
+                             "--log-level", "warning", "--no-access-log"], cwd=ROOT, env=env)
+    for _ in range(200):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("uvicorn 이 뜨지 않았습니다")
+
+
+def hot_path(rng):
+    i = rng.randrange(20)
+    return (f"/v1/itinerary.{FORMATS[i % 3]}?mbti={TYPES[i % len(TYPES)]}&days={3 + i % 5}"
+            f"&start_date=2026-07-01&seed={i}")
+
+
+def cold_path(rng, counter=itertools.count(1000)):
+    return (f"/v1/itinerary.{rng.choice(FORMATS)}?mbti={rng.choice(TYPES)}&days={rng.randint(3, 10)}"
+            f"&start_date=2026-07-01&dest_count={rng.randint(1, 3)}&seed={next(counter)}")
+
+
+SCENARIOS = {
+    "hot": hot_path,
+    "cold": cold_path,
+    "mixed": lambda rng: hot_path(rng) if rng.random() < 0.8 else cold_path(rng),
+}
+
+
+async def request(reader, writer, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    length = next((int(line.split(":", 1)[1]) for line in lines[1:]
+                  if line.lower().startswith("content-length:")), 0)
+    await reader.readexactly(length)
+    return status, length
+
+
+async def client(port, make_path, seed, deadline, lat, statuses, nbytes):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        status, length = await request(reader, writer, make_path(rng))
+        lat.append((time.perf_counter() - t0) * 1000)
+        statuses[status] += 1
+        nbytes[0] += length
+    writer.close()
+
+
+async def run(port, scenario, concurrency, duration):
+    lat, statuses, nbytes = [], Counter(), [0]
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+    await asyncio.gather(*(client(port, SCENARIOS[scenario], i, deadline, lat, statuses, nbytes)
+                           for i in range(concurrency)))
+    return lat, statuses, nbytes[0], time.perf_counter() - t0
+
+
+async def healthz(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /healthz HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n")
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b"\r\n\r\n", 1)[1])
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--duration", type=float, default=5.0)
+    ap.add_argument("--workers", type=int, default=4, help="API 스레드 풀 크기")
+    ap.add_argument("--max-pending", type=int, default=64)
+    ap.add_argument("--scenarios", nargs="*", default=list(SCENARIOS))
+    args = ap.parse_args()
+
+    port = free_port()
+    proc = start_server(port, args.workers, args.max_pending)
+    try:
+        asyncio.run(run(port, "hot", 4, 0.5))  # 워밍업 (import, 인기 일정 캐시 채우기)
+        print(f"연결 {args.concurrency}개, 시나리오당 {args.duration:.0f}s, 풀 {args.workers}, 대기열 {args.max_pending}")
+        print(f"{'시나리오':<8} {'req/s':>9} {'p50':>9} {'p99':>9} {'최대':>9} {'MB/s':>7}  상태")
+        for name in args.scenarios:
+            lat, statuses, nbytes, secs = asyncio.run(run(port, name, args.concurrency, args.duration))
+            q = statistics.quantiles(lat, n=100, method="inclusive")
+            print(f"{name:<8} {len(lat) / secs:9.0f} {q[49]:7.2f}ms {q[98]:7.2f}ms {max(lat):7.1f}ms "
+                  f"{nbytes / secs / 1e6:7.2f}  {dict(sorted(statuses.items()))}")
+        h = asyncio.run(healthz(port))
+        print(f"서버: 생성 {h['built']}회, 합쳐진 동시 요청 {h['coalesced']}, 거절 {h['rejected']}, "
+              f"캐시 적중률 {h['cache']['hit_rate']:.0%}")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# bench_cards.py
+# 📚 test.py 카드 렌더링: 책마다 st.markdown (이전) vs 조합별 HTML 블록 하나 (지금)
+#  - 등급당 책 수를 늘려가며 재실행 한 번의 요소 개수, 직렬화 크기(bytes), p50 시간
+#  - 요소 크기는 bench_rerun.element_bytes 와 같은 방식 (= 브라우저로 나가는 delta 의 근사치)
+# 사용법:
+#   python benchmarks/bench_cards.py
+#   python benchmarks/bench_cards.py --books 3 100 500 --reruns 10
+# ---------------------------------------------------------------
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_rerun import element_bytes  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from cards import cards_block  # noqa: E402
+
+
+def synthetic_books(n):
+    return [{"책": f"문제집 {i:04d} 개념+기출", "설명": f"{i}번째 책: 개념 정리와 단계별 문제 풀이.",
+             "링크": f"https://search.shopping.naver.com/search/all?query=문제집+{i}"} for i in range(n)]
+
+
+def legacy_page(items):
+    # 이전 test.py: CSS 를 따로 한 번 + 책마다 st.markdown 하나
+    import streamlit as st
+
+    from cards import CARD_CSS
+
+    st.markdown(CARD_CSS, unsafe_allow_html=True)
+    for item in items:
+        st.markdown(f"""
+        <div class="card">
+            <h3>📚 {item['책']}</h3>
+            <p>{item['설명']}</p>
+            <a class="btn-link" href="{item['링크']}" target="_blank">🔗 구매하러 가기</a>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def block_page(block):
+    # 지금 test.py: 미리 만든 블록(CSS 포함) 하나
+    import streamlit as st
+
+    st.markdown(block, unsafe_allow_html=True)
+
+
+def count_elements(node):
+    children = getattr(node, "children", None)
+    if isinstance(children, dict) and children:
+        return sum(count_elements(c) for c in children.values())
+    return 1
+
+
+def measure(page, arg, reruns):
+    at = AppTest.from_function(page, args=(arg,), default_timeout=120)
+    at.run()
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t0) * 1000)
+    return count_elements(at.main), element_bytes(at.main), statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--books", type=int, nargs="*", default=[3, 50, 200, 500], help="등급당 책 수")
+    ap.add_argument("--reruns", type=int, default=10)
+    args = ap.parse_args()
+
+    print(f"{'책 수':>6} | {'요소(이전)':>10} {'bytes':>10} {'p50':>9} | {'요소(지금)':>10} {'bytes':>10} {'p50':>9}")
+    for n in args.books:
+        items = synthetic_books(n)
+        old = measure(legacy_page, items, args.reruns)
+        new = measure(block_page, cards_block(items), args.reruns)
+        print(f"{n:>6} | {old[0]:>10} {old[1]:>10,} {old[2]:7.1f}ms | {new[0]:>10} {new[1]:>10,} {new[2]:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# bench_catalog.py
+# 📚 카탈로그 로드 시간/메모리: 10만 목적지 합성 데이터로 측정
+#  - catalog.load_catalog (중복 제거 + intern + 인덱스)
+#  - 비교용: 예전 방식처럼 유형별로 (도시, 나라, 위도, 경도) 튜플을 중복 보관한 dict (같은 조건으로 파일에서 읽기)
+# 사용법: python benchmarks/bench_catalog.py [--n 100000]
+# ---------------------------------------------------------------
+
+import argparse
+import gc
+import importlib
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from catalog import load_catalog  # noqa: E402
+from travel_core import DATA  # noqa: E402
+
+
+def synth_catalog(n, seed=0):
+    # 기존 16유형 프로필을 유지하고, 목적지 n개를 유형 1~3개에 나눠 배정
+    rnd = random.Random(seed)
+    countries = [f"나라{i}" for i in range(200)]
+    dests = [{"city": f"도시{i}", "country": rnd.choice(countries),
+              "lat": round(rnd.uniform(-60, 70), 4), "lon": round(rnd.uniform(-180, 180), 4)}
+             for i in range(n)]
+    types = {t: {"style": v["style"], "description": v["description"],
+                 "activities": v["activities"], "destinations": []} for t, v in DATA.items()}
+    names = list(types)
+    for i in range(n):
+        for t in rnd.sample(names, rnd.randint(1, 3)):
+            types[t]["destinations"].append(i)
+    return {"destinations": dests, "types": types}
+
+
+def legacy_json(raw):
+    # 예전 DATA 모양: 유형마다 (도시, 나라, 위도, 경도)를 인라인으로 중복 보관
+    return json.dumps({t: dict(info, destinations=[
+        [raw["destinations"][i][k] for k in ("city", "country", "lat", "lon")] for i in info["destinations"]])
+        for t, info in raw["types"].items()}, ensure_ascii=False)
+
+
+def load_legacy(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    for info in data.values():
+        info["destinations"] = [tuple(d) for d in info["destinations"]]
+    return data
+
+
+def measure(fn):
+    # 시간은 tracemalloc 없이, 유지 메모리는 tracemalloc 으로 따로 잰다
+    gc.collect()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    tracemalloc.start()
+    obj = fn()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, elapsed, size / 2**20
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100_000)
+    args = ap.parse_args()
+
+    raw = synth_catalog(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalog.json"
+        path.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+        print(f"목적지 {args.n:,}개 · 파일 {path.stat().st_size / 2**20:.1f}MB")
+
+        # catalog 는 lat/lon 을 처음 쓸 때 numpy 를 import 한다 → import 시간은 측정에서 빼려고 미리 로드
+        importlib.import_module("numpy")
+
+        _, t_json, _ = measure(lambda: json.loads(path.read_text(encoding="utf-8")))
+        cat, t_load, mb_cat = measure(lambda: load_catalog(path))
+        print(f"load_catalog       : {t_load * 1000:8.1f}ms  {mb_cat:7.1f}MB 유지  (그중 JSON 파싱 {t_json * 1000:.1f}ms)")
+        t0 = time.perf_counter()
+        cat.lat, cat.lon
+        print(f"  + lat/lon 컬럼   : {(time.perf_counter() - t0) * 1000:8.1f}ms  "
+              f"{(cat.lat.nbytes + cat.lon.nbytes) / 2**20:7.1f}MB")
+
+        # 예전 형식도 같은 조건(파일에서 읽기)으로. 인덱스는 만들지 않는다
+        legacy = Path(tmp) / "legacy.json"
+        legacy.write_text(legacy_json(raw), encoding="utf-8")
+        _, t_legacy, mb_legacy = measure(lambda: load_legacy(legacy))
+        print(f"중복 튜플 dict     : {t_legacy * 1000:8.1f}ms  {mb_legacy:7.1f}MB 유지  "
+              f"(파일 {legacy.stat().st_size / 2**20:.1f}MB, 인덱스 없음)")
+
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        cat.for_mbti("ENFP")
+        cat.in_country("나라7")
+        cat.find_city("도시123")
+    print(f"인덱스 조회(MBTI+나라+도시): {(time.perf_counter() - t0) * 1000:.3f}µs/회")
+
+
+if __name__ == "__main__":
+    main()
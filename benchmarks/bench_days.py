@@ -0,0 +1,92 @@
+# bench_days.py
+# 🗓 일수 슬라이더 한 칸당 일정 갱신 비용 — 매번 새로 생성 vs 세션의 DayTable 재사용 (travel_core.py)
+#  - 3일 → --max-days 까지 한 칸씩 늘렸다가 다시 줄이면서, 단계마다
+#      full : generate_itinerary (모든 날짜를 다시 뽑고 문자열 생성)
+#      incr : DayTable.ensure (새 날짜만 뽑기) + frame (표 조립)
+#      뽑기 : 그중 ensure 만 — 단계당 새로 뽑는 날짜 수는 늘릴 때 1, 줄일 때 0
+#  - 시작일만 바꿨을 때 (활동은 그대로, 일자 열만 다시 계산)
+#  - 구간별(짧은/중간/긴 일정) 단계당 p50 으로 일수에 따라 얼마나 커지는지 비교
+#  - 같은 입력이면 두 방식의 결과가 완전히 같고, 늘려도 앞 날짜가 바뀌지 않는지 확인
+# 사용법:
+#   python benchmarks/bench_days.py
+#   python benchmarks/bench_days.py --max-days 365 --mbti INTJ
+# ---------------------------------------------------------------
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from route import plan_route  # noqa: E402
+from travel_core import DayTable, generate_itinerary, sample_destinations, trip_rng  # noqa: E402
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mbti", default="ENFP")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--max-days", type=int, default=60)
+    ap.add_argument("--repeat", type=int, default=5, help="같은 단계를 몇 번 재서 최솟값을 쓸지")
+    args = ap.parse_args()
+
+    start = date(2026, 5, 1)
+    dests = list(plan_route(sample_destinations(args.mbti, 3, trip_rng(args.mbti, args.seed))).destinations)
+    steps = list(range(3, args.max_days + 1)) + list(range(args.max_days - 1, 2, -1))
+
+    table = DayTable(args.mbti, trip_rng(args.mbti, args.seed))
+    prev = None
+    rows = []  # (일수, full µs, incr µs, 뽑기 µs, 새 날짜 수)
+    for days in steps:
+        full = min(timed(lambda: generate_itinerary(args.mbti, days, start, dests,
+                                                    trip_rng(args.mbti, args.seed)))[1]
+                   for _ in range(args.repeat))
+        # ensure 는 처음 한 번만 일을 하므로 첫 측정값을 그대로, frame 은 반복 최솟값
+        new_days, draw = timed(lambda: table.ensure(days))
+        df, frame = timed(lambda: table.frame(days, start, dests))
+        frame = min([frame] + [timed(lambda: table.frame(days, start, dests))[1] for _ in range(args.repeat - 1)])
+        rows.append((days, full, draw + frame, draw, new_days))
+        ref = generate_itinerary(args.mbti, days, start, dests, trip_rng(args.mbti, args.seed))
+        assert df.equals(ref), f"{days}일: 증분 결과가 새로 만든 것과 다릅니다"
+        if prev is not None:
+            n = min(len(prev), days)
+            assert df.iloc[:n, 4:7].equals(prev.iloc[:n, 4:7]), f"{days}일: 앞 날짜 활동이 바뀜"
+        prev = df
+
+    print(f"{args.mbti} seed={args.seed}, 도시 {len(dests)}곳, 3→{args.max_days}→3일 ({len(steps)}단계)")
+    print(f"{'구간':<14} {'full p50':>10} {'incr p50':>10} {'뽑기 p50':>10} {'새 날짜/단계':>12}")
+    third = max(1, args.max_days // 3)
+    for lo, hi in ((3, third), (third + 1, 2 * third), (2 * third + 1, args.max_days)):
+        sel = [r for r in rows if lo <= r[0] <= hi]
+        if not sel:
+            continue
+        print(f"{f'{lo}~{hi}일':<14} {statistics.median(r[1] for r in sel):8.0f}µs "
+              f"{statistics.median(r[2] for r in sel):8.0f}µs {statistics.median(r[3] for r in sel):8.1f}µs "
+              f"{statistics.mean(r[4] for r in sel):12.2f}")
+    print(f"전체 {len(steps)}단계 합: full {sum(r[1] for r in rows) / 1000:.1f}ms, "
+          f"incr {sum(r[2] for r in rows) / 1000:.1f}ms, 뽑은 날짜 합 {sum(r[4] for r in rows)}")
+
+    # 시작일만 바꾸기: 활동은 다시 뽑지 않고 일자 열만
+    days = args.max_days
+    base = table.frame(days, start, dests)
+    shifts = []
+    for k in range(1, 31):
+        before = len(table)
+        df, us = timed(lambda: table.frame(days, start + timedelta(days=k), dests))
+        shifts.append(us)
+        assert len(table) == before and df.drop(columns="일자").equals(base.drop(columns="일자"))
+        assert df["일자"].iloc[0] == (start + timedelta(days=k)).isoformat()
+    print(f"시작일 변경({days}일): p50 {statistics.median(shifts):.0f}µs (새로 뽑은 날짜 0, 활동 동일)")
+
+
+if __name__ == "__main__":
+    main()
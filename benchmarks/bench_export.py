@@ -0,0 +1,72 @@
+# bench_export.py
+# ⬇️ 1,000일 일정 내보내기: 형식별 생성 시간/크기, iterrows Markdown 과 비교, 캐시 적중 시간
+# 사용법: python benchmarks/bench_export.py [--days 1000]
+# ---------------------------------------------------------------
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import export  # noqa: E402
+from route import plan_route  # noqa: E402
+from travel_core import generate_itinerary, sample_destinations, trip_rng  # noqa: E402
+
+
+def markdown_iterrows(df):
+    # 예전 main.py 의 df_to_markdown (비교 기준)
+    lines = ["# 여행 일정표", ""]
+    for _, r in df.iterrows():
+        lines += [
+            f"## {r['일자']} · {r['도시']} ({r['국가']})",
+            f"- {r['아침']}",
+            f"- {r['오후']}",
+            f"- {r['저녁']}",
+            f"- 🍽 {r['식사']}",
+            ""
+        ]
+    return "\n".join(lines)
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=1000)
+    args = ap.parse_args()
+
+    rng = trip_rng("ENFP", 0)
+    dests = list(plan_route(sample_destinations("ENFP", 3, rng)).destinations)
+    df = generate_itinerary("ENFP", args.days, date(2025, 1, 1), dests, rng)
+    print(f"{args.days:,}일 일정")
+
+    old, t_old = timed(lambda: markdown_iterrows(df))
+    new, t_new = timed(lambda: export.df_to_markdown(df))
+    assert old == new
+    print(f"Markdown iterrows   : {t_old:8.1f}ms")
+    print(f"Markdown 컬럼 연산  : {t_new:8.1f}ms  (x{t_old / t_new:.1f})")
+
+    for fmt in export.FORMATS:
+        data, ms = timed(lambda: export.render(df, fmt, "bench"))
+        print(f"{fmt:>4}: {ms:8.1f}ms  {len(data) / 1024:8.1f}KB")
+
+    _, t_hash = timed(lambda: export.itinerary_hash(df))
+    export.export_bytes(df, "zip", "bench")
+    _, t_hit = timed(lambda: export.export_bytes(df, "zip", "bench"))
+    print(f"캐시 적중(zip, 해시 포함): {t_hit:.2f}ms · 해시 {t_hash:.2f}ms")
+    _, t_lazy = timed(lambda: [export.lazy(df, f) for f in export.FORMATS])
+    print(f"재실행마다 드는 비용(lazy 콜백 5개): {t_lazy:.4f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# bench_feeds.py
+# 📰 여행 뉴스 수집 (feeds.py) 벤치마크 — 네트워크 없이 로컬 HTTP 서버(대역)로
+#  - 서버: /feed/<i>.xml (RSS, ETag + Last-Modified, If-None-Match → 304), /article/<i>/<j>.html
+#    요청마다 --latency-ms 만큼 지연 (실제 원격 서버 흉내)
+#  - 1회차(처음): 전부 200 + 본문 추출 / 2회차: 전부 304 / 3회차: 일부 피드에만 새 기사
+#  - 회차별 피드/기사 처리량, 전송 바이트, 조건부 요청 적중률, 도시 연결 수
+#  - --workers 여러 개를 주면 동시 수집 효과 비교
+# 사용법:
+#   python benchmarks/bench_feeds.py
+#   python benchmarks/bench_feeds.py --feeds 100 --items 20 --workers 1 8 32
+# ---------------------------------------------------------------
+
+import argparse
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from feeds import CityMatcher, FeedIngestor, load_config, urllib_fetcher  # noqa: E402
+from travel_core import CATALOG  # noqa: E402
+
+CITIES = [d.city for d in CATALOG.destinations]
+ALIASES = load_config().get("aliases", {})
+
+
+class StandIn:
+    # bump() 로 피드 i 의 버전이 new 만큼 오르면 새 기사 new 개가 앞에 추가된다
+    def __init__(self, n_feeds, items, latency):
+        self.items = items
+        self.latency = latency
+        self.version = [0] * n_feeds
+        self.requests = 0
+
+    def bump(self, feeds, new=3):
+        for i in feeds:
+            self.version[i] += new
+
+    def etag(self, i):
+        return '"' + hashlib.md5(f"{i}:{self.version[i]}".encode()).hexdigest() + '"'
+
+    def feed_xml(self, i, base):
+        top = self.version[i] + self.items
+        entries = []
+        for j in range(top - 1, top - 1 - self.items, -1):
+            city = ALIASES.get(CITIES[(i * 7 + j) % len(CITIES)], ["Seoul"])[0]
+            entries.append(f"<item><title>Weekend in {city}: guide #{j}</title>"
+                           f"<link>{base}/article/{i}/{j}.html</link>"
+                           f"<description>Where to eat and stay in {city}.</description>"
+                           f"<pubDate>{formatdate(1_700_000_000 + j * 3600, usegmt=True)}</pubDate></item>")
+        return (f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {i}</title>'
+                + "".join(entries) + "</channel></rss>").encode()
+
+    def article_html(self, i, j):
+        a, b = CITIES[(i + j) % len(CITIES)], CITIES[(i * 3 + j) % len(CITIES)]
+        para = f"<p>{a}에서 {b}까지 이어지는 여행 코스를 소개합니다. 현지 시장과 골목, 야경 명소까지.</p>" * 12
+        return (f"<html><head><title>{i}/{j}</title></head><body><nav>menu</nav>"
+                f"<article><h1>Story {j}</h1>{para}</article><footer>footer</footer></body></html>").encode()
+
+
+def serve(standin):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            standin.requests += 1
+            time.sleep(standin.latency)
+            parts = self.path.strip("/").split("/")
+            if parts[0] == "feed":
+                i = int(parts[1].split(".")[0])
+                etag = standin.etag(i)
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                body = standin.feed_xml(i, f"http://{self.headers['Host']}")
+                ctype = "application/rss+xml"
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", formatdate(1_700_000_000 + standin.version[i], usegmt=True))
+            else:
+                body = standin.article_html(int(parts[1]), int(parts[2].split(".")[0]))
+                ctype = "text/html; charset=utf-8"
+                self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def report(label, run, ing):
+    secs = run["seconds"]
+    feeds = run["fetched"] + run["not_modified"] + run["failed"]
+    print(f"  {label:<10} {secs * 1000:8.0f}ms  피드 {feeds / secs:7.1f}/s  새 기사 {run['new']:5d} "
+          f"({run['new'] / secs:6.1f}/s)  중복 {run['duplicate']:5d}  304 {run['not_modified']:4d}  "
+          f"피드 {run['bytes'] / 1024:6.0f}KB")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feeds", type=int, default=40)
+    ap.add_argument("--items", type=int, default=15)
+    ap.add_argument("--latency-ms", type=float, default=20.0)
+    ap.add_argument("--workers", type=int, nargs="*", default=[1, 8, 32])
+    args = ap.parse_args()
+
+    matcher = CityMatcher(CITIES, ALIASES)
+    for workers in args.workers:
+        standin = StandIn(args.feeds, args.items, args.latency_ms / 1000)
+        server = serve(standin)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        feeds = [{"name": f"feed {i}", "url": f"{base}/feed/{i}.xml"} for i in range(args.feeds)]
+        ing = FeedIngestor(feeds, matcher, cache_dir=tempfile.mkdtemp(prefix="bench_feeds_"),
+                           fetcher=urllib_fetcher, workers=workers, offline=False)
+        print(f"workers={workers} (피드 {args.feeds}개 × 기사 {args.items}개, 요청당 {args.latency_ms:.0f}ms)")
+        report("처음", ing.run_once(), ing)
+        report("변경 없음", ing.run_once(), ing)
+        standin.bump(range(0, args.feeds, 4))
+        report("1/4 갱신", ing.run_once(), ing)
+        linked = sum(len(v) for v in ing._by_city.values())
+        print(f"  조건부 요청 적중률 {ing.hit_rate():.0%}, 본문 추출 실패 {ing.stats['extract_failed']}, "
+              f"도시 연결 {linked}건 / 도시 {len(ing._by_city)}곳, 서버 요청 {standin.requests}회\n")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
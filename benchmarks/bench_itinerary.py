@@ -0,0 +1,73 @@
+# bench_itinerary.py
+# 📈 배치 일정 엔진 vs 기존 generate_itinerary 처리량(rows/sec) 비교
+# 사용법: python benchmarks/bench_itinerary.py [--seeds 50]
+# ---------------------------------------------------------------
+
+import argparse
+import itertools
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from route import plan_route  # noqa: E402
+from travel_core import (DATA, generate_itinerary, generate_itinerary_batch,  # noqa: E402
+                         sample_destinations, trip_rng)
+
+
+def combos(n_seeds):
+    # MBTI × 일수(3~10) × 도시 수(1~3) × 시드
+    return list(itertools.product(sorted(DATA), range(3, 11), range(1, 4), range(n_seeds)))
+
+
+def run_single(jobs, start):
+    frames = []
+    for mbti, days, k, seed in jobs:
+        rng = trip_rng(mbti, seed)
+        route = plan_route(sample_destinations(mbti, k, rng))
+        frames.append(generate_itinerary(mbti, days, start, list(route.destinations), rng))
+    return frames
+
+
+def run_batch(jobs, start):
+    mbtis, days, ks, seeds = zip(*jobs)
+    return generate_itinerary_batch(mbtis, days, start, seeds, ks)
+
+
+def check_same(jobs, start, n=200):
+    # 같은 시드 → 단일 일정과 배치 결과가 완전히 같아야 함
+    sample = jobs[:n]
+    batch = run_batch(sample, start)
+    for t, single in enumerate(run_single(sample, start)):
+        part = batch[batch["trip"] == t].drop(columns="trip").reset_index(drop=True)
+        if not part.equals(single):
+            raise SystemExit(f"결과 불일치: {sample[t]}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seeds", type=int, default=50)
+    args = ap.parse_args()
+
+    start = date(2025, 1, 1)
+    jobs = combos(args.seeds)
+    rows = sum(j[1] for j in jobs)
+    check_same(jobs, start)
+
+    t0 = time.perf_counter()
+    run_single(jobs, start)
+    single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    run_batch(jobs, start)
+    batch = time.perf_counter() - t0
+
+    print(f"일정 {len(jobs):,}개 / 행 {rows:,}개")
+    print(f"generate_itinerary       : {single:8.3f}s  {rows / single:12,.0f} rows/s")
+    print(f"generate_itinerary_batch : {batch:8.3f}s  {rows / batch:12,.0f} rows/s  (x{single / batch:.1f})")
+
+
+if __name__ == "__main__":
+    main()
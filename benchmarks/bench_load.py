@@ -0,0 +1,152 @@
+# bench_load.py
+# 👥 동시 세션 부하 테스트 (main.py, streamlit.testing.v1.AppTest, 헤드리스)
+#  - 가상 사용자 N명: 각자 AppTest 인스턴스(= 세션) 하나를 들고
+#    생각 시간(지수분포) → 무작위 위젯 조작 → 재실행 을 반복 (closed-loop)
+#  - 처리량(reruns/s), 응답 시간 p50/p95/p99 (대기 포함), 서버 점유율
+#  - tracemalloc 스냅샷 차이로 세션 하나가 붙잡는 메모리 + 상위 할당 위치
+#  - --sweep: N 을 늘려가며 p95 가 --slo 를 넘거나 점유율이 포화되는 지점을 찾는다
+# 주의: AppTest 는 프로세스 전역 Runtime 을 쓰므로 두 세션의 run() 을 동시에 돌릴 수 없다.
+#       그래서 재실행은 잠금으로 한 번에 하나씩 (= 한 서버 프로세스에서 GIL 을 두고
+#       경쟁하는 스크립트 실행과 같은 모양). 대기 시간은 응답 시간에 포함된다.
+# 사용법:
+#   python benchmarks/bench_load.py --sessions 8 --duration 20
+#   python benchmarks/bench_load.py --sweep 1 2 4 8 16 32 --slo 500
+# ---------------------------------------------------------------
+
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# bench_rerun 이 임시 DB/이미지 캐시 + 오프라인 환경변수를 먼저 잡아준다
+from bench_rerun import ROOT, SCENARIOS, submit  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ACTIONS = [name for name in SCENARIOS if name.startswith("main.")]
+
+
+class Session:
+    def __init__(self, seed):
+        self.at = AppTest.from_file(str(ROOT / "main.py"), default_timeout=120)
+        self.rng = random.Random(seed)
+
+    def step(self):
+        name = self.rng.choice(ACTIONS)
+        SCENARIOS[name][2](self.at, self.rng.randrange(1000))
+        submit(self.at)
+
+
+def _percentile(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))] if xs else 0.0
+
+
+def session_memory(n):
+    # 공유 캐시(지도/카탈로그/저장소)는 첫 세션에서 채워지므로 따로 하나 돌려 제외하고,
+    # 그 뒤 n개 세션을 만들어 한 번씩 실행한 차이를 n 으로 나눈다
+    Session(-1).at.run()
+    tracemalloc.start(1)
+    before = tracemalloc.take_snapshot()
+    sessions = [Session(i) for i in range(n)]
+    for s in sessions:
+        s.at.run()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    total = sum(s.size_diff for s in stats)
+    top = [(s.traceback[0].filename, s.size_diff / n) for s in stats[:5]]
+    return total / n, top, sessions
+
+
+def run_load(n, duration, think, seed=0):
+    sessions = [Session(seed * 1000 + i) for i in range(n)]
+    lock = threading.Lock()
+    for s in sessions:
+        s.at.run()  # 첫 화면은 측정에서 제외
+
+    latencies, busy = [], [0.0]
+    deadline = time.perf_counter() + duration
+
+    def user(s):
+        mine = []
+        while True:
+            time.sleep(s.rng.expovariate(1 / think) if think > 0 else 0)
+            if time.perf_counter() >= deadline:
+                return mine
+            t_req = time.perf_counter()
+            with lock:
+                t0 = time.perf_counter()
+                s.step()
+                s.at.run()
+                busy[0] += time.perf_counter() - t0
+            if s.at.exception:
+                raise RuntimeError(f"스크립트 예외: {s.at.exception}")
+            mine.append((time.perf_counter() - t_req) * 1000)
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as ex:
+        for mine in ex.map(user, sessions):
+            latencies.extend(mine)
+    wall = time.perf_counter() - t_start
+    return {
+        "sessions": n,
+        "reruns": len(latencies),
+        "rps": len(latencies) / wall,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "util": busy[0] / wall,
+    }
+
+
+def print_row(r):
+    print(f"{r['sessions']:>4} {r['reruns']:>7} {r['rps']:8.1f}/s {r['p50_ms']:8.1f}ms "
+          f"{r['p95_ms']:8.1f}ms {r['p99_ms']:8.1f}ms {r['util']:6.0%}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=8)
+    ap.add_argument("--duration", type=float, default=15.0, help="단계마다 측정 시간(초)")
+    ap.add_argument("--think", type=float, default=1.0, help="평균 생각 시간(초, 0 이면 쉬지 않음)")
+    ap.add_argument("--sweep", type=int, nargs="*", help="세션 수 목록 (예: 1 2 4 8 16 32)")
+    ap.add_argument("--slo", type=float, default=500.0, help="p95 응답 시간 목표(ms)")
+    ap.add_argument("--mem-sessions", type=int, default=8, help="메모리 측정에 쓸 세션 수 (0 이면 생략)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    if args.mem_sessions:
+        per, top, _ = session_memory(args.mem_sessions)
+        print(f"세션당 메모리 ≈ {per / 1024:,.0f} KB (tracemalloc, {args.mem_sessions}세션 평균)")
+        for filename, size in top:
+            print(f"  {size / 1024:8,.1f} KB  {filename}")
+        print()
+
+    print(f"{'세션':>4} {'재실행':>7} {'처리량':>10} {'p50':>10} {'p95':>10} {'p99':>10} {'점유율':>6}")
+    if not args.sweep:
+        print_row(run_load(args.sessions, args.duration, args.think, args.seed))
+        return
+
+    saturated = None
+    for n in args.sweep:
+        r = run_load(n, args.duration, args.think, args.seed)
+        print_row(r)
+        if r["p95_ms"] > args.slo or r["util"] > 0.9:
+            saturated = r
+            break
+    if saturated:
+        print(f"\n포화: 세션 {saturated['sessions']}개에서 p95 {saturated['p95_ms']:.0f}ms "
+              f"(목표 {args.slo:.0f}ms), 점유율 {saturated['util']:.0%}")
+    else:
+        print(f"\n세션 {args.sweep[-1]}개까지 p95 목표({args.slo:.0f}ms) 안에서 처리")
+
+
+if __name__ == "__main__":
+    main()
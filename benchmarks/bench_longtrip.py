@@ -0,0 +1,107 @@
+# bench_longtrip.py
+# 🧳 장기 여행 모드 벤치마크 — 일수가 늘어도 화면/요약/다운로드 비용이 평평한지
+#  일수별로 (기존 방식 = 전체 DataFrame 한 번에) vs (장기 여행 모드 = 조각/페이지):
+#   - 표: 전체 생성 + st.dataframe 로 보낼 Arrow 바이트  vs  한 페이지(14일)만
+#   - 요약: 전체 DataFrame groupby  vs  TripSummary 에 조각(CHUNK_DAYS)씩 누적
+#   - 다운로드(CSV/ICS): export.render(전체)  vs  export.iter_stream(조각) 을 파일로 바로 쓰기
+#     → 시간과 tracemalloc 최대 메모리 (스트리밍은 한 번에 한 조각만)
+# 사용법:
+#   python benchmarks/bench_longtrip.py
+#   python benchmarks/bench_longtrip.py --days 90 365 3650
+# ---------------------------------------------------------------
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import export  # noqa: E402
+from route import plan_route  # noqa: E402
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes  # noqa: E402
+from travel_core import DayTable, TripSummary, generate_itinerary, sample_destinations, trip_rng  # noqa: E402
+
+PAGE_DAYS = 14
+START = date(2026, 5, 1)
+
+
+def measure(fn, repeat=3):
+    # (결과, 최소 ms, 최대 메모리 KB) — 메모리는 따로 한 번 더 돌려서 (tracemalloc 이 시간을 늘리므로)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, best * 1000, peak / 1024
+
+
+def to_file(chunks, path):
+    with open(path, "wb") as f:
+        for part in chunks:
+            f.write(part)
+    return os.path.getsize(path)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, nargs="*", default=[10, 90, 180, 365])
+    ap.add_argument("--mbti", default="ENFP")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    rng = trip_rng(args.mbti, args.seed)
+    dests = list(plan_route(sample_destinations(args.mbti, 3, rng)).destinations)
+    out = os.path.join(tempfile.mkdtemp(prefix="bench_longtrip_"), "trip")
+    print(f"{args.mbti} seed={args.seed}, 도시 {len(dests)}곳, 페이지 {PAGE_DAYS}일")
+    print(f"{'일수':>6} | {'전체 표':>9} {'Arrow':>8} | {'페이지':>8} {'Arrow':>7} | {'요약 전체':>9} {'누적':>8} | "
+          f"{'CSV 전체':>17} {'CSV 스트림':>17} | {'ICS 전체':>17} {'ICS 스트림':>17}")
+    for days in args.days:
+        def full_df():
+            return generate_itinerary(args.mbti, days, START, dests, rng)
+
+        def page():
+            table = DayTable(args.mbti, rng)  # 새 세션: 마지막 페이지까지 뽑아야 하는 최악의 경우
+            lo = (days - 1) // PAGE_DAYS * PAGE_DAYS
+            return table.frame(days, START, dests, lo, lo + PAGE_DAYS)
+
+        df, full_ms, _ = measure(full_df)
+        full_arrow = len(convert_pandas_df_to_arrow_bytes(df))
+        pg, page_ms, _ = measure(page)
+        page_arrow = len(convert_pandas_df_to_arrow_bytes(pg))
+
+        def summary_full():
+            d = full_df()
+            return d.groupby(d.index // 7).agg(기간=("일자", "first"), 도시=("도시", "unique")), d.groupby("도시").size()
+
+        def summary_incr():
+            s = TripSummary()
+            for chunk in DayTable(args.mbti, rng).chunks(days, START, dests):
+                s.add(chunk)
+            return s.week_table(), s.city_table()
+
+        _, sfull_ms, _ = measure(summary_full)
+        (weeks, cities), sincr_ms, _ = measure(summary_incr)
+        assert len(weeks) == -(-days // 7) and cities["일수"].sum() == days
+
+        cells = []
+        for fmt in ("csv", "ics"):
+            _, a_ms, a_kb = measure(lambda: to_file([export.render(full_df(), fmt)], out))
+            size, b_ms, b_kb = measure(lambda: to_file(
+                export.iter_stream(DayTable(args.mbti, rng).chunks(days, START, dests), fmt, "bench"), out))
+            cells.append(f"{a_ms:6.1f}ms {a_kb:7.0f}KB {b_ms:6.1f}ms {b_kb:7.0f}KB")
+        print(f"{days:>6} | {full_ms:7.1f}ms {full_arrow / 1024:6.0f}KB | {page_ms:6.2f}ms {page_arrow / 1024:5.1f}KB | "
+              f"{sfull_ms:7.1f}ms {sincr_ms:6.1f}ms | " + " | ".join(cells))
+    print("(메모리 = tracemalloc 최대치. 스트림은 파일에 조각을 바로 써서 일정 전체 바이트를 들고 있지 않음)")
+
+
+if __name__ == "__main__":
+    main()
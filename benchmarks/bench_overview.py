@@ -0,0 +1,107 @@
+# bench_overview.py
+# 🗺 전체 여행지 지도 (maps.py overview) 벤치마크 — 점이 많아질 때 만드는 시간과 브라우저로 보내는 크기
+#  - 합성 점: 실제 카탈로그 목적지 주변에 흩뿌린 --points 개 (유형 번호는 무작위)
+#  - folium: 기존 방식 (점마다 folium.Marker) vs FastMarkerCluster — 생성+HTML 렌더링 시간, HTML 크기
+#  - pydeck: 기존 방식 (dict 목록 ScatterplotLayer) vs 격자로 합친 heatmap / hexagon
+#      — 생성+to_json (st.pydeck_chart 가 보내는 그대로) 시간, JSON 크기, 최종 격자 크기
+#  - 기존 방식은 --baseline-max 개까지만 (10만 개 마커는 너무 느려서)
+# 사용법:
+#   python benchmarks/bench_overview.py
+#   python benchmarks/bench_overview.py --points 1000 10000 100000 --cell-deg 1.0
+# ---------------------------------------------------------------
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import maps  # noqa: E402
+from catalog import get_catalog  # noqa: E402
+
+
+def synthetic_points(n, seed=0):
+    # 실제 목적지 주변 (표준편차 3도) — 도시 근처에 몰린 실제 분포와 비슷하게
+    cat = get_catalog()
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, len(cat), n)
+    lat = np.clip(cat.lat[base] + rng.normal(0, 3, n), -85, 85).astype(np.float32)
+    lon = ((cat.lon[base] + rng.normal(0, 3, n) + 180) % 360 - 180).astype(np.float32)
+    types = tuple(sorted(cat.types))
+    return lat, lon, rng.integers(0, len(types), n).astype(np.uint8), types
+
+
+def folium_markers(lat, lon, code, types):
+    # 기존 build_map_folium 방식: 점마다 Marker 객체
+    import folium
+
+    fmap = folium.Map(location=[30, 20], zoom_start=2, tiles="CartoDB positron")
+    for la, lo, c in zip(lat.tolist(), lon.tolist(), code.tolist()):
+        folium.Marker([la, lo], tooltip=types[c]).add_to(fmap)
+    return fmap
+
+
+def pydeck_records(lat, lon, code, types):
+    # 기존 build_map_pydeck 방식: dict 목록 ScatterplotLayer
+    import pydeck as pdk
+
+    points = [{"lat": la, "lon": lo, "name": types[c]} for la, lo, c in zip(lat.tolist(), lon.tolist(), code.tolist())]
+    layer = pdk.Layer("ScatterplotLayer", data=points, get_position="[lon, lat]", get_radius=40000, pickable=True)
+    return pdk.Deck(layers=[layer], initial_view_state=pdk.ViewState(latitude=30, longitude=20, zoom=1))
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def cell(ms, size):
+    return f"{ms:8.0f}ms {size / 2**20:7.2f}MB"
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--points", type=int, nargs="*", default=[1000, 10000, 100000])
+    ap.add_argument("--cell-deg", type=float, default=maps.OVERVIEW_CELL_DEG)
+    ap.add_argument("--max-cells", type=int, default=maps.OVERVIEW_MAX_CELLS)
+    ap.add_argument("--baseline-max", type=int, default=10000)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")  # CartoDB 타일 API 키 경고
+
+    skip = f"{'-':>10} {'-':>9}"
+    print(f"격자 {args.cell_deg}도부터 (칸 {args.max_cells:,}개 이하가 될 때까지 두 배), 시간 = 생성 + 직렬화 (HTML / deck JSON)")
+    print(f"{'점 수':>8} | {'folium 마커':>19} {'FastMarkerCluster':>19} | "
+          f"{'pydeck dict':>19} {'heatmap':>19} {'hexagon':>19} {'격자':>6}")
+    for n in args.points:
+        pts = synthetic_points(n)
+        row = []
+        if n <= args.baseline_max:
+            html, ms = timed(lambda: folium_markers(*pts).get_root().render())
+            row.append(cell(ms, len(html)))
+        else:
+            row.append(skip)
+        html, ms = timed(lambda: maps.build_overview_folium(*pts).get_root().render())
+        row.append(cell(ms, len(html)))
+        if n <= args.baseline_max:
+            spec, ms = timed(lambda: pydeck_records(*pts).to_json())
+            row.append(cell(ms, len(spec)))
+        else:
+            row.append(skip)
+        for style in maps.OVERVIEW_STYLES:
+            spec, ms = timed(lambda: maps.build_overview_pydeck(*pts, style=style, cell_deg=args.cell_deg,
+                                                                  max_cells=args.max_cells).to_json())
+            row.append(cell(ms, len(spec)))
+        deg = args.cell_deg
+        while len(maps.aggregate_cells(*pts[:3], cell_deg=deg)) > args.max_cells:
+            deg *= 2
+        print(f"{n:>8,} | {row[0]} {row[1]} | {row[2]} {row[3]} {row[4]} {deg:5g}도")
+    print("(folium 은 점마다 한 행이 그대로 HTML 에 — 묶기는 브라우저에서. pydeck 은 칸 수(≤ 최대 칸)에 비례)")
+
+
+if __name__ == "__main__":
+    main()
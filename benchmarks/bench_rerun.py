@@ -0,0 +1,238 @@
+# bench_rerun.py
+# ⏱ main.py / test.py 재실행(rerun) 지연 벤치마크 (streamlit.testing.v1.AppTest, 헤드리스)
+#  - 시나리오마다 위젯 값을 바꿔가며 N번 재실행 → p50/p95 벽시계 시간과 p95 CPU 시간 (여러 회차의 중앙값)
+#    CPU 시간(process_time)은 가상 머신이 CPU 를 빼앗긴 시간(steal)이 빠져 공유 vCPU 에서도 안정적
+#  - tracemalloc 피크 메모리(peak_kb), 화면에 나간 요소들의 직렬화 크기(bytes)
+#  - sent: 재실행 한 번에 실제로 나가는 크기 추정 (10KB 이상이고 전에 보낸 적 있는 요소는
+#    Streamlit 의 ForwardMsg 캐시 덕분에 해시 참조만 전송)
+#  - 컴파일된 스크립트는 서버처럼 프로세스당 한 번 (아래 _SCRIPT_CACHE, 확인한 streamlit 버전에서만)
+#  - baseline_rerun.json 과 비교해 cpu_p95 / peak_kb / bytes / sent 중 하나라도 --threshold 이상,
+#    또는 벽시계 p95 가 --wall-threshold 이상 늘면 종료 코드 1 (벽시계는 CPU 로 안 보이는 대기(I/O, sleep)용 느슨한 관문)
+# 사용법:
+#   python benchmarks/bench_rerun.py                      # 측정 + 기준과 비교 출력
+#   python benchmarks/bench_rerun.py --check --threshold 0.25
+#   python benchmarks/bench_rerun.py --update             # 기준 갱신
+#   python benchmarks/bench_rerun.py -k main.mbti         # 일부 시나리오만
+# ---------------------------------------------------------------
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline_rerun.json"
+
+# 벤치마크는 네트워크/작업 디렉터리 캐시를 건드리지 않도록 임시 위치 + 오프라인 이미지
+_TMP = tempfile.mkdtemp(prefix="bench_rerun_")
+os.environ.setdefault("ITINERARY_DB", os.path.join(_TMP, "itineraries.db"))
+os.environ.setdefault("IMAGE_CACHE_DIR", os.path.join(_TMP, "images"))
+os.environ.setdefault("IMAGE_OFFLINE", "1")
+os.environ.setdefault("FEEDS_OFFLINE", "1")
+os.environ.setdefault("FEEDS_CACHE_DIR", os.path.join(_TMP, "feeds"))
+
+import streamlit  # noqa: E402
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache  # noqa: E402
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner  # noqa: E402
+
+# AppTest 는 run() 마다 ScriptCache 를 새로 만들어 스크립트를 매번 magic AST 변환 + 컴파일한다.
+# 실제 서버(Runtime)는 프로세스당 하나를 공유해 파일이 바뀔 때만 다시 컴파일하므로, 벤치마크도 하나를
+# 공유해야 재실행 시간이 스크립트 길이(컴파일 비용)가 아니라 스크립트가 하는 일을 잰다
+# 공유는 AppTest 내부(두 모듈의 ScriptCache 이름)를 바꾸는 것이라, 동작을 확인한 버전에서만 한다.
+# 다른 버전이면 패치하지 않고 경고 → 컴파일 비용이 재실행마다 들어가므로 기준과 비교할 수 없다
+SHARED_CACHE_VERSIONS = ((1, 66), (1, 99))  # [이상, 이하] (major, minor)
+_SCRIPT_CACHE = ScriptCache()
+_version = tuple(int(x) for x in streamlit.__version__.split(".")[:2])
+SHARED_SCRIPT_CACHE = (SHARED_CACHE_VERSIONS[0] <= _version <= SHARED_CACHE_VERSIONS[1]
+                       and hasattr(app_test, "ScriptCache") and hasattr(local_script_runner, "ScriptCache"))
+if SHARED_SCRIPT_CACHE:
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: _SCRIPT_CACHE
+else:
+    print(f"⚠ streamlit {streamlit.__version__}: ScriptCache 공유를 건너뜀 (재실행마다 컴파일 포함, 기준과 비교 불가)",
+          file=sys.stderr)
+
+MBTIS = ["INTJ", "ENFP", "ISTP", "ESFJ"]
+WARMUP = len(MBTIS)
+
+
+def widget(at, kind, label):
+    # 위젯을 순서가 아니라 라벨로 찾는다 (레이아웃이 바뀌어도 시나리오 유지)
+    for w in getattr(at, kind):
+        if w.label == label:
+            return w
+    raise LookupError(f"{kind} '{label}' 없음")
+
+
+def submit(at):
+    # 사이드바가 폼이면 제출 버튼까지 눌러야 반영된다
+    for b in at.button:
+        if getattr(b, "proto", None) is not None and b.proto.is_form_submitter:
+            b.click()
+    return at
+
+
+# 시나리오: 이름 → (스크립트, 준비 함수, i번째 상호작용 함수)
+SCENARIOS = {
+    "main.mbti": ("main.py", None,
+                  lambda at, i: widget(at, "selectbox", "MBTI 선택").set_value(MBTIS[i % len(MBTIS)])),
+    "main.day_count": ("main.py", None,
+                       lambda at, i: widget(at, "slider", "여행 일수").set_value(3 + i % 8)),
+    "main.seed": ("main.py", None,
+                  lambda at, i: widget(at, "number_input", "랜덤 시드(재현용)").set_value(100 + i)),
+    "main.start_date": ("main.py", None,
+                        lambda at, i: widget(at, "date_input", "여행 시작일").set_value(
+                            date(2025, 1, 1) + timedelta(days=i))),
+    "test.subject": ("test.py", None,
+                     lambda at, i: widget(at, "selectbox", "과목 선택").set_value(["국어", "영어", "수학"][i % 3])),
+    "test.grade": ("test.py", None,
+                   lambda at, i: widget(at, "selectbox", "등급 선택").set_value(
+                       ["1~2등급", "3~4등급", "5등급 이하"][i % 3])),
+}
+
+
+def element_bytes(node):
+    # 요소 트리의 proto 직렬화 크기 합 (= 브라우저로 나가는 delta 크기의 근사치)
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        total += sum(element_bytes(c) for c in children.values())
+    return total
+
+
+MIN_CACHED_BYTES = 10_000  # global.minCachedMessageSize 기본값
+REF_BYTES = 48              # ref_hash 메시지 하나의 대략적인 크기
+
+
+def sent_bytes(node, seen):
+    # 큰 요소는 내용 해시로 브라우저 캐시에 남으므로, 같은 내용을 다시 보내면 참조만 나간다
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        size = proto.ByteSize()
+        if size >= MIN_CACHED_BYTES:
+            h = hash(proto.SerializeToString(deterministic=True))
+            total += REF_BYTES if h in seen else size
+            seen.add(h)
+        else:
+            total += size
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        total += sum(sent_bytes(c, seen) for c in children.values())
+    return total
+
+
+def _rerun(at, interact, i):
+    # → (벽시계 ms, 프로세스 CPU ms). CPU 는 스크립트 스레드를 포함한 프로세스 전체
+    interact(at, i)
+    submit(at)
+    t0, c0 = time.perf_counter(), time.process_time()
+    at.run()
+    ms, cpu_ms = (time.perf_counter() - t0) * 1000, (time.process_time() - c0) * 1000
+    if at.exception:
+        raise RuntimeError(f"스크립트 예외: {at.exception}")
+    return ms, cpu_ms
+
+
+def run_scenario(name, reruns, mem_reruns, rounds=1):
+    script, setup, interact = SCENARIOS[name]
+    at = AppTest.from_file(str(ROOT / script), default_timeout=120)
+    at.run()
+    if setup:
+        setup(at)
+    seen = set()
+    sent_bytes(at._tree, seen)
+    # 워밍업: 처음 보는 값(MBTI 한 바퀴)은 import/캐시 생성 비용이라 제외
+    for i in range(WARMUP):
+        _rerun(at, interact, i)
+        sent_bytes(at._tree, seen)
+    # reruns 번씩 rounds 회 재고 회차별 값의 중앙값을 쓴다 (한 회차가 튀어도 결과가 따라가지 않게)
+    per_round, n = [], WARMUP
+    for _ in range(rounds):
+        gc.collect()  # 회차마다 같은 GC 상태에서 시작 (세대 2 수집이 측정 구간 경계에 걸리는 잡음 줄이기)
+        times, cpu, sent = [], [], []
+        for i in range(n, n + reruns):
+            ms, cpu_ms = _rerun(at, interact, i)
+            times.append(ms)
+            cpu.append(cpu_ms)
+            sent.append(sent_bytes(at._tree, seen))
+        n += reruns
+        p95 = lambda xs: statistics.quantiles(xs, n=20, method="inclusive")[18]
+        per_round.append({"p50_ms": statistics.median(times), "p95_ms": p95(times), "cpu_p95_ms": p95(cpu),
+                          "sent": statistics.median(sent)})
+    med = {k: statistics.median(r[k] for r in per_round) for k in per_round[0]}
+    payload = element_bytes(at._tree)
+
+    tracemalloc.start()
+    for i in range(n, n + mem_reruns):
+        _rerun(at, interact, i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"p50_ms": med["p50_ms"], "p95_ms": med["p95_ms"], "cpu_p95_ms": med["cpu_p95_ms"],
+            "peak_kb": peak / 1024, "bytes": payload, "sent": med["sent"], "reruns": reruns}
+
+
+def compare(results, baseline, threshold, wall_threshold):
+    failures = []
+    limits = {"cpu_p95_ms": threshold, "peak_kb": threshold, "bytes": threshold, "sent": threshold,
+              "p95_ms": wall_threshold}
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key, limit in limits.items():
+            if base.get(key) and r[key] > base[key] * (1 + limit):
+                failures.append(f"{name} {key}: {r[key]:.1f} > 기준 {base[key]:.1f} × {1 + limit:.2f}")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-k", "--only", nargs="*", help="실행할 시나리오 이름(접두어 가능)")
+    ap.add_argument("--reruns", type=int, default=20)
+    ap.add_argument("--rounds", type=int, default=3, help="측정 회차 수 (회차별 값의 중앙값을 사용)")
+    ap.add_argument("--mem-reruns", type=int, default=3)
+    ap.add_argument("--threshold", type=float, default=float(os.environ.get("RERUN_THRESHOLD", "0.25")),
+                    help="CPU p95 / 메모리 / 크기의 기준 대비 허용 증가율 (0.25 = 25%%)")
+    ap.add_argument("--wall-threshold", type=float,
+                    default=float(os.environ.get("RERUN_WALL_THRESHOLD", "1.5")),
+                    help="벽시계 p95 의 허용 증가율 (공유 vCPU 에서는 steal 로 2배 넘게 흔들려 느슨하게)")
+    ap.add_argument("--check", action="store_true", help="기준 초과 시 종료 코드 1")
+    ap.add_argument("--update", action="store_true", help="이번 결과로 기준 파일 갱신")
+    args = ap.parse_args()
+
+    names = [n for n in SCENARIOS if not args.only or any(n.startswith(p) for p in args.only)]
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    results = {}
+    print(f"{'시나리오':<18} {'p50':>9} {'p95':>9} {'cpu p95':>9} {'peak':>10} {'bytes':>9} {'sent':>9}   기준 cpu p95")
+    for name in names:
+        r = results[name] = run_scenario(name, args.reruns, args.mem_reruns, args.rounds)
+        base = baseline.get(name, {}).get("cpu_p95_ms")
+        print(f"{name:<18} {r['p50_ms']:7.1f}ms {r['p95_ms']:7.1f}ms {r['cpu_p95_ms']:7.1f}ms {r['peak_kb']:8.0f}KB "
+              f"{r['bytes']:9,d} {r['sent']:9,.0f}"
+              f"   {f'{base:.1f}ms' if base else '-'}")
+
+    if args.update:
+        baseline.update({k: {m: round(v, 2) for m, v in r.items()} for k, r in results.items()})
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + "\n")
+        print(f"기준 갱신 → {BASELINE_PATH}")
+        return
+    failures = compare(results, baseline, args.threshold, args.wall_threshold)
+    for f in failures:
+        print("❌", f)
+    if failures and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
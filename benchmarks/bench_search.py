@@ -0,0 +1,101 @@
+# bench_search.py
+# 🔎 문제집 검색 역색인 (book_search.py) 벤치마크
+#  - 합성 카탈로그(기본 5만 권)로 색인 생성 시간, 질의 p50/p95/p99, 책 추가 후 첫 질의 시간
+#  - 목표: 5만 권에서 질의 p95 가 몇 ms 안쪽 (--budget-ms 넘으면 종료 코드 1)
+# 사용법:
+#   python benchmarks/bench_search.py
+#   python benchmarks/bench_search.py --books 100000 --queries 500
+# ---------------------------------------------------------------
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from book_search import BookIndex  # noqa: E402
+from workbooks import GRADES  # noqa: E402
+
+PUBLISHERS = ["마더텅", "자이스토리", "EBS", "수능특강", "완자", "하이탑", "오투", "빠작", "쎈", "개념원리",
+              "블랙라벨", "일품", "RPM", "올림포스", "매삼문", "리딩튜터", "그래머존", "천일문", "뉴런", "한석원"]
+SUBJECTS = {"국어": ["문학", "비문학", "고전", "독서"], "수학": ["수1", "수2", "미적분", "확률과 통계"],
+            "영어": ["독해", "문법", "어휘", "듣기"], "과탐": ["물리학1", "화학1", "생명과학1", "지구과학1"]}
+TOPICS = ["기출", "개념", "문제풀이", "심화", "기본", "모의고사", "실전", "유형", "오답노트", "내신", "N제"]
+DESC = ["평가원 기출 기반", "개념 정리 충실", "단계별 문제 풀이", "해설이 자세함", "상위권 심화 대비",
+        "중위권 기초 다지기", "독학 최적화", "실전 감각 향상", "반복 학습용", "내신+수능 연계"]
+QUERIES = ["기출", "마더텅", "수학 기출", "개념원리", "생명과학", "마더", "심화 문제", "EBS 수특",
+           "독학", "확률", "모의고사 실전", "쎈", "해설", "블랙", "지구과학1 개념"]
+
+
+def synthetic_catalog(n, seed=0):
+    rng = random.Random(seed)
+    subjects = list(SUBJECTS)
+    for i in range(n):
+        subject = rng.choice(subjects)
+        part = rng.choice(SUBJECTS[subject])
+        book = {"책": f"{rng.choice(PUBLISHERS)} {part} {rng.choice(TOPICS)} {i % 7 + 1}권",
+                "설명": f"{rng.choice(DESC)}, {rng.choice(DESC)}.",
+                "링크": f"https://search.shopping.naver.com/search/all?query=book{i}"}
+        yield book, subject, part if subject == "과탐" else None, rng.choice(GRADES)
+
+
+def pct(xs, q):
+    return statistics.quantiles(xs, n=100, method="inclusive")[q - 1]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--books", type=int, default=50_000)
+    ap.add_argument("--queries", type=int, default=300)
+    ap.add_argument("--adds", type=int, default=1_000, help="색인 후 하나씩 추가할 책 수")
+    ap.add_argument("--budget-ms", type=float, default=10.0, help="질의 p95 목표")
+    args = ap.parse_args()
+
+    catalog = list(synthetic_catalog(args.books + args.adds))
+    index = BookIndex()
+    t0 = time.perf_counter()
+    for book, subject, field, grade in catalog[:args.books]:
+        index.add(book, subject, field, grade)
+    build_s = time.perf_counter() - t0
+    print(f"색인: {len(index):,}권, n-gram {len(index._postings):,}개, {build_s:.2f}s")
+
+    # 처음 한 번은 numpy import 비용이 들어간다
+    t0 = time.perf_counter()
+    for q in QUERIES:
+        index.search(q)
+    print(f"첫 질의 {len(QUERIES)}개 (numpy import 포함): {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+    times = []
+    for i in range(args.queries):
+        q = QUERIES[i % len(QUERIES)]
+        t0 = time.perf_counter()
+        results = index.search(q, k=20)
+        times.append((time.perf_counter() - t0) * 1000)
+    p95 = pct(times, 95)
+    print(f"질의 {args.queries}회: p50 {statistics.median(times):.2f}ms  p95 {p95:.2f}ms  p99 {pct(times, 99):.2f}ms")
+    print(f"  예) '{QUERIES[-1]}' → {results[0][1]['책']} ({results[0][0]:.2f})")
+
+    # 증분 추가: 하나씩 넣고 바로 검색 (포스팅 array 에 이어 붙이기만, 재색인 없음)
+    add_times, after = [], []
+    for book, subject, field, grade in catalog[args.books:]:
+        t0 = time.perf_counter()
+        doc_id = index.add(book, subject, field, grade)
+        add_times.append((time.perf_counter() - t0) * 1e6)
+        if doc_id % 100 == 0:
+            t0 = time.perf_counter()
+            index.search(book["책"], k=5)
+            after.append((time.perf_counter() - t0) * 1000)
+    if add_times:
+        print(f"추가 {len(add_times):,}권: 권당 p50 {statistics.median(add_times):.0f}µs, "
+              f"추가 직후 질의 p50 {statistics.median(after):.2f}ms")
+
+    if p95 > args.budget_ms:
+        print(f"❌ 질의 p95 {p95:.2f}ms > 목표 {args.budget_ms:.1f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
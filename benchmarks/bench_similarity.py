@@ -0,0 +1,84 @@
+# bench_similarity.py
+# 👥 MBTI 유형 유사도 인덱스 (similarity.py) 벤치마크 — 카탈로그가 커질 때 만드는 시간
+#  - 실제 카탈로그(16유형) 인덱스 생성 시간 + 재실행마다 하는 조회(neighbors) 시간
+#  - 합성 카탈로그(유형 수 --types, 유형당 활동 5개/도시 3개)로 단계별 시간:
+#      TF-IDF 행렬 / 상위 k 표 (BLOCK 행씩 곱하기 + 목적지 겹침 쌍) / 전체, TF-IDF 행렬 크기
+#  - 조회는 유형 수와 상관없이 dict 한 번 (µs 미만)
+# 사용법:
+#   python benchmarks/bench_similarity.py
+#   python benchmarks/bench_similarity.py --types 16 1000 10000 --k 5
+# ---------------------------------------------------------------
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from catalog import load_catalog  # noqa: E402
+from similarity import SimilarityIndex, build_similarity, tfidf_matrix, top_k_similar  # noqa: E402
+from travel_core import DATA  # noqa: E402
+
+# 실제 카탈로그의 활동/스타일 문장을 섞어 새 유형을 만든다 (어휘 분포가 실제와 비슷하도록)
+ACTIVITIES = sorted({a for info in DATA.values() for a in info["activities"]})
+STYLES = sorted({info["style"] for info in DATA.values()})
+WORDS = sorted({w for s in ACTIVITIES + STYLES for w in s.replace("/", " ").replace("·", " ").split()})
+
+
+def synthetic_types(n, seed=0):
+    rng = random.Random(seed)
+    n_dest = max(50, n * 2)  # 유형이 늘면 도시도 늘어난다
+    types = {}
+    for i in range(n):
+        acts = rng.sample(ACTIVITIES, 3) + [" ".join(rng.sample(WORDS, 3)) for _ in range(2)]
+        style = f"{rng.choice(STYLES)} {rng.choice(WORDS)}"
+        types[f"T{i:05d}"] = (style, f"{style} 여행을 좋아하는 유형.", acts, rng.sample(range(n_dest), 3))
+    return types
+
+
+def lookup_ns(index, names, n=20000):
+    t0 = time.perf_counter_ns()
+    for i in range(n):
+        index.neighbors(names[i % len(names)])
+    return (time.perf_counter_ns() - t0) / n
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--types", type=int, nargs="*", default=[16, 256, 1024, 4096])
+    ap.add_argument("--k", type=int, default=3)
+    args = ap.parse_args()
+
+    times = []
+    for _ in range(5):
+        cat = load_catalog()  # cached_property 를 매번 새로
+        t0 = time.perf_counter()
+        index = cat.similarity
+        times.append((time.perf_counter() - t0) * 1000)
+    names = list(index.types)
+    print(f"실제 카탈로그 {len(names)}유형: 생성 p50 {statistics.median(times):.1f}ms "
+          f"(첫 회 numpy 준비 포함 {times[0]:.1f}ms), 조회 {lookup_ns(index, names):.0f}ns")
+
+    print(f"\n{'유형 수':>8} {'n-gram':>7} {'TF-IDF':>9} {'상위 k':>9} {'전체':>9} {'행렬':>8} {'조회':>7}")
+    for n in args.types:
+        types = synthetic_types(n)
+        t0 = time.perf_counter()
+        text, vocab = tfidf_matrix([" ".join([s, d, *a]) for s, d, a, _ in types.values()])
+        t1 = time.perf_counter()
+        idx, score = top_k_similar(text, [ids for *_, ids in types.values()], args.k)
+        t2 = time.perf_counter()
+        index = SimilarityIndex(types, idx, score)
+        t3 = time.perf_counter()
+        assert len(index) == n and len(index.neighbors(next(iter(types)))) == min(args.k, n - 1)
+        full = build_similarity(types, args.k)  # 같은 결과인지 (공개 함수 경로)
+        assert full.neighbors("T00000") == index.neighbors("T00000")
+        print(f"{n:>8,} {len(vocab):>7,} {(t1 - t0) * 1000:7.1f}ms {(t2 - t1) * 1000:7.1f}ms "
+              f"{(t3 - t0) * 1000:7.1f}ms {text.nbytes / 2**20:6.1f}MB "
+              f"{lookup_ns(index, list(types)):5.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# bench_spatial.py
+# 🧭 GridIndex vs 전체 스캔(brute force): 카탈로그 크기별 k-최근접 / 반경 질의 시간
+# 사용법: python benchmarks/bench_spatial.py [--sizes 1000 10000 100000 1000000] [--queries 500]
+# ---------------------------------------------------------------
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from spatial import GridIndex, brute_nearest, brute_within  # noqa: E402
+
+
+def per_query_ms(fn, queries):
+    t0 = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    return (time.perf_counter() - t0) * 1000 / len(queries)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--radius", type=float, default=300.0)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>10} {'build':>9} {'knn grid':>10} {'knn brute':>10} {'radius grid':>12} {'radius brute':>13}")
+    for n in args.sizes:
+        # 구면 위 균일 분포
+        lat = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+        lon = rng.uniform(-180, 180, n)
+        queries = list(zip(np.degrees(np.arcsin(rng.uniform(-1, 1, args.queries))),
+                           rng.uniform(-180, 180, args.queries)))
+
+        t0 = time.perf_counter()
+        grid = GridIndex(lat, lon)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        for q in queries[:50]:  # 결과가 같은지 먼저 확인
+            assert np.allclose(grid.nearest(*q, args.k)[1], brute_nearest(lat, lon, *q, args.k)[1])
+            assert len(grid.within(*q, args.radius)[0]) == len(brute_within(lat, lon, *q, args.radius)[0])
+
+        row = [
+            per_query_ms(lambda a, b: grid.nearest(a, b, args.k), queries),
+            per_query_ms(lambda a, b: brute_nearest(lat, lon, a, b, args.k), queries),
+            per_query_ms(lambda a, b: grid.within(a, b, args.radius), queries),
+            per_query_ms(lambda a, b: brute_within(lat, lon, a, b, args.radius), queries),
+        ]
+        print(f"{n:>10,} {build_ms:>7.1f}ms " + " ".join(f"{ms:>9.3f}ms" for ms in row[:2])
+              + f" {row[2]:>10.3f}ms {row[3]:>11.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# bench_startup.py
+# 🚀 앱 진입점(main.py / test.py / ex1.py) 콜드 스타트 측정
+#  - 하네스(streamlit, AppTest)를 import 하고 빈 스크립트를 한 번 렌더해 Streamlit 자체의 지연 import
+#    (packaging, toml 등)를 미리 끝낸 뒤, 기준 스크립트(BASELINE)를 한 번 더 렌더해 시간을 잰다
+#  - 그다음 앱 스크립트의 첫 렌더 동안 일어난 import 만 `python -X importtime` 으로 잡아 패키지별로 집계
+#  - 예산은 ms 가 아니라 같은 프로세스의 기준값에 대한 비율 (기계 속도와 무관하게 비교)
+#      script_import_ratio = 스크립트 import 시간 / 하네스 import 시간
+#      first_render_ratio  = 스크립트 첫 렌더 시간 / 기준 스크립트 렌더 시간
+#  - startup_budget.json 의 예산과 비교해 초과하면 종료 코드 1
+# 사용법:
+#   python benchmarks/bench_startup.py                 # 리포트만
+#   python benchmarks/bench_startup.py --check         # 예산 초과 시 실패 (CI 용)
+#   python benchmarks/bench_startup.py --write-budget  # 현재 측정값 + 여유분으로 예산 갱신
+# ---------------------------------------------------------------
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_PATH = Path(__file__).resolve().parent / "startup_budget.json"
+SCRIPTS = ["main.py", "test.py", "ex1.py"]
+MARKER = "--- app script start ---"
+BASELINE = 'import streamlit as st\nst.title("baseline")\nst.write("ok")\n'
+RATIOS = {"script_import_ratio": ("script_import_ms", "harness_import_ms"),
+          "first_render_ratio": ("first_render_ms", "baseline_render_ms")}
+# 하네스 import 의 2% (몇 ms) 아래는 잡음이라 import 예산의 바닥으로 둔다 (ex1.py 처럼 import 가 없는 스크립트)
+MIN_IMPORT_RATIO = 0.02
+
+# 측정하는 하위 프로세스가 뉴스 피드를 가져오지 않도록 (main.py 첫 렌더에 네트워크가 끼지 않게)
+os.environ.setdefault("FEEDS_OFFLINE", "1")
+
+# 하네스 import → 예열 렌더 → 기준 렌더 3번(최솟값) → 표시 → 앱 스크립트 첫 렌더
+RUNNER = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+AppTest.from_string({BASELINE!r}, default_timeout=120).run()
+baseline_ms = float("inf")
+for _ in range(3):
+    t0 = time.perf_counter()
+    AppTest.from_string({BASELINE!r}, default_timeout=120).run()
+    baseline_ms = min(baseline_ms, (time.perf_counter() - t0) * 1000)
+sys.stderr.write({MARKER!r} + "\\n"); sys.stderr.flush()
+t0 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({{"first_render_ms": ms, "baseline_render_ms": baseline_ms, "exception": bool(at.exception)}}))
+"""
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr):
+    # (표시 전 하네스 import 합계 ms, 표시 이후(= 앱 스크립트가 일으킨) import 의 최상위 패키지별 self 시간)
+    harness_us = 0
+    by_pkg = defaultdict(int)
+    after = False
+    for line in stderr.splitlines():
+        if line.strip() == MARKER:
+            after = True
+            continue
+        m = _LINE.match(line)
+        if not m:
+            continue
+        if after:
+            by_pkg[m.group(4).split(".")[0]] += int(m.group(1))
+        else:
+            harness_us += int(m.group(1))
+    return harness_us / 1000, {k: v / 1000 for k, v in sorted(by_pkg.items(), key=lambda kv: -kv[1])}
+
+
+def measure(script, repeat=1):
+    # 비율마다 가장 낮은 회차 (잡음은 항상 느려지는 쪽이라 최솟값이 가장 안정적)
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", RUNNER, str(ROOT / script)],
+                              capture_output=True, text=True, cwd=ROOT)
+        wall = (time.perf_counter() - t0) * 1000
+        if proc.returncode != 0:
+            raise SystemExit(f"{script} 실행 실패:\n{proc.stderr[-2000:]}")
+        out = json.loads(proc.stdout.strip().splitlines()[-1])
+        harness_ms, imports = parse_importtime(proc.stderr)
+        res = {
+            "process_ms": wall,
+            "harness_import_ms": harness_ms,
+            "baseline_render_ms": out["baseline_render_ms"],
+            "first_render_ms": out["first_render_ms"],
+            "script_import_ms": sum(imports.values()),
+            "imports": imports,
+            "exception": out["exception"],
+        }
+        for key, (num, den) in RATIOS.items():
+            res[key] = res[num] / res[den]
+        if best is None:
+            best = res
+        else:
+            best["exception"] |= res["exception"]
+            for key, (num, den) in RATIOS.items():
+                if res[key] < best[key]:
+                    best[key], best[num], best[den] = res[key], res[num], res[den]
+                    if key == "script_import_ratio":
+                        best["imports"] = res["imports"]
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("scripts", nargs="*", default=SCRIPTS)
+    ap.add_argument("--repeat", type=int, default=3, help="가장 빠른 회차를 사용")
+    ap.add_argument("--top", type=int, default=10)
+    ap.add_argument("--check", action="store_true")
+    ap.add_argument("--write-budget", action="store_true")
+    ap.add_argument("--headroom", type=float, default=0.25, help="예산 여유분 비율")
+    args = ap.parse_args()
+
+    budget = json.loads(BUDGET_PATH.read_text()) if BUDGET_PATH.exists() else {}
+    results, failures = {}, []
+    for script in args.scripts:
+        r = results[script] = measure(script, args.repeat)
+        print(f"\n== {script}  프로세스 {r['process_ms']:.0f}ms{'  ⚠️ 예외 발생' if r['exception'] else ''}\n"
+              f"   첫 렌더 {r['first_render_ms']:.0f}ms / 기준 {r['baseline_render_ms']:.0f}ms"
+              f" = {r['first_render_ratio']:.2f}x · "
+              f"스크립트 import {r['script_import_ms']:.1f}ms / 하네스 {r['harness_import_ms']:.0f}ms"
+              f" = {r['script_import_ratio']:.4f}")
+        for pkg, ms in list(r["imports"].items())[:args.top]:
+            print(f"   {ms:8.1f}ms  {pkg}")
+        for key in RATIOS:
+            limit = budget.get(script, {}).get(key)
+            if limit is None:
+                failures.append(f"{script} {key}: 예산 없음 (--write-budget 으로 기록)")
+            elif r[key] > limit:
+                failures.append(f"{script} {key}: {r[key]:.4f} > 예산 {limit:.4f}")
+
+    if args.write_budget:
+        for script, r in results.items():
+            budget[script] = {k: round(r[k] * (1 + args.headroom), 4) for k in RATIOS}
+            budget[script]["script_import_ratio"] = max(budget[script]["script_import_ratio"], MIN_IMPORT_RATIO)
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2, ensure_ascii=False) + "\n")
+        print(f"\n예산 갱신 → {BUDGET_PATH}")
+        failures = []
+    if failures:
+        print("\n❌ 예산 초과")
+        for f in failures:
+            print("  -", f)
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
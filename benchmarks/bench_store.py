@@ -0,0 +1,56 @@
+# bench_store.py
+# 💾 SQLite 일정 저장소: 대량 저장 속도 + 조회 지연(p50/p95/p99)
+# 사용법: python benchmarks/bench_store.py [--trips 5000] [--reads 2000]
+# ---------------------------------------------------------------
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from itinerary_store import ItineraryStore, trip_id  # noqa: E402
+from travel_core import DATA, generate_itinerary_batch  # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trips", type=int, default=5000)
+    ap.add_argument("--reads", type=int, default=2000)
+    args = ap.parse_args()
+
+    rnd = random.Random(0)
+    types = sorted(DATA)
+    params = [{"mbti": rnd.choice(types), "days": rnd.randint(3, 10), "start_date": date(2025, 1, 1),
+               "dest_count": rnd.randint(1, 3), "seed": i} for i in range(args.trips)]
+    batch = generate_itinerary_batch([p["mbti"] for p in params], [p["days"] for p in params],
+                                     date(2025, 1, 1), [p["seed"] for p in params],
+                                     [p["dest_count"] for p in params])
+    frames = [g.drop(columns="trip").reset_index(drop=True) for _, g in batch.groupby("trip")]
+    records = [(p, list(dict.fromkeys(zip(f["도시"], f["국가"]))), f) for p, f in zip(params, frames)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ItineraryStore(Path(tmp) / "bench.db", max_rows=args.trips)
+        t0 = time.perf_counter()
+        store.put_many(records)
+        elapsed = time.perf_counter() - t0
+        print(f"put_many: {args.trips:,}개 {elapsed:.3f}s ({args.trips / elapsed:,.0f} trips/s)")
+
+        ids = [trip_id(**p) for p in params]
+        for _ in range(args.reads):
+            store.get(rnd.choice(ids))
+        lat = store.read_latency()
+        print(f"get: {lat['reads']:,}회 p50 {lat['p50_ms']:.3f}ms  p95 {lat['p95_ms']:.3f}ms  "
+              f"p99 {lat['p99_ms']:.3f}ms")
+
+        t0 = time.perf_counter()
+        store.find("ENFP", date(2025, 1, 1))
+        print(f"find(mbti, date): {(time.perf_counter() - t0) * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# bench_summarize.py
+# 📝 여행 글 요약 (summarize.py) 벤치마크 — 합성 글 모음으로
+#  - 작업 프로세스 수별 처음 요약(캐시 없음) 처리량(문서/s)과 1 프로세스 대비 배율
+#  - 그대로 다시 실행(manifest 로 전부 건너뜀), 일부만 바꾼 뒤 다시 실행(바뀐 글만 요약)
+#  - CPU 코어 수보다 많은 작업 프로세스는 빨라지지 않는다 (결과 해석할 때 os.cpu_count() 참고)
+# 사용법:
+#   python benchmarks/bench_summarize.py
+#   python benchmarks/bench_summarize.py --docs 2000 --workers 1 2 4 8 --algo lsa
+# ---------------------------------------------------------------
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from summarize import build_index, load_index  # noqa: E402
+from travel_core import CATALOG  # noqa: E402
+
+CITIES = [d.city for d in CATALOG.destinations]
+SPOTS = ["야시장", "미술관", "골목 카페", "전망대", "해변", "구시가지", "성당", "현지 식당", "공원", "항구"]
+VERBS = ["꼭 들러 보세요", "줄이 길지만 기다릴 만합니다", "해 질 무렵이 가장 좋습니다",
+         "걸어서 둘러보기 좋습니다", "현지인이 추천한 곳입니다", "입장료가 저렴합니다"]
+
+
+def synthetic_archive(root, n, seed=0, html_every=4):
+    # 절반은 도시 폴더 아래, 나머지는 섞인 폴더(본문 속 도시 이름으로 연결)
+    rng = random.Random(seed)
+    for i in range(n):
+        city = rng.choice(CITIES)
+        lines = [f"{city}의 {rng.choice(SPOTS)}은 {rng.choice(VERBS)}. {rng.choice(SPOTS)}에서 "
+                 f"{rng.choice(SPOTS)}까지는 {rng.randint(5, 40)}분 거리입니다."
+                 for _ in range(rng.randint(20, 60))]
+        folder = Path(root, city if i % 2 else f"mixed{i % 10}")
+        folder.mkdir(parents=True, exist_ok=True)
+        if i % html_every == 0:
+            body = "".join(f"<p>{line}</p>" for line in lines)
+            Path(folder, f"post{i}.html").write_text(
+                f"<html><body><nav>menu</nav><article><h1>{city} 여행기</h1>{body}</article></body></html>",
+                encoding="utf-8")
+        else:
+            Path(folder, f"post{i}.txt").write_text("\n".join(lines), encoding="utf-8")
+
+
+def touch_some(root, frac, seed=1):
+    rng = random.Random(seed)
+    files = sorted(p for p in Path(root).rglob("*") if p.is_file())
+    changed = rng.sample(files, max(1, int(len(files) * frac)))
+    for p in changed:
+        with open(p, "a", encoding="utf-8") as f:
+            f.write("\n새로 추가된 문장입니다. 다시 가고 싶은 곳입니다.")
+    return len(changed)
+
+
+def report(label, stats, base=None):
+    rate = stats["files"] / stats["seconds"]
+    speedup = f"  ×{base / stats['seconds']:.2f}" if base else ""
+    print(f"  {label:<14} {stats['seconds']:7.2f}s  요약 {stats['summarized']:5d}  캐시 {stats['memo_hits']:5d}  "
+          f"건너뜀 {stats['unchanged']:5d}  {rate:7.1f} 문서/s  (도시 요약 {stats['city_seconds']:.2f}s){speedup}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--docs", type=int, default=400)
+    ap.add_argument("--workers", type=int, nargs="*", default=[1, 2, 4])
+    ap.add_argument("--algo", choices=("lexrank", "lsa"), default="lexrank")
+    ap.add_argument("--sentences", type=int, default=3)
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_summarize_")
+    archive = os.path.join(tmp, "archive")
+    synthetic_archive(archive, args.docs)
+    out = os.path.join(tmp, "city_summaries.json")
+    print(f"글 {args.docs}개, {args.algo}, {args.sentences}문장, CPU {os.cpu_count()}개")
+
+    base = None
+    for workers in args.workers:
+        cache = os.path.join(tmp, f"cache{workers}")
+        stats = build_index(archive, out, args.algo, args.sentences, workers, cache)
+        base = base or stats["seconds"]
+        report(f"workers={workers}", stats, base)
+    shutil.copytree(archive, archive + ".orig")
+
+    workers = args.workers[-1]
+    print(f"캐시 재사용 (workers={workers})")
+    report("변경 없음", build_index(archive, out, args.algo, args.sentences, workers, cache))
+    n = touch_some(archive, 0.1)
+    report(f"{n}개 수정", build_index(archive, out, args.algo, args.sentences, workers, cache))
+    shutil.rmtree(archive)
+    os.rename(archive + ".orig", archive)  # 되돌리면 내용 해시가 같아 전부 캐시 적중
+    report("되돌림", build_index(archive, out, args.algo, args.sentences, workers, cache))
+
+    index = load_index(out)
+    city = max(index, key=lambda c: index[c]["documents"])
+    print(f"색인: 도시 {len(index)}곳, {os.path.getsize(out) / 1024:.1f}KB — 예) {city} "
+          f"({index[city]['documents']}개 글): {' '.join(index[city]['summary'])[:120]}…")
+    shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
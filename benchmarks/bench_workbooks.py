@@ -0,0 +1,140 @@
+# bench_workbooks.py
+# 📚 문제집 카탈로그 다시 읽기(hot reload) 벤치마크 (workbooks.py)
+#  - 책 수별로: JSON 파싱 / 검증 / 스냅샷 생성(인덱스 + 카드 HTML + 검색 색인) 시간
+#  - 파일 교체 → 백그라운드 스레드가 새 스냅샷으로 바꿔 끼우기까지 걸린 시간 (감시 주기 포함)
+#  - 그동안 다른 스레드가 계속 읽을 때 읽기 한 번의 최대 지연 (다시 읽는 중에도 막히지 않는지)
+#  - 책이 추가만 된 파일: 검색 색인을 새로 만들지 않고 새 책만 add 할 때의 교체 시간
+# 사용법:
+#   python benchmarks/bench_workbooks.py
+#   python benchmarks/bench_workbooks.py --books 1000 50000 --interval 0.05
+# ---------------------------------------------------------------
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_search import synthetic_catalog  # noqa: E402
+from workbooks import DEFAULT_PATH, WorkbookCatalog, WorkbookSource, parse_workbooks, validate  # noqa: E402
+
+
+def synthetic_raw(n, seed=0):
+    books, routes = [], {}
+    for book, subject, field, grade in synthetic_catalog(n, seed):
+        books.append({"subject": subject, "field": field, "grade": grade, "title": book["책"],
+                      "description": book["설명"], "link": book["링크"]})
+        key = (subject, field, None if field else grade)
+        routes[key] = {"subject": key[0], "field": key[1], "grade": key[2],
+                       "route": "개념 → 기출 → 실전", "reason": f"{seed}번째 판"}
+    return {"books": books, "routes": list(routes.values())}
+
+
+def write_atomic(path, raw):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(raw, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def time_stages(path):
+    t0 = time.perf_counter()
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    t1 = time.perf_counter()
+    errors = validate(raw)
+    t2 = time.perf_counter()
+    assert not errors, errors[:3]
+    cat = parse_workbooks(raw)
+    t3 = time.perf_counter()
+    return cat, ((t1 - t0) * 1000, (t2 - t1) * 1000, (t3 - t2) * 1000)
+
+
+def hot_reload(path, n, interval, rounds):
+    src = WorkbookSource(path, interval=interval).start()
+    stop = threading.Event()
+    reads = []
+
+    def reader():
+        # 세션이 하는 일: 스냅샷 하나를 잡고 몇 가지 조회
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            cat = src.current
+            s = cat.subjects[0]
+            cat.books_for(s, (cat.fields_of(s) or (None,))[0], "1~2등급")
+            reads.append((time.perf_counter() - t0) * 1e6)
+            time.sleep(0.0005)
+
+    threading.Thread(target=reader, daemon=True).start()
+    swaps = []
+    for r in range(1, rounds + 1):
+        before = src.current
+        time.sleep(0.01)  # mtime_ns 가 확실히 바뀌도록
+        write_atomic(path, synthetic_raw(n, seed=r))
+        t0 = time.perf_counter()
+        while src.current is before:
+            time.sleep(0.001)
+        swaps.append((time.perf_counter() - t0) * 1000)
+    stop.set()
+    return swaps, reads, src.stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--books", type=int, nargs="*", default=[1_000, 10_000, 50_000])
+    ap.add_argument("--interval", type=float, default=0.05, help="파일 확인 주기(초)")
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args()
+
+    real = WorkbookSource(DEFAULT_PATH, interval=0).current
+    _, stages = time_stages(DEFAULT_PATH)
+    print(f"data/workbooks.json: {len(real)}권 — 파싱 {stages[0]:.1f}ms, 검증 {stages[1]:.1f}ms, "
+          f"스냅샷 {stages[2]:.1f}ms")
+
+    tmp = tempfile.mkdtemp(prefix="bench_workbooks_")
+    print(f"\n{'책 수':>7} {'파싱':>9} {'검증':>9} {'스냅샷':>9} | {'교체까지 p50':>12} {'최대':>9} | {'읽기 p50':>9} {'최대':>9}")
+    for n in args.books:
+        path = os.path.join(tmp, f"workbooks_{n}.json")
+        write_atomic(path, synthetic_raw(n))
+        cat, stages = time_stages(path)
+        assert isinstance(cat, WorkbookCatalog) and len(cat) == n
+        swaps, reads, stats = hot_reload(path, n, args.interval, args.rounds)
+        assert stats["reloads"] == args.rounds and not stats["failures"], stats
+        print(f"{n:>7,} {stages[0]:7.1f}ms {stages[1]:7.1f}ms {stages[2]:7.1f}ms | "
+              f"{statistics.median(swaps):10.1f}ms {max(swaps):7.1f}ms | "
+              f"{statistics.median(reads):7.1f}µs {max(reads):7.1f}µs")
+
+    # 책 추가만: 검색 색인은 이전 스냅샷의 것에 새 책만 add
+    n = args.books[-1]
+    path = os.path.join(tmp, "append.json")
+    raw = synthetic_raw(n)
+    write_atomic(path, raw)
+    src = WorkbookSource(path, interval=0)
+    time.sleep(0.01)
+    write_atomic(path, dict(raw, books=raw["books"] + [dict(b, title=f"{b['title']} 개정판") for b in raw["books"][:100]]))
+    src.check()
+    assert src.current.added == 100 and src.stats["incremental"] == 1, src.stats
+    print(f"\n{n:,}권에 100권 추가: 교체 {src.stats['last_reload_ms']:.1f}ms (검색 색인은 새 책만 추가)")
+
+    # 깨진 파일은 이전 스냅샷을 유지
+    path = os.path.join(tmp, "broken.json")
+    write_atomic(path, synthetic_raw(10))
+    src = WorkbookSource(path, interval=0)
+    good = src.current
+    time.sleep(0.01)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"books": [{"subject": "국어"}], "routes": []}')
+    src.check()
+    assert src.current is good and src.stats["failures"] == 1
+    print(f"\n검증 실패 시 이전 스냅샷 유지: {src.stats['last_error'].splitlines()[1].strip()} …")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# stress_rng.py
+# 🎲 동시 세션 재현성 스트레스 테스트
+# streamlit 처럼 한 프로세스의 여러 스레드에서 수천 개 일정을 동시에 생성하고,
+# 직렬로 만든 기준 결과와 모두 같은지 확인한다. 하나라도 다르면 종료 코드 1
+# 사용법: python benchmarks/stress_rng.py [--jobs 2000] [--workers 32] [--rounds 3]
+# ---------------------------------------------------------------
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from route import plan_route  # noqa: E402
+from travel_core import DATA, generate_itinerary, sample_destinations, trip_rng  # noqa: E402
+
+
+def make_trip(job):
+    mbti, days, k, seed = job
+    rng = trip_rng(mbti, seed)
+    dests = list(plan_route(sample_destinations(mbti, k, rng)).destinations)
+    return generate_itinerary(mbti, days, date(2025, 1, 1), dests, rng)
+
+
+def stress(n_jobs, workers, round_no):
+    # 같은 시드가 여러 번 섞여 나오도록 시드 범위를 좁게
+    rnd = random.Random(round_no)
+    jobs = [(rnd.choice(sorted(DATA)), rnd.randint(3, 10), rnd.randint(1, 3), rnd.randrange(50))
+            for _ in range(n_jobs)]
+    expected = [make_trip(j) for j in jobs]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        got = list(pool.map(make_trip, jobs))
+    elapsed = time.perf_counter() - t0
+    bad = [j for j, a, b in zip(jobs, expected, got) if not a.equals(b)]
+    print(f"[{round_no}] {n_jobs:,}건 / 스레드 {workers}개 / {elapsed:.2f}s → 불일치 {len(bad)}건")
+    for j in bad[:5]:
+        print("    ", j)
+    return not bad
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=2000)
+    ap.add_argument("--workers", type=int, default=32)
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args()
+
+    ok = all([stress(args.jobs, args.workers, r) for r in range(args.rounds)])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
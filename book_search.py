@@ -0,0 +1,122 @@
+# book_search.py
+# 🔎 문제집 전문 검색 (test.py) — 글자 n-gram 역색인
+#  - 형태소 분석기 없이 한글 검색: 단어마다 글자 1-gram + 2-gram 을 색인
+#    ("마더텅" → 마, 더, 텅, 마더, 더텅) → "마더", "기출" 같은 부분/접두 검색이 그대로 맞는다
+#  - 과목/분야 이름도 설명과 같은 가중치로 색인
+#  - 순위: BM25 (책 이름은 설명보다 가중치 2배) + 책 이름이 검색어로 시작하면 가산점
+#  - 질의의 n-gram 을 모두 가진 책만 후보 (없으면 일부만 맞는 책이라도 순위대로)
+#  - add() 로 책을 하나씩 추가 가능: 포스팅은 array.array 에 이어 붙이고,
+#    검색은 np.frombuffer 로 복사 없이 읽는다 (그래서 추가/검색은 같은 잠금 안에서)
+# numpy 는 검색할 때 처음 import (test.py 콜드 스타트용)
+# ---------------------------------------------------------------
+
+import re
+import threading
+from array import array
+import unicodedata
+from collections import Counter
+
+TITLE_WEIGHT = 2
+K1, B = 1.2, 0.75
+PREFIX_BONUS = 1.5
+
+_WORD = re.compile(r"[0-9a-z가-힣ㄱ-ㆎ]+")
+
+
+def normalize(text):
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def words(text):
+    return _WORD.findall(normalize(text))
+
+
+def grams(word):
+    # 글자 1-gram + 2-gram (한 글자 검색어도 맞도록 1-gram 포함)
+    return list(word) + [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def query_grams(word):
+    # 질의 쪽은 2-gram 만으로 충분 (한 글자 단어일 때만 1-gram)
+    return [word] if len(word) == 1 else [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+class BookIndex:
+    def __init__(self):
+        self.docs = []          # doc id → 책 dict (책/설명/링크 + 과목/분야/등급)
+        self._titles = []       # doc id → 정규화한 책 이름 (접두 가산점용)
+        self._lens = array("d")  # doc id → 가중 n-gram 수 (BM25 문서 길이)
+        self._postings = {}      # n-gram → (array doc id, array 가중 tf)
+        self._total_len = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, book, subject=None, field=None, grade=None):
+        # 설명 + 과목/분야 이름 ("수학 기출" 처럼 과목으로 좁히는 검색용) 은 1, 책 이름은 TITLE_WEIGHT
+        tf = Counter(g for w in words(" ".join(x for x in (book.get("설명", ""), subject, field) if x))
+                     for g in grams(w))
+        for g, n in Counter(g for w in words(book["책"]) for g in grams(w)).items():
+            tf[g] += n * TITLE_WEIGHT
+        doc = dict(book, 과목=subject, 분야=field, 등급=grade)
+        with self._lock:
+            doc_id = len(self.docs)
+            self.docs.append(doc)
+            self._titles.append(normalize(book["책"]))
+            length = sum(tf.values())
+            self._lens.append(length)
+            self._total_len += length
+            for g, n in tf.items():
+                ids, tfs = self._postings.setdefault(g, (array("q"), array("d")))
+                ids.append(doc_id)
+                tfs.append(n)
+        return doc_id
+
+    def add_many(self, entries):
+        # entries: ((과목, 분야, 등급), 카드 dict 목록) — WorkbookCatalog.entries()
+        for (subject, field, grade), items in entries:
+            for book in items:
+                self.add(book, subject, field, grade)
+        return self
+
+    def search(self, query, k=20):
+        """검색어 → [(점수, 책 dict)] 점수 높은 순."""
+        import numpy as np
+
+        qwords = words(query)
+        qgrams = list(dict.fromkeys(g for w in qwords for g in query_grams(w)))
+        present = [g for g in qgrams if g in self._postings]
+        if not present:
+            return []
+        # frombuffer 뷰가 살아 있는 동안 array 가 커지면 안 되므로 점수 계산까지 잠금 안에서
+        with self._lock:
+            n = len(self.docs)
+            lens = np.frombuffer(self._lens, dtype=np.float64)
+            avg_len = self._total_len / n
+            scores = np.zeros(n)
+            hits = np.zeros(n, dtype=np.int64)
+            for g in present:
+                ids = np.frombuffer(self._postings[g][0], dtype=np.int64)
+                tfs = np.frombuffer(self._postings[g][1], dtype=np.float64)
+                idf = np.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+                norm = K1 * (1 - B + B * lens[ids] / avg_len)
+                scores[ids] += idf * tfs * (K1 + 1) / (tfs + norm)
+                hits[ids] += 1
+            del lens, ids, tfs
+        # 질의 n-gram 을 모두 가진 책이 있으면 그 책들만, 없으면 맞은 만큼 순위대로
+        full = hits == len(qgrams)
+        if full.any():
+            scores[~full] = 0
+        cand = np.flatnonzero(scores > 0)
+        if len(cand) > k * 4:
+            cand = cand[np.argpartition(-scores[cand], k * 4)[:k * 4]]
+        # 책 이름이 검색어(의 단어)로 시작하면 가산점 — 후보 몇십 개만 확인
+        ranked = []
+        for i in cand.tolist():
+            title = self._titles[i]
+            bonus = PREFIX_BONUS if any(title.startswith(w) or f" {w}" in title for w in qwords) else 0.0
+            ranked.append((float(scores[i]) + bonus, i))
+        ranked.sort(key=lambda t: (-t[0], t[1]))
+        return [(score, self.docs[i]) for score, i in ranked[:k]]
+
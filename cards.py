@@ -0,0 +1,66 @@
+# cards.py
+# 📚 문제집 카드 HTML (test.py)
+#  - 카드 목록 전체를 하나의 HTML 블록으로 → 재실행마다 요소 1개 (책마다 st.markdown 하던 것 대신)
+#  - (과목, 분야, 등급) 조합별 블록은 build_blocks 로 카탈로그를 읽을 때 한 번만 만든다 (workbooks.py)
+# ---------------------------------------------------------------
+
+import html
+
+# 화려한 카드 디자인 CSS (카드 블록 맨 앞에 붙어서 함께 나간다)
+CARD_CSS = """\
+<style>
+body {
+    background: linear-gradient(135deg, #FF6B6B, #FFD93D, #6BCB77, #4D96FF, #9D4EDD);
+    background-attachment: fixed;
+    font-family: 'Segoe UI', sans-serif;
+    color: white;
+}
+h1, h2, h3, h4 {
+    text-shadow: 2px 2px 6px rgba(0,0,0,0.7);
+}
+.card {
+    background: rgba(0,0,0,0.5);
+    border-radius: 20px;
+    padding: 20px;
+    margin-bottom: 15px;
+    box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
+    transition: transform 0.3s, box-shadow 0.3s;
+}
+.card:hover {
+    transform: translateY(-5px) scale(1.03);
+    box-shadow: 0 12px 36px rgba(0,0,0,0.6);
+}
+.btn-link {
+    display: inline-block;
+    margin-top: 10px;
+    padding: 8px 16px;
+    border-radius: 12px;
+    font-weight: bold;
+    text-decoration: none;
+    background: linear-gradient(90deg, #FFD93D, #6BCB77, #4D96FF);
+    color: black;
+}
+.btn-link:hover {
+    filter: brightness(1.2);
+}
+</style>"""
+
+
+def card_html(item):
+    # 들여쓰기 없이 한 줄씩: markdown 이 코드 블록으로 읽지 않도록
+    return (
+        '<div class="card">'
+        f"<h3>📚 {html.escape(item['책'])}</h3>"
+        f"<p>{html.escape(item['설명'])}</p>"
+        f'<a class="btn-link" href="{html.escape(item["링크"], quote=True)}" target="_blank">🔗 구매하러 가기</a>'
+        "</div>"
+    )
+
+
+def cards_block(items, css=CARD_CSS):
+    return css + "\n" + "\n".join(card_html(item) for item in items)
+
+
+def build_blocks(entries):
+    # entries: ((과목, 분야, 등급), 카드 dict 목록) → 조합별 HTML 블록 (CSS 없이. 화면의 첫 블록에만 붙인다)
+    return {key: cards_block(items, css="") for key, items in entries}
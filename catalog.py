@@ -0,0 +1,180 @@
+# catalog.py
+# 📚 여행지 카탈로그: data/catalog.json 을 프로세스당 한 번 읽어 공유
+#  - 목적지는 (도시, 나라) 기준으로 중복 제거된 Destination 레코드 (tuple 기반, 인스턴스 dict 없음)
+#  - 반복되는 문자열(나라, 유형, 활동)은 sys.intern 으로 공유, 위/경도는 NumPy 컬럼으로도 보관 (처음 쓸 때 생성)
+#    (도시 이름은 중복 제거 후 목적지마다 하나뿐이라 intern 해도 공유되는 게 없어 그대로 둔다)
+#  - MBTI / 나라 / 도시별 인덱스 (목적지 번호 tuple) — 읽을 때 목적지 한 바퀴 + 유형 한 바퀴로 함께 만든다
+# 카탈로그 파일 경로는 CATALOG_PATH 환경변수로 바꿀 수 있다.
+# ---------------------------------------------------------------
+
+import gc
+import json
+import os
+import sys
+import threading
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+DEFAULT_PATH = os.environ.get("CATALOG_PATH", str(Path(__file__).resolve().parent / "data" / "catalog.json"))
+
+
+class Destination(NamedTuple):
+    # NamedTuple 은 __slots__ = () 라서 레코드당 메모리가 tuple 과 같다.
+    # 기존 코드의 (도시, 나라, 위도, 경도) 튜플 언패킹/인덱싱도 그대로 동작
+    city: str
+    country: str
+    lat: float
+    lon: float
+
+
+class MbtiProfile(NamedTuple):
+    style: str
+    description: str
+    activities: tuple
+    destinations: tuple  # Destination 들
+
+
+class Catalog:
+    # 인덱스는 parse_catalog 가 만들어 넘긴다 (키 → 목적지 번호 tuple)
+    def __init__(self, destinations, images, types, by_mbti, by_country, by_city, mbti_of):
+        self.destinations = destinations
+        self.images = images
+        self.types = types
+        self.by_mbti = by_mbti
+        self.by_country = by_country
+        self.by_city = by_city
+        self.mbti_of = mbti_of  # 목적지 번호 → 이 목적지를 추천하는 MBTI 유형들
+
+    def __len__(self):
+        return len(self.destinations)
+
+    # 위/경도 NumPy 컬럼 (거리 계산·지도용). numpy import 는 처음 접근할 때
+    @cached_property
+    def lat(self):
+        import numpy as np
+        return np.fromiter((d.lat for d in self.destinations), dtype=np.float64, count=len(self.destinations))
+
+    @cached_property
+    def lon(self):
+        import numpy as np
+        return np.fromiter((d.lon for d in self.destinations), dtype=np.float64, count=len(self.destinations))
+
+    # 공간 인덱스 (spatial.GridIndex) — 처음 쓸 때 한 번 만든다
+    @cached_property
+    def spatial(self):
+        from spatial import GridIndex
+        return GridIndex(self.lat, self.lon)
+
+    # 유형 유사도 인덱스 (similarity.SimilarityIndex) — 처음 쓸 때 한 번 만든다
+    @cached_property
+    def similarity(self):
+        from similarity import build_similarity
+        return build_similarity({t: (p.style, p.description, p.activities, self.by_mbti[t])
+                                 for t, p in self.types.items()})
+
+    @cached_property
+    def _id_of(self):
+        return {d: i for i, d in enumerate(self.destinations)}
+
+    def index_of(self, dest):
+        return self._id_of[Destination(*dest)]
+
+    def nearby(self, dest, k=5, exclude=()):
+        # dest 에서 가까운 다른 목적지 k개 → [(Destination, 거리km, 추천 MBTI 유형들)]
+        ex = [self.index_of(d) for d in (dest, *exclude)]
+        idx, dist = self.spatial.nearest(dest[2], dest[3], k, exclude=ex)
+        return [(self.destinations[i], float(km), self.mbti_of[i]) for i, km in zip(idx, dist)]
+
+    def within(self, lat, lon, radius_km):
+        idx, dist = self.spatial.within(lat, lon, radius_km)
+        return [(self.destinations[i], float(km), self.mbti_of[i]) for i, km in zip(idx, dist)]
+
+    def mbti_types(self):
+        return sorted(self.types)
+
+    def for_mbti(self, mbti):
+        return self.types[mbti].destinations
+
+    def in_country(self, country):
+        return [self.destinations[i] for i in self.by_country.get(country, ())]
+
+    def find_city(self, city):
+        return [self.destinations[i] for i in self.by_city.get(city, ())]
+
+    def as_data(self):
+        # 예전 DATA 딕셔너리 모양 (기존 코드 호환용)
+        return {t: {"style": p.style, "description": p.description,
+                    "destinations": list(p.destinations), "activities": list(p.activities)}
+                for t, p in self.types.items()}
+
+
+def _s(value):
+    return sys.intern(str(value))
+
+
+def parse_catalog(raw):
+    # 목적지 한 바퀴: 레코드 + 사진 + 나라/도시 인덱스
+    # (10만 건 단위라 루프 안은 지역 변수와 C 구현 호출만: Destination 은 tuple.__new__ 로 바로 만든다)
+    intern, new = sys.intern, tuple.__new__
+    destinations, images, by_country, by_city = [], {}, {}, {}
+    for i, d in enumerate(raw["destinations"]):
+        city, country = str(d["city"]), intern(str(d["country"]))
+        destinations.append(new(Destination, (city, country, float(d["lat"]), float(d["lon"]))))
+        if d.get("image"):
+            images[city] = d["image"]
+        ids = by_country.get(country)
+        if ids is None:
+            by_country[country] = [i]
+        else:
+            ids.append(i)
+        by_city[city] = by_city[city] + (i,) if city in by_city else (i,)  # 같은 도시 이름은 드물다
+    by_country = {k: tuple(v) for k, v in by_country.items()}
+
+    # 유형 한 바퀴: 프로필 + MBTI 인덱스 + 목적지 → 유형들
+    n = len(destinations)
+    types, by_mbti, mbti_of = {}, {}, [()] * n
+    for t, info in raw["types"].items():
+        t = _s(t)
+        ids = tuple(map(int, info["destinations"]))
+        if ids and (min(ids) < 0 or max(ids) >= n):
+            raise ValueError(f"{t}: 존재하지 않는 목적지 번호 {list(ids)}")
+        by_mbti[t] = ids
+        types[t] = MbtiProfile(_s(info["style"]), info["description"],
+                               tuple(_s(a) for a in info["activities"]),
+                               tuple(map(destinations.__getitem__, ids)))
+        for i in ids:
+            mbti_of[i] += (t,)
+    # 유형 조합은 몇백 가지뿐이라 같은 조합은 같은 tuple 객체를 공유
+    shared = {}
+    mbti_of = [shared.setdefault(ts, ts) for ts in mbti_of]
+    return Catalog(destinations, images, types, by_mbti, by_country, by_city, mbti_of)
+
+
+def load_catalog(path=DEFAULT_PATH):
+    # 수십만 개 객체를 한 번에 만드는 동안 순환 GC 가 같은 객체들을 몇 번이고 훑지 않도록 잠시 끈다
+    # (순환 참조를 만들지 않으므로 끝나고 다시 켜기만 하면 된다)
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, encoding="utf-8") as f:
+            return parse_catalog(json.load(f))
+    finally:
+        if enabled:
+            gc.enable()
+
+
+_lock = threading.Lock()
+_catalogs = {}
+
+
+def get_catalog(path=DEFAULT_PATH):
+    # 프로세스당 한 번만 로드 (streamlit 재실행/여러 세션이 같은 객체를 공유)
+    path = str(path)
+    cat = _catalogs.get(path)
+    if cat is None:
+        with _lock:
+            cat = _catalogs.get(path)
+            if cat is None:
+                cat = _catalogs[path] = load_catalog(path)
+    return cat
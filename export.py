@@ -0,0 +1,227 @@
+# export.py
+# ⬇️ 일정 내보내기: CSV / Markdown / JSON / iCalendar(.ics) / ZIP 묶음
+#  - 다운로드 버튼을 누를 때만 바이트를 만든다 (st.download_button 의 data=callable)
+#  - 만든 결과는 (일정 내용 해시, 형식) 키로 프로세스 전역 LRU 캐시에 보관
+#  - Markdown 은 iterrows 대신 컬럼 단위 문자열 연산으로, JSON/ICS 는 청크 단위 스트리밍
+#  - 긴 일정: iter_stream 이 DataFrame 조각(DayTable.chunks)을 받아 형식별 bytes 조각을 바로 흘려보낸다
+# ---------------------------------------------------------------
+
+import hashlib
+import io
+import json
+import zipfile
+from datetime import datetime, timezone
+
+import metrics
+from lru import LRUCache
+
+FORMATS = {
+    # 형식: (확장자, MIME)
+    "csv": ("csv", "text/csv"),
+    "md": ("md", "text/markdown"),
+    "json": ("json", "application/json"),
+    "ics": ("ics", "text/calendar"),
+    "zip": ("zip", "application/zip"),
+}
+
+# 아침/오후/저녁 블록의 캘린더 시간 (현지 시간, 시작~끝)
+ICS_SLOTS = (("아침", "090000", "120000"), ("오후", "130000", "170000"), ("저녁", "180000", "210000"))
+
+_cache = LRUCache(maxsize=256)
+
+
+def itinerary_hash(df):
+    import pandas as pd
+
+    h = hashlib.sha1("|".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+# -----------------------------
+# 형식별 렌더러
+# -----------------------------
+def _md_blocks(df):
+    blocks = ("## " + df["일자"] + " · " + df["도시"] + " (" + df["국가"] + ")"
+              + "\n- " + df["아침"] + "\n- " + df["오후"] + "\n- " + df["저녁"]
+              + "\n- 🍽 " + df["식사"] + "\n")
+    return "\n".join(blocks.tolist())
+
+
+def df_to_markdown(df) -> str:
+    if df.empty:
+        return "# 여행 일정표\n"
+    return "# 여행 일정표\n\n" + _md_blocks(df)
+
+
+def iter_json(df, chunk_rows=1000):
+    # {"rows": [...]} 를 청크 단위 bytes 로 흘려보낸다 (전체 문자열을 한 번에 만들지 않음)
+    yield b'{"columns": ' + json.dumps(list(df.columns), ensure_ascii=False).encode("utf-8") + b', "rows": ['
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows].to_json(orient="records", force_ascii=False)[1:-1]
+        if part:
+            yield (b"," if start else b"") + part.encode("utf-8")
+    yield b"]}"
+
+
+def _ics_escape(col):
+    # 컬럼 전체를 한 번에 이스케이프 (\\ ; , 줄바꿈)
+    return (col.astype(str).str.replace("\\", "\\\\", regex=False).str.replace(";", "\\;", regex=False)
+            .str.replace(",", "\\,", regex=False).str.replace("\n", "\\n", regex=False)).tolist()
+
+
+def _ics_fold(line):
+    # RFC 5545: 한 줄 75 옥텟 이하, 이어지는 줄은 공백으로 시작 (UTF-8 문자 중간에서 자르지 않음)
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line + "\r\n"
+    out, cur, limit = [], b"", 75
+    for ch in line:
+        b = ch.encode("utf-8")
+        if len(cur) + len(b) > limit:
+            out.append(cur)
+            cur, limit = b"", 74
+        cur += b
+    out.append(cur)
+    return "\r\n ".join(x.decode("utf-8") for x in out) + "\r\n"
+
+
+_ICS_HEAD = ("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//mbti-travel//itinerary//KO\r\n"
+             "CALSCALE:GREGORIAN\r\n").encode("utf-8")
+_ICS_TAIL = b"END:VCALENDAR\r\n"
+
+
+def _ics_stamp():
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_events(df, uid_prefix, stamp, offset=0):
+    # df 의 행마다 VEVENT 3개 (UID 의 번호는 전체 일정 기준 offset + i)
+    days = df["일자"].astype(str).str.replace("-", "", regex=False).tolist()
+    where = _ics_escape(df["도시"].astype(str) + ", " + df["국가"].astype(str))
+    meals = _ics_escape(df["식사"])
+    slots = [(_ics_escape(df[slot]), t0, t1) for slot, t0, t1 in ICS_SLOTS]
+    lines = []
+    for i in range(len(df)):
+        for summary, t0, t1 in slots:
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{uid_prefix}-{offset + i}-{t0[:2]}@mbti-travel",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART:{days[i]}T{t0}",
+                f"DTEND:{days[i]}T{t1}",
+                f"SUMMARY:{summary[i]}",
+                f"LOCATION:{where[i]}",
+                f"DESCRIPTION:{meals[i]}",
+                "END:VEVENT",
+            ]
+    return "".join(map(_ics_fold, lines)).encode("utf-8")
+
+
+def iter_ics(df, uid_prefix=None, chunk_rows=200):
+    # 하루의 아침/오후/저녁 블록마다 VEVENT 하나
+    uid_prefix = uid_prefix or itinerary_hash(df)[:12]
+    stamp = _ics_stamp()
+    yield _ICS_HEAD
+    for start in range(0, len(df), chunk_rows):
+        yield _ics_events(df.iloc[start:start + chunk_rows], uid_prefix, stamp, start)
+    yield _ICS_TAIL
+
+
+def iter_stream(chunks, fmt, uid_prefix="trip"):
+    """DataFrame 조각들(같은 컬럼, 일정 순서대로) → 형식별 bytes 조각. 한 번에 한 조각만 메모리에."""
+    first = True
+    offset = 0
+    if fmt == "ics":
+        stamp = _ics_stamp()
+        yield _ICS_HEAD
+    for df in chunks:
+        if fmt == "csv":
+            yield df.to_csv(index=False, header=first).encode("utf-8-sig" if first else "utf-8")
+        elif fmt == "md":
+            if len(df):
+                yield (("# 여행 일정표\n\n" if first else "\n") + _md_blocks(df)).encode("utf-8")
+            else:
+                continue
+        elif fmt == "json":
+            if first:
+                yield (b'{"columns": ' + json.dumps(list(df.columns), ensure_ascii=False).encode("utf-8")
+                       + b', "rows": [')
+            part = df.to_json(orient="records", force_ascii=False)[1:-1]
+            if part:
+                yield (b"," if offset else b"") + part.encode("utf-8")
+        elif fmt == "ics":
+            yield _ics_events(df, uid_prefix, stamp, offset)
+        else:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        first = False
+        offset += len(df)
+    if fmt == "ics":
+        yield _ICS_TAIL
+    elif fmt == "json":
+        yield b'{"columns": [], "rows": []}' if first else b"]}"
+    elif fmt == "md" and first:
+        yield "# 여행 일정표\n".encode("utf-8")
+
+
+def _zip_bundle(parts, base_name):
+    # parts(fmt) → 그 형식의 bytes 조각들 (형식마다 새로 흘려보낸다)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for fmt in ("csv", "md", "json", "ics"):
+            ext = FORMATS[fmt][0]
+            with zf.open(f"{base_name}.{ext}", "w") as f:
+                for chunk in parts(fmt):
+                    f.write(chunk)
+    return buf.getvalue()
+
+
+def _chunks(df, fmt):
+    if fmt == "csv":
+        yield df.to_csv(index=False).encode("utf-8-sig")
+    elif fmt == "md":
+        yield df_to_markdown(df).encode("utf-8")
+    elif fmt == "json":
+        yield from iter_json(df)
+    elif fmt == "ics":
+        yield from iter_ics(df)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+
+def render(df, fmt, base_name="여행일정"):
+    with metrics.span(f"export.{fmt}"):
+        if fmt == "zip":
+            return _zip_bundle(lambda f: _chunks(df, f), base_name)
+        return b"".join(_chunks(df, fmt))
+
+
+def export_bytes(df, fmt, base_name="여행일정", key=None):
+    # 같은 일정(내용 해시) + 형식이면 캐시된 바이트를 돌려준다
+    key = (key or itinerary_hash(df), fmt, base_name)
+    return _cache.get_or_build(key, lambda: render(df, fmt, base_name))
+
+
+def lazy(df, fmt, base_name="여행일정", key=None):
+    # st.download_button(data=...) 에 넘길 콜백: 클릭했을 때만 export_bytes 실행
+    return lambda: export_bytes(df, fmt, base_name, key)
+
+
+def stream_bytes(make_chunks, fmt, key, base_name="여행일정"):
+    # 긴 일정: make_chunks() 가 DataFrame 조각을 새로 흘려보내는 함수. key 는 일정 식별자 (조각을 다 보기 전에 캐시 확인)
+    def build():
+        with metrics.span(f"export.stream.{fmt}"):
+            uid = hashlib.sha1(str(key).encode("utf-8")).hexdigest()[:12]
+            if fmt == "zip":
+                return _zip_bundle(lambda f: iter_stream(make_chunks(), f, uid), base_name)
+            return b"".join(iter_stream(make_chunks(), fmt, uid))
+
+    return _cache.get_or_build(("stream", key, fmt, base_name), build)
+
+
+def lazy_stream(make_chunks, fmt, key, base_name="여행일정"):
+    return lambda: stream_bytes(make_chunks, fmt, key, base_name)
+
+
+def cache_stats():
+    return _cache.stats()
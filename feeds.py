@@ -0,0 +1,302 @@
+# feeds.py
+# 📰 여행 뉴스 수집: RSS/Atom 피드 → 기사 본문 → 카탈로그 도시별 최신 기사
+#  - 피드 목록/도시 별칭은 data/feeds.json (FEEDS_CONFIG 로 변경)
+#  - 스레드 풀로 피드를 동시에 가져오고, ETag / Last-Modified 조건부 요청 (304 면 파싱도 생략)
+#  - 새 기사만 본문 추출 (readability → BeautifulSoup 텍스트), URL 해시로 중복 제거
+#  - 제목/요약/본문에 나온 도시 이름(한글 + 영문 별칭)으로 도시에 연결
+#  - 결과는 .cache/feeds/ 에 저장하고, 화면은 메모리의 도시별 tuple 만 읽는다 (수집 중에도 대기 없음)
+#  - fetcher 는 교체 가능: fetcher(url, headers) → Response (테스트/벤치마크는 로컬 HTTP 서버)
+#  - FEEDS_OFFLINE=1 이면 수집 없이 저장된 기사만 표시 (네트워크를 쓰면 안 되는 테스트/벤치마크용)
+# feedparser / readability / bs4 / dateutil 은 실제로 수집할 때만 import
+# ---------------------------------------------------------------
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit, urlunsplit
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_CONFIG = os.environ.get("FEEDS_CONFIG", str(ROOT / "data" / "feeds.json"))
+DEFAULT_DIR = os.environ.get("FEEDS_CACHE_DIR", str(ROOT / ".cache" / "feeds"))
+OFFLINE = os.environ.get("FEEDS_OFFLINE", "0") == "1"
+REFRESH_INTERVAL = float(os.environ.get("FEEDS_REFRESH_INTERVAL", "900"))
+USER_AGENT = "mbti-travel/1.0 (travel news reader)"
+# 가져오기 실패: URLError/HTTPError/타임아웃은 OSError, 잘린 응답(IncompleteRead 등)은 HTTPException
+FETCH_ERRORS = (OSError, ValueError, http.client.HTTPException)
+MAX_ARTICLES = 2000      # 저장해 두는 기사 수 (오래된 것부터 버림)
+MAX_NEW_PER_FEED = 30    # 한 번에 본문을 받아올 새 기사 수 (피드당)
+SUMMARY_CHARS = 280
+
+
+class Response(NamedTuple):
+    status: int
+    headers: dict   # 소문자 키
+    body: bytes
+
+
+def urllib_fetcher(url, headers=None, timeout=10):
+    # 기본 fetcher. 304 는 예외가 아니라 Response 로 돌려준다
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return Response(resp.status, {k.lower(): v for k, v in resp.headers.items()}, resp.read())
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return Response(304, {k.lower(): v for k, v in e.headers.items()}, b"")
+        raise
+
+
+def normalize_url(url):
+    # 프래그먼트/공백 제거, scheme/host 소문자 → 같은 기사면 같은 해시
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def url_hash(url):
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()[:16]
+
+
+def html_to_text(html):
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+
+
+def extract_text(html):
+    # 본문 영역만 (readability) → 텍스트. 실패하면 전체 텍스트
+    from readability import Document
+
+    try:
+        return html_to_text(Document(html).summary(html_partial=True))
+    except Exception:  # readability 는 깨진 HTML 에서 여러 예외를 낸다
+        return html_to_text(html)
+
+
+def published_iso(entry):
+    if entry.get("published_parsed") or entry.get("updated_parsed"):
+        t = entry.get("published_parsed") or entry.get("updated_parsed")
+        return datetime(*t[:6], tzinfo=timezone.utc).isoformat()
+    raw = entry.get("published") or entry.get("updated")
+    if raw:
+        from dateutil import parser as dateparser
+
+        try:
+            return dateparser.parse(raw).astimezone(timezone.utc).isoformat()
+        except (ValueError, OverflowError):
+            pass
+    return datetime.now(timezone.utc).isoformat()
+
+
+class CityMatcher:
+    # 한글 이름(두 글자 이상)은 부분 문자열, 영문 별칭은 단어 경계 + 대소문자 무시
+    def __init__(self, cities, aliases=None):
+        aliases = aliases or {}
+        names = {}
+        for city in cities:
+            for name in ([city] if len(city) > 1 else []) + list(aliases.get(city, ())):
+                names[name.lower()] = city
+        latin = sorted((n for n in names if n.isascii()), key=len, reverse=True)
+        other = sorted((n for n in names if not n.isascii()), key=len, reverse=True)
+        parts = []
+        if latin:
+            parts.append(r"\b(?:" + "|".join(map(re.escape, latin)) + r")\b")
+        if other:
+            parts.append("|".join(map(re.escape, other)))
+        self._names = names
+        self._re = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+    def match(self, text):
+        """텍스트 → 언급된 도시들 (많이 나온 순)."""
+        if self._re is None or not text:
+            return []
+        counts = {}
+        for m in self._re.finditer(text):
+            city = self._names[m.group(0).lower()]
+            counts[city] = counts.get(city, 0) + 1
+        return sorted(counts, key=lambda c: -counts[c])
+
+
+def load_config(path=DEFAULT_CONFIG):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"feeds": [], "aliases": {}}
+
+
+class FeedIngestor:
+    def __init__(self, feeds, matcher, cache_dir=DEFAULT_DIR, fetcher=urllib_fetcher, workers=8,
+                 extract=True, offline=OFFLINE):
+        self.feeds = list(feeds)          # [{"name", "url"}]
+        self.matcher = matcher
+        self.dir = Path(cache_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.fetcher = fetcher
+        self.workers = workers
+        self.extract = extract
+        self.offline = offline
+        self._lock = threading.Lock()     # run_once 는 한 번에 하나
+        self._state = self._load("state.json")        # 피드 url → {"etag", "last_modified"}
+        self._articles = self._load("articles.json")  # url 해시 → 기사 dict
+        self._by_city = {}
+        self._rebuild()
+        self._thread = None
+        self.stats = {"runs": 0, "fetched": 0, "not_modified": 0, "failed": 0, "bytes": 0,
+                      "new": 0, "duplicate": 0, "extract_failed": 0, "errors": 0, "last_error": None,
+                      "last_run_s": None}
+
+    # ---- 저장 (image_cache 와 같은 방식: 임시 파일 → rename)
+    def _load(self, name):
+        try:
+            return json.loads((self.dir / name).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self, name, obj):
+        path = self.dir / name
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ---- 읽기 (화면): 잠금 없이 현재 dict 참조만
+    def articles_for(self, city, limit=3):
+        return self._by_city.get(city, ())[:limit]
+
+    def hit_rate(self):
+        total = self.stats["fetched"] + self.stats["not_modified"]
+        return self.stats["not_modified"] / total if total else 0.0
+
+    def _rebuild(self):
+        by_city = {}
+        for art in sorted(self._articles.values(), key=lambda a: a["published"], reverse=True):
+            for city in art["cities"]:
+                by_city.setdefault(city, []).append(art)
+        self._by_city = {c: tuple(arts) for c, arts in by_city.items()}  # 참조 교체 한 번
+
+    # ---- 수집
+    def _poll(self, feed):
+        # 피드 하나: 조건부 GET → 새 항목 목록 (304/실패면 빈 목록)
+        import feedparser
+
+        url = feed["url"]
+        prev = self._state.get(url, {})
+        headers = {}
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("last_modified"):
+            headers["If-Modified-Since"] = prev["last_modified"]
+        try:
+            resp = self.fetcher(url, headers)
+        except FETCH_ERRORS as e:
+            return {"url": url, "status": "failed", "error": str(e), "entries": []}
+        if resp.status == 304:
+            return {"url": url, "status": "not_modified", "entries": []}
+        parsed = feedparser.parse(resp.body)
+        state = {"etag": resp.headers.get("etag"), "last_modified": resp.headers.get("last-modified")}
+        entries = []
+        for e in parsed.entries:
+            link = e.get("link")
+            if link:
+                entries.append({"url": link, "hash": url_hash(link), "title": e.get("title", ""),
+                                "summary": e.get("summary", ""), "published": published_iso(e),
+                                "feed": feed.get("name") or url})
+        return {"url": url, "status": "fetched", "bytes": len(resp.body), "state": state, "entries": entries}
+
+    def _article(self, entry):
+        text = html_to_text(entry["summary"]) if entry["summary"] else ""
+        body, failed = "", False
+        if self.extract:
+            try:
+                resp = self.fetcher(entry["url"], {})
+                if resp.status == 200:
+                    body = extract_text(resp.body.decode("utf-8", "replace"))
+            except FETCH_ERRORS:
+                failed = True
+        cities = self.matcher.match(" ".join((entry["title"], text, body)))
+        return {"id": entry["hash"], "url": entry["url"], "title": entry["title"],
+                "summary": (text or body)[:SUMMARY_CHARS], "published": entry["published"],
+                "feed": entry["feed"], "cities": cities}, failed
+
+    def run_once(self):
+        """모든 피드를 한 번 수집. 이번 실행 통계를 돌려준다."""
+        if self.offline or not self.feeds:
+            return {}
+        with self._lock:
+            t0 = time.perf_counter()
+            run = {"fetched": 0, "not_modified": 0, "failed": 0, "bytes": 0, "new": 0, "duplicate": 0,
+                   "extract_failed": 0}
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                polled = list(pool.map(self._poll, self.feeds))
+                fresh, seen = [], set(self._articles)
+                for p in polled:
+                    run[p["status"]] += 1
+                    run["bytes"] += p.get("bytes", 0)
+                    if p["status"] == "fetched":
+                        self._state[p["url"]] = p["state"]
+                    new_here = 0
+                    for e in p["entries"]:
+                        if e["hash"] in seen:
+                            run["duplicate"] += 1
+                        elif new_here < MAX_NEW_PER_FEED:
+                            seen.add(e["hash"])
+                            fresh.append(e)
+                            new_here += 1
+                for art, failed in pool.map(self._article, fresh):
+                    self._articles[art["id"]] = art
+                    run["new"] += 1
+                    run["extract_failed"] += failed
+            if len(self._articles) > MAX_ARTICLES:
+                keep = sorted(self._articles.values(), key=lambda a: a["published"], reverse=True)[:MAX_ARTICLES]
+                self._articles = {a["id"]: a for a in keep}
+            self._rebuild()
+            self._save("state.json", self._state)
+            self._save("articles.json", self._articles)
+            run["seconds"] = time.perf_counter() - t0
+            for k, v in run.items():
+                if k != "seconds":
+                    self.stats[k] += v
+            self.stats["runs"] += 1
+            self.stats["last_run_s"] = run["seconds"]
+            return run
+
+    def start(self, interval=REFRESH_INTERVAL):
+        # 백그라운드에서 주기적으로 수집 (프로세스당 한 번 호출)
+        if self._thread is None and not self.offline and self.feeds:
+            def loop():
+                while True:
+                    try:
+                        self.run_once()
+                    except Exception as e:  # 한 번 실패해도 수집 스레드는 계속
+                        self.stats["errors"] += 1
+                        self.stats["last_error"] = f"{type(e).__name__}: {e}"
+                    time.sleep(interval)
+
+            self._thread = threading.Thread(target=loop, name="feed-ingest", daemon=True)
+            self._thread.start()
+        return self
+
+
+def default_ingestor(config_path=DEFAULT_CONFIG, **kwargs):
+    # 카탈로그 도시 + data/feeds.json 설정으로 만든 수집기
+    from catalog import get_catalog
+
+    config = load_config(config_path)
+    matcher = CityMatcher([d.city for d in get_catalog().destinations], config.get("aliases"))
+    return FeedIngestor(config.get("feeds", []), matcher, **kwargs)
+
+
+if __name__ == "__main__":
+    # python feeds.py → 한 번 수집하고 통계 출력
+    ing = default_ingestor(offline=False)
+    print(ing.run_once())
+    print(f"hit rate {ing.hit_rate():.0%}, 도시 {len(ing._by_city)}곳")
@@ -0,0 +1,153 @@
+# image_cache.py
+# 🖼 도시 대표 이미지 로컬 프록시 + 썸네일 캐시
+# 원본은 한 번만 내려받아 리사이즈한 WebP(불가 시 JPEG)로 디스크에 저장하고,
+# 이후로는 로컬 바이트를 그대로 st.image 에 넘긴다. 캐시에 없으면 원본 URL 을 넘기지 않고
+# fetch_async 로 백그라운드에서 받아 두고 (화면은 자리 표시만) 다음 재실행부터 썸네일을 쓴다.
+# 파일 이름은 썸네일 바이트의 sha256 (내용 주소 방식), url → 파일은 index.json 에 기록
+# ---------------------------------------------------------------
+
+import hashlib
+import io
+import json
+import os
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_DIR = os.environ.get("IMAGE_CACHE_DIR", str(Path(__file__).resolve().parent / ".cache" / "images"))
+OFFLINE = os.environ.get("IMAGE_OFFLINE", "0") == "1"
+USER_AGENT = "mbti-travel/1.0 (image thumbnail cache)"
+
+
+def urllib_fetcher(url, timeout=10):
+    # 기본 fetcher: url → 원본 바이트 (테스트에선 로컬 HTTP 서버 주소나 가짜 함수로 교체)
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.read()
+
+
+def make_thumbnail(raw, max_size=(800, 600), quality=80):
+    # Pillow 는 실제로 썸네일을 만들 때만 필요 (캐시 적중 경로에선 import 안 함)
+    from PIL import Image, features
+
+    img = Image.open(io.BytesIO(raw))
+    img.thumbnail(max_size)
+    out = io.BytesIO()
+    if features.check("webp"):
+        img.save(out, "WEBP", quality=quality, method=4)
+        return out.getvalue(), ".webp"
+    img.convert("RGB").save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+    return out.getvalue(), ".jpg"
+
+
+class ImageCache:
+    def __init__(self, cache_dir=DEFAULT_DIR, fetcher=urllib_fetcher, max_size=(800, 600),
+                 quality=80, offline=OFFLINE):
+        self.dir = Path(cache_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.fetcher = fetcher
+        self.max_size = max_size
+        self.quality = quality
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._index_path = self.dir / "index.json"
+        self._index = self._load_index()
+        self._pending = set()  # 받는 중인 url (fetch_async 중복 방지)
+        self._pool = None
+        self.stats = {"hits": 0, "misses": 0, "fetched": 0, "failed": 0}
+
+    def _load_index(self):
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self):
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일 → rename
+        tmp = self._index_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self._index, ensure_ascii=False, indent=0), encoding="utf-8")
+        os.replace(tmp, self._index_path)
+
+    def _path(self, name):
+        return self.dir / name[:2] / name
+
+    def cached(self, url):
+        name = self._index.get(url)
+        return name is not None and self._path(name).exists()
+
+    def get(self, url, fetch=True):
+        # 캐시에 있으면 로컬 바이트, 없으면 (온라인 + fetch=True 일 때) 받아서 저장. 실패 시 None
+        name = self._index.get(url)
+        if name is not None:
+            try:
+                data = self._path(name).read_bytes()
+                with self._lock:
+                    self.stats["hits"] += 1
+                return data
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self.stats["misses"] += 1
+        if self.offline or not fetch:
+            return None
+        return self._fetch(url)
+
+    def _fetch(self, url):
+        try:
+            thumb, ext = make_thumbnail(self.fetcher(url), self.max_size, self.quality)
+        except Exception:
+            with self._lock:
+                self.stats["failed"] += 1
+            return None
+        name = hashlib.sha256(thumb).hexdigest() + ext
+        path = self._path(name)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(thumb)
+            os.replace(tmp, path)
+        with self._lock:
+            self._index[url] = name
+            self._save_index()
+            self.stats["fetched"] += 1
+        return thumb
+
+    def fetch_async(self, url):
+        # 캐시에 없고 받는 중도 아니면 백그라운드 스레드 하나에서 받아둔다 (화면을 막지 않음)
+        if self.offline or self.cached(url):
+            return
+        with self._lock:
+            if url in self._pending:
+                return
+            self._pending.add(url)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="img-fetch")
+        self._pool.submit(self._fetch_pending, url)
+
+    def _fetch_pending(self, url):
+        try:
+            self._fetch(url)
+        finally:
+            with self._lock:
+                self._pending.discard(url)
+
+    def prefetch(self, urls, workers=8):
+        # 캐시에 없는 것만 스레드 풀로 동시에 받아둔다 → 실패한 url 목록 반환
+        todo = [u for u in dict.fromkeys(urls) if not self.cached(u)]
+        if self.offline or not todo:
+            return []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="img-prefetch") as pool:
+            results = list(pool.map(self._fetch, todo))
+        return [u for u, r in zip(todo, results) if r is None]
+
+
+if __name__ == "__main__":
+    # 배포 전 캐시 채우기: python image_cache.py
+    from travel_core import DEFAULT_IMAGES
+
+    cache = ImageCache()
+    failed = cache.prefetch(DEFAULT_IMAGES.values())
+    print(f"{len(DEFAULT_IMAGES) - len(failed)}/{len(DEFAULT_IMAGES)} 캐시됨 → {cache.dir}")
+    for url in failed:
+        print("실패:", url)
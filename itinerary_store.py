@@ -0,0 +1,197 @@
+# itinerary_store.py
+# 💾 생성한 여행 일정을 로컬 SQLite(WAL)에 저장/조회
+# 키: (mbti, 일수, 시작일, 도시 수, 시드)의 내용 해시 → ?trip=<id> 공유 링크로 사용
+# ---------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import date
+from pathlib import Path
+
+from travel_core import ITINERARY_VERSION
+
+DEFAULT_PATH = os.environ.get("ITINERARY_DB", str(Path(__file__).resolve().parent / ".cache" / "itineraries.db"))
+DEFAULT_MAX_ROWS = int(os.environ.get("ITINERARY_DB_MAX_ROWS", "50000"))
+EVICT_EVERY = 64  # 이만큼 쓸 때마다 한 번만 행 수를 센다 (그 사이 max_rows 를 최대 EVICT_EVERY-1 행 넘을 수 있음)
+# 읽은 시각(accessed_at)은 메모리에 모아 두었다가 이만큼 쌓이거나 쓰기/정리 때 한 번에 UPDATE
+# (읽기마다 WAL 쓰기를 하지 않도록. 프로세스가 죽으면 마지막 묶음은 잃지만 정리 순서에만 쓰는 값)
+ACCESS_FLUSH_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS itineraries (
+    id           TEXT PRIMARY KEY,
+    mbti         TEXT NOT NULL,
+    start_date   TEXT NOT NULL,
+    days         INTEGER NOT NULL,
+    dest_count   INTEGER NOT NULL,
+    seed         INTEGER NOT NULL,
+    destinations TEXT NOT NULL,
+    itinerary    TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    accessed_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_itineraries_mbti_date ON itineraries (mbti, start_date);
+CREATE INDEX IF NOT EXISTS idx_itineraries_accessed ON itineraries (accessed_at);
+"""
+
+
+def normalize_params(mbti, days, start_date, dest_count, seed):
+    if isinstance(start_date, date):
+        start_date = start_date.isoformat()
+    return {"mbti": str(mbti).upper(), "days": int(days), "start_date": str(start_date),
+            "dest_count": int(dest_count), "seed": int(seed)}
+
+
+def trip_id(mbti, days, start_date, dest_count, seed, blend=0):
+    # blend(비슷한 유형 섞기 비율)는 0 이 아닐 때만 키에 넣는다 → 기존 id 는 그대로
+    p = normalize_params(mbti, days, start_date, dest_count, seed)
+    key = f"v{ITINERARY_VERSION}|{p['mbti']}|{p['days']}|{p['start_date']}|{p['dest_count']}|{p['seed']}"
+    if blend:
+        key += f"|b{float(blend):g}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class ItineraryStore:
+    def __init__(self, path=DEFAULT_PATH, max_rows=DEFAULT_MAX_ROWS):
+        self.path = str(path)
+        self.max_rows = max_rows
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # sqlite 연결은 스레드 간 공유가 안 되므로 스레드마다 하나씩
+        self._local = threading.local()
+        self._read_ms = deque(maxlen=2000)
+        self._lock = threading.Lock()  # _read_ms / _unchecked_writes / _accessed (여러 세션 스레드가 함께 씀)
+        self._unchecked_writes = 0
+        self._accessed = {}  # id → 마지막으로 읽은 시각 (아직 DB 에 안 쓴 것)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -----------------------------
+    # 쓰기
+    # -----------------------------
+    @staticmethod
+    def _row(params, destinations, itinerary, now):
+        p = normalize_params(**params)
+        frame = itinerary.to_dict(orient="split", index=False)
+        return (trip_id(**p), p["mbti"], p["start_date"], p["days"], p["dest_count"], p["seed"],
+                json.dumps([list(d) for d in destinations], ensure_ascii=False),
+                json.dumps(frame, ensure_ascii=False), now, now)
+
+    def put(self, params, destinations, itinerary):
+        return self.put_many([(params, destinations, itinerary)])[0]
+
+    def put_many(self, records):
+        # records: (params, destinations, itinerary DataFrame) 반복 가능 객체 → 한 트랜잭션으로 저장
+        now = time.time()
+        rows = [self._row(p, d, df, now) for p, d, df in records]
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        conn = self._conn()
+        with conn:
+            # 모아 둔 읽은 시각도 같은 트랜잭션에 (다시 저장하는 일정은 아래 INSERT 의 now 가 이긴다)
+            self._write_access(conn, accessed)
+            conn.executemany("INSERT OR REPLACE INTO itineraries VALUES (?,?,?,?,?,?,?,?,?,?)", rows)
+        with self._lock:
+            self._unchecked_writes += len(rows)
+            due = self._unchecked_writes >= EVICT_EVERY
+            if due:
+                self._unchecked_writes = 0
+        if due:
+            self.evict()
+        return [r[0] for r in rows]
+
+    @staticmethod
+    def _write_access(conn, accessed):
+        if accessed:
+            conn.executemany("UPDATE itineraries SET accessed_at = ? WHERE id = ?",
+                             [(t, tid) for tid, t in accessed.items()])
+
+    def flush_access(self):
+        """모아 둔 읽은 시각을 DB 에 쓴다. 쓴 일정 수를 돌려준다."""
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        if accessed:
+            conn = self._conn()
+            with conn:
+                self._write_access(conn, accessed)
+        return len(accessed)
+
+    def evict(self):
+        # 최대 행 수를 넘으면 가장 오래 안 읽힌 일정부터 삭제 (모아 둔 읽은 시각을 먼저 반영)
+        self.flush_access()
+        conn = self._conn()
+        excess = conn.execute("SELECT COUNT(*) FROM itineraries").fetchone()[0] - self.max_rows
+        if excess <= 0:
+            return 0
+        with conn:
+            conn.execute("DELETE FROM itineraries WHERE id IN "
+                         "(SELECT id FROM itineraries ORDER BY accessed_at LIMIT ?)", (excess,))
+        return excess
+
+    # -----------------------------
+    # 읽기
+    # -----------------------------
+    def get(self, tid):
+        import pandas as pd
+
+        t0 = time.perf_counter()
+        conn = self._conn()
+        row = conn.execute("SELECT mbti, days, start_date, dest_count, seed, destinations, itinerary "
+                           "FROM itineraries WHERE id = ?", (tid,)).fetchone()
+        ms = (time.perf_counter() - t0) * 1000
+        with self._lock:
+            self._read_ms.append(ms)
+            if row is not None:
+                self._accessed[tid] = time.time()
+            due = len(self._accessed) >= ACCESS_FLUSH_EVERY
+        if due:
+            self.flush_access()
+        if row is None:
+            return None
+        mbti, days, start_date, dest_count, seed, dests, frame = row
+        frame = json.loads(frame)
+        return {
+            "id": tid,
+            "params": {"mbti": mbti, "days": days, "start_date": start_date,
+                       "dest_count": dest_count, "seed": seed},
+            "destinations": [tuple(d) for d in json.loads(dests)],
+            "itinerary": pd.DataFrame(frame["data"], columns=frame["columns"]),
+        }
+
+    def find(self, mbti, start_date=None, limit=50):
+        # (mbti, start_date) 인덱스를 타는 목록 조회
+        sql = "SELECT id, days, start_date, dest_count, seed FROM itineraries WHERE mbti = ?"
+        args = [str(mbti).upper()]
+        if start_date is not None:
+            sql += " AND start_date = ?"
+            args.append(start_date.isoformat() if isinstance(start_date, date) else str(start_date))
+        sql += " ORDER BY start_date LIMIT ?"
+        args.append(int(limit))
+        cols = ("id", "days", "start_date", "dest_count", "seed")
+        return [dict(zip(cols, r)) for r in self._conn().execute(sql, args)]
+
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM itineraries").fetchone()[0]
+
+    def read_latency(self):
+        with self._lock:
+            ms = sorted(self._read_ms)
+        if not ms:
+            return {"reads": 0}
+        pick = lambda q: ms[min(len(ms) - 1, int(q * len(ms)))]
+        return {"reads": len(ms), "p50_ms": pick(0.50), "p95_ms": pick(0.95),
+                "p99_ms": pick(0.99), "max_ms": ms[-1]}
@@ -1,184 +1,30 @@
 # mbti_travel.py
 # 🌏 MBTI 유형별 여행 추천 웹 (지도 + 일정 자동 생성, folium ↔ pydeck 자동대체)
-# 권장 패키지: streamlit, pandas, (선택) folium, streamlit-folium
+# 권장 패키지: streamlit, pandas, (선택) folium
 # ---------------------------------------------------------------
 
 import streamlit as st
-import pandas as pd
-from datetime import date, timedelta
-import random
+from datetime import date
+import threading
 
-# folium이 없으면 pydeck으로 대체
-try:
-    import folium
-    from streamlit_folium import st_folium
-    FOLIUM_AVAILABLE = True
-except ModuleNotFoundError:
-    import pydeck as pdk
-    FOLIUM_AVAILABLE = False
+import export
+import feeds
+import maps
+import metrics
+import panels
+import summarize
+from image_cache import ImageCache
+from itinerary_store import ItineraryStore, trip_id
+from maps import FOLIUM_AVAILABLE
+from route import plan_route, visited_route
+from travel_core import CATALOG, DATA, DEFAULT_IMAGES, DayTable, TripSummary, sample_destinations, trip_rng
 
-st.set_page_config(page_title="MBTI 여행 추천", page_icon="🌏", layout="wide")
-
-# -----------------------------
-# 데이터: 16개 MBTI 유형별 추천
-# 각 목적지는 (도시, 나라, 위도, 경도)
-# -----------------------------
-DATA = {
-    "INTJ": {
-        "style": "조용하고 깊이 있는 문화 탐방",
-        "description": "깊이 있는 역사·건축·서점·박물관을 사랑하는 INTJ에게 잘 맞는 여행.",
-        "destinations": [("교토", "일본", 35.0116, 135.7681),
-                         ("프라하", "체코", 50.0755, 14.4378),
-                         ("피렌체", "이탈리아", 43.7696, 11.2558)],
-        "activities": ["현지 서점·전통 찻집에서 사색", "건축 투어 및 박물관 관람",
-                       "한적한 골목 사진 산책", "사원/성당의 아침 방문", "클래식 공연 감상"],
-    },
-    "INTP": {
-        "style": "지적 호기심 충족, 차분한 도시 산책",
-        "description": "학문과 과학, 사색의 리듬을 유지할 수 있는 곳 위주.",
-        "destinations": [("탈린", "에스토니아", 59.4370, 24.7536),
-                         ("케임브리지", "영국", 52.2053, 0.1218),
-                         ("취리히", "스위스", 47.3769, 8.5417)],
-        "activities": ["대학 캠퍼스/박물관 탐방", "과학·기술 전시 관람", "강변 산책과 스케치",
-                       "현지 카페에서 독서", "현지 도서관·아카이브 체험"],
-    },
-    "ENTJ": {
-        "style": "효율적인 도시 정복, 비즈·모던 컬처",
-        "description": "대도시의 속도감, 랜드마크와 미식, 깔끔한 동선.",
-        "destinations": [("싱가포르", "싱가포르", 1.3521, 103.8198),
-                         ("뉴욕", "미국", 40.7128, -74.0060),
-                         ("베를린", "독일", 52.5200, 13.4050)],
-        "activities": ["주요 랜드마크 전광석화 투어", "루프탑/미쉐린 미식", "현대미술관·전시 관람",
-                       "야경 스카이라인 감상", "효율 루트 지하철 마스터"],
-    },
-    "ENTP": {
-        "style": "새로움·아이디어 폭발, 트렌디 실험",
-        "description": "변화를 즐기며 신박한 체험과 대화가 많은 동선.",
-        "destinations": [("도쿄", "일본", 35.6762, 139.6503),
-                         ("텔아비브", "이스라엘", 32.0853, 34.7818),
-                         ("샌프란시스코", "미국", 37.7749, -122.4194)],
-        "activities": ["스타트업 거리/메이커스페이스 방문", "이색 테마 카페 투어", "언더그라운드 전시/공연",
-                       "골목 상점 탐험", "현지인 토론 모임·밋업"],
-    },
-    "INFJ": {
-        "style": "영감을 주는 고요함, 풍경·사색",
-        "description": "평화로운 풍경과 깊은 이야기의 여정.",
-        "destinations": [("산토리니", "그리스", 36.3932, 25.4615),
-                         ("레이캬비크", "아이슬란드", 64.1466, -21.9426),
-                         ("블레드호", "슬로베니아", 46.3692, 14.1136)],
-        "activities": ["일출/일몰 명소 사색", "자연 속 명상 산책", "현지 예술가 갤러리 방문",
-                       "온천/스파 힐링", "작은 마을 책방 찾기"],
-    },
-    "INFP": {
-        "style": "감성 충만 스토리 여행",
-        "description": "문학·감성 카페·골목 이야기로 채우는 루트.",
-        "destinations": [("에든버러", "영국", 55.9533, -3.1883),
-                         ("류블랴나", "슬로베니아", 46.0569, 14.5058),
-                         ("치앙마이", "태국", 18.7883, 98.9853)],
-        "activities": ["문학 명소·중고서점 투어", "수공예 워크숍 체험", "현지 카페·디저트 성지순례",
-                       "골목 사진 산책", "자선 마켓/커뮤니티 방문"],
-    },
-    "ENFJ": {
-        "style": "사람 중심, 따뜻한 도시 경험",
-        "description": "커뮤니티·공공공간·로컬 스토리가 풍부한 곳.",
-        "destinations": [("서울", "대한민국", 37.5665, 126.9780),
-                         ("밴쿠버", "캐나다", 49.2827, -123.1207),
-                         ("코펜하겐", "덴마크", 55.6761, 12.5683)],
-        "activities": ["로컬 마켓·플리마켓 탐방", "커뮤니티 센터 프로그램 참여", "도시 공원 피크닉",
-                       "사회적기업 카페 방문", "디자인/건축 투어"],
-    },
-    "ENFP": {
-        "style": "활발한 체험 + 다문화 교류",
-        "description": "자유로운 에너지와 축제, 거리의 컬러.",
-        "destinations": [("바르셀로나", "스페인", 41.3851, 2.1734),
-                         ("방콕", "태국", 13.7563, 100.5018),
-                         ("리우데자네이루", "브라질", -22.9068, -43.1729)],
-        "activities": ["길거리 공연/축제 즐기기", "현지 요리 클래스", "자유 일정으로 골목 탐험",
-                       "비치/루프탑 라운지", "현지 친구 사귀기 미션"],
-    },
-    "ISTJ": {
-        "style": "질서정연한 클래식 여행",
-        "description": "정확한 동선·시간표·클래식 명소 중심.",
-        "destinations": [("빈", "오스트리아", 48.2082, 16.3738),
-                         ("뮌헨", "독일", 48.1351, 11.5820),
-                         ("코펜하겐", "덴마크", 55.6761, 12.5683)],
-        "activities": ["정시 출발 시티투어", "고전 음악회 감상", "왕궁/궁전 견학",
-                       "전통 레스토랑 예약 식사", "유명 박물관 라인업"],
-    },
-    "ISFJ": {
-        "style": "아늑·정갈, 동화 같은 도시",
-        "description": "안정감과 따뜻한 풍경, 소박한 감동.",
-        "destinations": [("브뤼헤", "벨기에", 51.2093, 3.2247),
-                         ("잘츠부르크", "오스트리아", 47.8095, 13.0550),
-                         ("퀘벡시티", "캐나다", 46.8139, -71.2080)],
-        "activities": ["마차/운하 보트 체험", "크리스마스/시즌 마켓", "현지 가정식/비스트로",
-                       "작은 박물관·공방 방문", "한적한 공원 산책"],
-    },
-    "ESTJ": {
-        "style": "탄탄한 랜드마크 중심 대도시",
-        "description": "정리된 체크리스트로 핵심만 꽉.",
-        "destinations": [("런던", "영국", 51.5074, -0.1278),
-                         ("홍콩", "홍콩", 22.3193, 114.1694),
-                         ("시카고", "미국", 41.8781, -87.6298)],
-        "activities": ["필수 랜드마크 체크", "강력 미식 스폿 예약", "뮤지컬/콘서트 관람",
-                       "리버 크루즈", "스카이덱·전망대"],
-    },
-    "ESFJ": {
-        "style": "사교적·따뜻한 휴식형 도시",
-        "description": "친화력 높고 편의 좋은 곳에서 여유롭게.",
-        "destinations": [("파리", "프랑스", 48.8566, 2.3522),
-                         ("시드니", "호주", -33.8688, 151.2093),
-                         ("타이베이", "대만", 25.0330, 121.5654)],
-        "activities": ["브런치 카페·마카롱 투어", "아이코닉 포토스팟", "강변/해변 산책",
-                       "플리마켓·백화점 쇼핑", "야간 라이트업 명소"],
-    },
-    "ISTP": {
-        "style": "자연·액티비티 중심",
-        "description": "야외활동과 도전, 드라이브 루트.",
-        "destinations": [("퀸스타운", "뉴질랜드", -45.0312, 168.6626),
-                         ("인터라켄", "스위스", 46.6863, 7.8632),
-                         ("트롬쇠", "노르웨이", 69.6492, 18.9553)],
-        "activities": ["하이킹/패러글라이딩", "빙하·호수 투어", "오로라/별 보기",
-                       "자전거/카약", "산악 열차 타기"],
-    },
-    "ISFP": {
-        "style": "예술감성·자연 치료",
-        "description": "자연과 예술이 공존하는 여유로운 코스.",
-        "destinations": [("우붓", "인도네시아 발리", -8.5069, 115.2625),
-                         ("리스본", "포르투갈", 38.7223, -9.1393),
-                         ("호이안", "베트남", 15.8801, 108.3380)],
-        "activities": ["요가/명상 리트릿", "현지 공예 워크숍", "해변 일몰 감상",
-                       "소규모 라이브 공연", "전통시장 미식"],
-    },
-    "ESTP": {
-        "style": "스릴·놀이·이벤트",
-        "description": "짜릿한 액티비티와 야간 엔터테인먼트.",
-        "destinations": [("라스베이거스", "미국", 36.1699, -115.1398),
-                         ("두바이", "아랍에미리트", 25.2048, 55.2708),
-                         ("칸쿤", "멕시코", 21.1619, -86.8515)],
-        "activities": ["테마파크/쇼 관람", "사막 사파리/샌드보딩", "요트/스노클링",
-                       "루프탑·클럽", "슈퍼카 체험"],
-    },
-    "ESFP": {
-        "style": "축제·비치·포토 스팟",
-        "description": "화려하고 재밌는 순간 수집가를 위한 코스.",
-        "destinations": [("마이애미", "미국", 25.7617, -80.1918),
-                         ("이비자", "스페인", 38.9067, 1.4206),
-                         ("푸켓", "태국", 7.8804, 98.3923)],
-        "activities": ["해변 액티비티", "선셋 크루즈", "나이트 라이프",
-                       "인생샷 스팟 투어", "해산물 미식"],
-    },
-}
+# TRAVEL_METRICS_FILE 가 있으면 구간별 시간 히스토그램을 Prometheus 텍스트 파일로 주기적 기록
+metrics.maybe_start_exporter()
+# MAP_WARMUP=1 이면 서버 시작 시(프로세스당 한 번) 모든 지도를 백그라운드에서 미리 생성
+maps.maybe_warm_up()
 
-# 대표 이미지 (공개 이미지 URL 예시)
-DEFAULT_IMAGES = {
-    "교토": "https://upload.wikimedia.org/wikipedia/commons/6/6e/Kiyomizu-dera_in_Kyoto.jpg",
-    "프라하": "https://upload.wikimedia.org/wikipedia/commons/a/a6/Prague_old_town_square_panorama.jpg",
-    "피렌체": "https://upload.wikimedia.org/wikipedia/commons/a/a8/Florence_Duomo_III.jpg",
-    "바르셀로나": "https://upload.wikimedia.org/wikipedia/commons/6/6a/Sagrada_Familia_01.jpg",
-    "방콕": "https://upload.wikimedia.org/wikipedia/commons/7/7c/Bangkok_Montage_2021.jpg",
-    "리우데자네이루": "https://upload.wikimedia.org/wikipedia/commons/1/19/Rio_de_Janeiro_-_Rafael_Defavari.jpg",
-}
+st.set_page_config(page_title="MBTI 여행 추천", page_icon="🌏", layout="wide")
 
 # -----------------------------
 # 유틸 함수
@@ -186,104 +32,161 @@ DEFAULT_IMAGES = {
 def get_all_mbti():
     return sorted(DATA.keys())
 
-def build_map_folium(destinations):
-    center_lat, center_lon = destinations[0][2], destinations[0][3]
-    fmap = folium.Map(location=[center_lat, center_lon], zoom_start=4, tiles="CartoDB positron")
-    coords = []
-    for city, country, lat, lon in destinations:
-        folium.Marker([lat, lon], popup=f"{city}, {country}", tooltip=city).add_to(fmap)
-        coords.append((lat, lon))
-    if len(coords) > 1:
-        folium.PolyLine(coords, weight=3, opacity=0.7).add_to(fmap)
-    return fmap
-
-def build_map_pydeck(destinations):
-    points = [{"lat": lat, "lon": lon, "name": city, "country": country}
-              for (city, country, lat, lon) in destinations]
-    path = [{"path": [[d[3], d[2]] for d in destinations]}] if len(destinations) > 1 else []
-    view_state = pdk.ViewState(latitude=destinations[0][2], longitude=destinations[0][3], zoom=4)
+@st.cache_resource
+def get_store():
+    # 프로세스당 하나의 SQLite 저장소 (모든 세션 공유)
+    return ItineraryStore()
 
-    layers = [
-        pdk.Layer(
-            "ScatterplotLayer",
-            data=points,
-            get_position="[lon, lat]",
-            get_radius=40000,
-            pickable=True,
-        )
-    ]
-    if path:
-        layers.append(
-            pdk.Layer(
-                "PathLayer",
-                data=path,
-                get_path="path",
-                width_scale=2,
-                width_min_pixels=2,
-            )
-        )
+@st.cache_resource
+def get_image_cache():
+    # 썸네일 캐시도 프로세스당 하나. 첫 화면을 막지 않도록 전체 이미지는 백그라운드로 미리 받아둔다
+    cache = ImageCache()
+    threading.Thread(target=cache.prefetch, args=(list(DEFAULT_IMAGES.values()),),
+                     name="image-prefetch", daemon=True).start()
+    return cache
 
-    return pdk.Deck(layers=layers, initial_view_state=view_state, tooltip={"text": "{name}, {country}"})
+@st.cache_resource
+def get_feeds():
+    # 여행 뉴스 수집기도 프로세스당 하나. 수집은 백그라운드 스레드(FEEDS_OFFLINE=1 이면 끔), 화면은 메모리의 결과만 읽는다
+    return feeds.default_ingestor().start()
 
-def sample_destinations(mbti, count=2):
-    lst = DATA[mbti]["destinations"]
-    if count >= len(lst):
-        return lst
-    return random.sample(lst, count)
+@st.cache_resource
+def get_city_summaries():
+    # 도시별 여행 글 요약 색인 (python summarize.py 로 미리 만든 data/city_summaries.json, 없으면 빈 dict)
+    return summarize.load_index()
 
-def generate_itinerary(mbti, days, base_date, selected_destinations):
-    acts = DATA[mbti]["activities"]
-    style = DATA[mbti]["style"]
-    rows = []
-    for i in range(days):
-        day_date = base_date + timedelta(days=i)
-        city, country, lat, lon = selected_destinations[i % len(selected_destinations)]
-        day_acts = random.sample(acts, k=min(3, len(acts)))
-        morning = f"[아침] {day_acts[0]}"
-        afternoon = f"[오후] {day_acts[1] if len(day_acts)>1 else '자유 일정'}"
-        evening = f"[저녁] {day_acts[2] if len(day_acts)>2 else '야경 산책'}"
-        meals = "현지 음식 맛보기(로컬 식당/마켓)"
-        rows.append({
-            "일자": day_date.strftime("%Y-%m-%d"),
-            "MBTI 스타일": style,
-            "도시": city,
-            "국가": country,
-            "아침": morning,
-            "오후": afternoon,
-            "저녁": evening,
-            "식사": meals
-        })
-    return pd.DataFrame(rows)
+def initial_settings():
+    # ?trip=<id> 로 들어오면 저장된 설정을 위젯 기본값으로 (세션 시작 시 한 번만 결정)
+    if "initial_settings" not in st.session_state:
+        settings = {"mbti": "ENFP", "days": 5, "dest_count": 2,
+                    "start_date": date.today(), "seed": 42}
+        tid = st.query_params.get("trip")
+        rec = get_store().get(tid) if tid else None
+        if rec:
+            settings.update(rec["params"], start_date=date.fromisoformat(rec["params"]["start_date"]))
+        st.session_state["initial_settings"] = settings
+    return st.session_state["initial_settings"]
 
-def df_to_markdown(df: pd.DataFrame) -> str:
-    lines = ["# 여행 일정표", ""]
-    for _, r in df.iterrows():
-        lines += [
-            f"## {r['일자']} · {r['도시']} ({r['국가']})",
-            f"- {r['아침']}",
-            f"- {r['오후']}",
-            f"- {r['저녁']}",
-            f"- 🍽 {r['식사']}",
-            ""
-        ]
-    return "\n".join(lines)
+def memo(name, deps, build):
+    # 세션 단위 의존성 추적: deps 가 지난번과 같으면 build 를 건너뛰고 이전 결과를 쓴다
+    # (폼 제출은 전체 재실행이라 모든 구역이 다시 그려지지만, 입력이 안 바뀐 구역은 계산을 건너뛴다)
+    slot = st.session_state.get(f"_memo_{name}")
+    if slot is not None and slot[0] == deps:
+        return slot[1]
+    value = build()
+    st.session_state[f"_memo_{name}"] = (deps, value)
+    return value
 
 # -----------------------------
-# 사이드바: 입력
+# 사이드바: 입력 (폼 → 제출 버튼을 눌러야 한 번에 반영)
 # -----------------------------
+init = initial_settings()
+# ?debug=1 이면 이 세션의 실행만 측정하고 사이드바 맨 아래에 구간별 시간 패널을 띄운다
+# (다른 세션은 측정하지 않음. 프로세스 전체 측정은 TRAVEL_METRICS=1 / TRAVEL_METRICS_FILE)
+debug = st.query_params.get("debug") == "1"
+metrics.enable_session(debug)
 with st.sidebar:
     st.header("✈️ 여행 설정")
-    mbti = st.selectbox("MBTI 선택", get_all_mbti(),
-                        index=get_all_mbti().index("ENFP") if "ENFP" in get_all_mbti() else 0)
-    st.caption(DATA[mbti]["description"])
-    day_count = st.slider("여행 일수", min_value=3, max_value=10, value=5, step=1)
-    dest_count = st.slider("추천 도시 수(경로 표시)", min_value=1, max_value=3, value=2, step=1)
-    start_date = st.date_input("여행 시작일", value=date.today())
-    random_seed = st.number_input("랜덤 시드(재현용)", min_value=0, value=42, step=1)
+    # 모드 전환은 폼 구성이 바뀌므로 폼 밖에서 바로 반영
+    multi_city = st.checkbox("🌍 멀티시티 모드 (도시 직접 선택)")
+    # 장기 여행: 일정을 조각(CHUNK_DAYS)으로 만들고, 표는 보이는 페이지만 그린다
+    long_trip = st.checkbox("🧳 장기 여행 모드 (90~365일)", disabled=multi_city) and not multi_city
+    with st.form("settings"):
+        mbti = st.selectbox("MBTI 선택", get_all_mbti(),
+                            index=get_all_mbti().index(init["mbti"]) if init["mbti"] in get_all_mbti() else 0)
+        st.caption(DATA[mbti]["description"])
+        blend_pct = st.slider("👥 비슷한 유형 섞기", min_value=0, max_value=50, value=0, step=10, format="%d%%",
+                              help="뽑히는 도시/활동 중 평균 이 비율만큼 비슷한 MBTI 유형의 것이 섞여요 (0%면 내 유형만)")
+        min_days, max_days = (90, 365) if long_trip else (3, 60 if multi_city else 10)
+        day_count = st.slider("여행 일수", min_value=min_days, max_value=max_days,
+                              value=min(max(init["days"], min_days), max_days), step=1)
+        if multi_city:
+            picked = st.multiselect("방문 도시", CATALOG.destinations, default=list(DATA[mbti]["destinations"]),
+                                    format_func=lambda d: f"{d.city}, {d.country}")
+        else:
+            dest_count = st.slider("추천 도시 수(경로 표시)", min_value=1, max_value=3, value=init["dest_count"], step=1)
+        start_date = st.date_input("여행 시작일", value=init["start_date"])
+        random_seed = st.number_input("랜덤 시드(재현용)", min_value=0, value=init["seed"], step=1)
+        st.form_submit_button("✅ 적용", use_container_width=True)
     st.markdown("---")
     st.write("💡 팁: 시드를 바꾸면 활동 구성이 바뀌어요!")
 
-random.seed(int(random_seed))
+# -----------------------------
+# 일정: 저장소에 있으면 그대로, 없으면 생성 후 저장
+# 도시는 경로 최적화 순서(최근접 이웃 + 2-opt)로 방문, 도시마다 연속된 날짜
+# 의존성: 도시/경로 ← (mbti, 도시 수, 시드)  ·  일정 ← 모든 입력  ·  지도 ← 도시/경로
+# (도시 샘플은 DEST_STREAM 만 쓰므로 일수/시작일이 바뀌어도 그대로)
+# -----------------------------
+blend = blend_pct / 100
+
+def day_table():
+    # 날짜별 활동표는 (mbti, 시드) 가 같으면 세션에 두고 계속 쓴다 (난수는 일정마다 독립된 스트림)
+    # 일수를 늘리면 새 날짜만 뽑고, 줄이거나 시작일/도시가 바뀌면 활동은 그대로 일자/도시 열만 다시 계산
+    return memo("days", (mbti, random_seed, blend), lambda: DayTable(mbti, trip_rng(mbti, random_seed), blend))
+
+def build_itinerary(sel_dests):
+    with metrics.span("itinerary.generate"):
+        return day_table().frame(day_count, start_date, sel_dests)
+
+def build_summary(sel_dests):
+    # 장기 여행 요약: 조각을 하나씩 만들어 주별/도시별로 누적 (전체 표는 만들지 않음)
+    summary = TripSummary()
+    with metrics.span("itinerary.summary"):
+        for chunk in day_table().chunks(day_count, start_date, sel_dests):
+            summary.add(chunk)
+    return summary
+
+if multi_city:
+    # 직접 고른 도시 조합은 저장/공유 대상이 아님
+    tid = None
+    dests_in = tuple(picked) if picked else ("sample", mbti, random_seed, blend)
+    full_route = memo("route", dests_in, lambda: plan_route(
+        picked or sample_destinations(mbti, 2, trip_rng(mbti, random_seed), blend)))
+    # 도시가 일수보다 많으면 경로 순서로 앞 day_count 곳만 (지도 경로/총 거리도 실제 가는 도시만)
+    route = visited_route(full_route, day_count)
+    if route is not full_route:
+        with st.sidebar:
+            st.caption(f"⚠️ {day_count}일 일정이라 경로 순서로 앞 {day_count}곳만 방문해요 "
+                       f"(선택 {len(full_route.destinations)}곳)")
+    sel_dests = list(route.destinations)
+    it_df = memo("itinerary", (mbti, day_count, start_date, route.destinations, random_seed, blend),
+                 lambda: build_itinerary(sel_dests))
+    st.query_params.pop("trip", None)
+elif long_trip:
+    # 입력만으로 언제든 다시 만들 수 있으므로 저장소/공유 링크 없이. tid 는 내보내기 캐시 키로만
+    route = memo("route", (mbti, dest_count, random_seed, blend), lambda: plan_route(
+        sample_destinations(mbti, dest_count, trip_rng(mbti, random_seed), blend)))
+    sel_dests = list(route.destinations)
+    tid = trip_id(mbti, day_count, start_date, dest_count, random_seed, blend)
+    summary = memo("summary", tid, lambda: build_summary(sel_dests))
+    it_df = None
+    st.query_params.pop("trip", None)
+else:
+    route = memo("route", (mbti, dest_count, random_seed, blend), lambda: plan_route(
+        sample_destinations(mbti, dest_count, trip_rng(mbti, random_seed), blend)))
+    sel_dests = list(route.destinations)
+    tid = trip_id(mbti, day_count, start_date, dest_count, random_seed, blend)
+
+    def load_or_generate():
+        store = get_store()
+        with metrics.span("store.get"):
+            saved = store.get(tid)
+        if saved:
+            return saved["itinerary"]
+        df = build_itinerary(sel_dests)
+        store.put({"mbti": mbti, "days": day_count, "start_date": start_date,
+                   "dest_count": dest_count, "seed": random_seed}, sel_dests, df)
+        return df
+
+    if blend:
+        # 비슷한 유형을 섞은 일정은 저장소 스키마에 섞기 비율이 없어 저장/공유하지 않는다
+        it_df = memo("itinerary", tid, lambda: build_itinerary(sel_dests))
+        st.query_params.pop("trip", None)
+    else:
+        it_df = memo("itinerary", tid, load_or_generate)
+        st.query_params["trip"] = tid
+        with st.sidebar:
+            st.caption(f"🔗 공유 링크: `?trip={tid}`")
 
 # -----------------------------
 # 메인: 헤더
@@ -291,58 +194,124 @@ random.seed(int(random_seed))
 st.title("🌏 MBTI 유형별 여행 추천")
 st.subheader(f"{mbti} · {DATA[mbti]['style']}")
 
-# 추천 도시 선택 & 지도
-sel_dests = sample_destinations(mbti, dest_count)
+# -----------------------------
+# 구역별 fragment: 지도 조작/다운로드 클릭은 해당 구역만 다시 실행
+# (인자는 마지막 전체 실행 때 값이 그대로 쓰인다)
+# -----------------------------
+@st.fragment
+def city_panel(mbti, route):
+    sel_dests = list(route.destinations)
+    cols = st.columns([1.2, 1])
+    with cols[0]:
+        # 같은 도시 조합이면 캐시된 같은 HTML → 같은 메시지라 브라우저 캐시 참조로만 전송
+        if FOLIUM_AVAILABLE:
+            with metrics.span("map.build"):
+                map_html = maps.get_map_html(sel_dests)
+            with metrics.span("map.iframe"):
+                st.iframe(map_html, height=520)
+        else:
+            with metrics.span("map.build"):
+                deck = maps.get_map(sel_dests)
+            with metrics.span("map.pydeck_chart"):
+                st.pydeck_chart(deck, use_container_width=True, height=520)
 
-cols = st.columns([1.2, 1])
-with cols[0]:
-    if FOLIUM_AVAILABLE:
-        fmap = build_map_folium(sel_dests)
-        st_folium(fmap, height=520, use_container_width=True)
-    else:
-        deck = build_map_pydeck(sel_dests)
-        st.pydeck_chart(deck, use_container_width=True, height=520)
+    with cols[1]:
+        images = get_image_cache()
+        news = get_feeds()
+        summaries = get_city_summaries()
+        st.markdown("### 📍 추천 도시")
+        if len(sel_dests) > 1:
+            st.metric("🛣 총 이동 거리", f"{route.total_km:,.0f} km")
+        legs = list(route.legs_km) + [None]
+        for (city, country, lat, lon), leg in zip(sel_dests, legs):
+            st.markdown(f"- **{city}**, {country}" + (f" → 다음 도시 {leg:,.0f} km" if leg else ""))
+            if city in DEFAULT_IMAGES:
+                # 캐시된 썸네일이 있으면 로컬 바이트, 아직 없으면 백그라운드로 받고 자리 표시만 (오프라인이면 생략)
+                with metrics.span("images.load"):
+                    img = images.get(DEFAULT_IMAGES[city], fetch=False)
+                    if img is not None:
+                        st.image(img, use_column_width=True)
+                    elif not images.offline:
+                        images.fetch_async(DEFAULT_IMAGES[city])
+                        st.caption("🖼 사진을 준비하고 있어요")
+            if city in summaries:
+                st.caption("📝 " + " ".join(summaries[city]["summary"]))
+            # 최근 여행 뉴스 (아직 수집 전이거나 피드가 없으면 생략)
+            for art in news.articles_for(city, limit=3):
+                st.caption(f"📰 [{art['title']}]({art['url']}) · {art['feed']}")
+        st.info(DATA[mbti]["description"])
+
+        panels.similar_types(mbti)
 
-with cols[1]:
-    st.markdown("### 📍 추천 도시")
-    for (city, country, lat, lon) in sel_dests:
-        st.markdown(f"- **{city}**, {country}")
-        if city in DEFAULT_IMAGES:
-            st.image(DEFAULT_IMAGES[city], use_column_width=True)
-    st.info(DATA[mbti]["description"])
+        # 근처 대안: 모든 MBTI 유형의 목적지 중 선택 도시와 가까운 곳
+        with st.expander("🧭 근처 다른 여행지"):
+            for dest in sel_dests:
+                near = CATALOG.nearby(dest, k=3, exclude=sel_dests)
+                st.markdown(f"**{dest[0]}** 근처: " + " · ".join(
+                    f"{d.city}({d.country}, {km:,.0f}km, {'/'.join(types)})" for d, km, types in near))
 
-# 일정 생성
-st.markdown("## 🗓 자동 생성 여행 일정")
-it_df = generate_itinerary(mbti, day_count, start_date, sel_dests)
-st.dataframe(it_df, use_container_width=True)
+@st.fragment
+def itinerary_table(it_df):
+    st.markdown("## 🗓 자동 생성 여행 일정")
+    with metrics.span("itinerary.dataframe"):
+        st.dataframe(it_df, use_container_width=True)
 
-# 다운로드 버튼 (CSV / Markdown)
-csv_buf = it_df.to_csv(index=False).encode("utf-8-sig")
-md_text = df_to_markdown(it_df).encode("utf-8")
+# 다운로드 버튼: 누를 때만 파일을 만든다 (export.lazy → 일정 해시 기준 캐시)
+# 장기 여행은 export.lazy_stream: 일정 조각을 하나씩 만들어 바로 형식별 bytes 로
+DOWNLOADS = [
+    ("csv", "⬇️ CSV", "엑셀에서 열 수 있어요"),
+    ("md", "⬇️ Markdown", "노션/깃허브 등에 붙여넣기 좋아요"),
+    ("json", "⬇️ JSON", "다른 서비스/스크립트에서 읽기 좋아요"),
+    ("ics", "⬇️ 캘린더(.ics)", "아침/오후/저녁 블록이 캘린더 일정으로 들어가요"),
+    ("zip", "⬇️ 전체 묶음(.zip)", "CSV·Markdown·JSON·ICS 한 번에"),
+]
 
-dl_cols = st.columns(2)
-with dl_cols[0]:
-    st.download_button(
-        label="⬇️ CSV로 다운로드",
-        data=csv_buf,
-        file_name=f"{mbti}_여행일정.csv",
-        mime="text/csv",
-        help="엑셀에서 열 수 있어요"
-    )
-with dl_cols[1]:
-    st.download_button(
-        label="⬇️ Markdown으로 다운로드",
-        data=md_text,
-        file_name=f"{mbti}_여행일정.md",
-        mime="text/markdown",
-        help="노션/깃허브 등에 붙여넣기 좋아요"
-    )
+@st.fragment
+def downloads(lazy_data, mbti):
+    # lazy_data(fmt, base_name) → 클릭했을 때 바이트를 만드는 콜백
+    dl_cols = st.columns(len(DOWNLOADS))
+    for col, (fmt, label, help_text) in zip(dl_cols, DOWNLOADS):
+        ext, mime = export.FORMATS[fmt]
+        with col:
+            st.download_button(
+                label=label,
+                data=lazy_data(fmt, f"{mbti}_여행일정"),
+                file_name=f"{mbti}_여행일정.{ext}",
+                mime=mime,
+                help=help_text,
+                on_click="ignore"  # 다운로드는 화면을 바꾸지 않으므로 재실행하지 않는다
+            )
+
+city_panel(mbti, route)
+panels.overview_map()
+if long_trip:
+    panels.long_itinerary(day_table(), day_count, start_date, sel_dests, summary)
+    downloads(lambda fmt, name, table=day_table(), days=day_count, start=start_date, dests=sel_dests:
+              export.lazy_stream(lambda: table.chunks(days, start, dests), fmt, tid, name), mbti)
+else:
+    itinerary_table(it_df)
+    downloads(lambda fmt, name, df=it_df, key=tid: export.lazy(df, fmt, base_name=name, key=key), mbti)
 
 # 추가 안내
 with st.expander("🔧 커스터마이즈 가이드"):
     st.markdown("""
-- **도시/활동**을 더 추가하려면 `DATA`의 `destinations`, `activities`를 수정하세요.
+- **도시/활동**을 더 추가하려면 `data/catalog.json`의 `destinations`(목록), `types`의 `activities`를 수정하세요.
 - **지도의 스타일**: folium이면 `tiles`값, pydeck이면 `ViewState/Layer` 옵션을 바꾸면 됩니다.
 - **일정 로직**은 `generate_itinerary()`의 아침/오후/저녁 블록을 커스터마이즈하세요.
-- **이미지**는 `DEFAULT_IMAGES`에 도시명 키로 URL을 추가하세요.
+- **이미지**는 `data/catalog.json` 목적지의 `image`에 URL을 추가하세요. (`python image_cache.py`로 썸네일 캐시를 미리 채울 수 있어요)
 """)
+
+# 디버그 패널 (?debug=1): ?debug=1 세션들(+ TRAVEL_METRICS=1 이면 프로세스 전체)에서 측정한 구간별 시간
+if debug:
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("#### ⏱ 구간별 시간 (디버그 세션 누적)")
+        snap = metrics.snapshot()
+        if snap:
+            st.dataframe(
+                [{"구간": name, "횟수": v["count"], "평균(ms)": round(v["mean_ms"], 2),
+                  "p50(ms)": v["p50_ms"], "p95(ms)": v["p95_ms"]} for name, v in snap.items()],
+                use_container_width=True, hide_index=True)
+        else:
+            st.caption("아직 측정된 구간이 없어요.")
+        st.caption("p50/p95 는 히스토그램 버킷 경계로 근사한 값이에요.")
@@ -0,0 +1,276 @@
+# maps.py
+# 🗺 지도 생성 (folium ↔ pydeck 자동대체) + 프로세스 전역 지도 캐시
+# 선택 도시 조합은 16유형 × 몇 가지 부분집합뿐이라, 한 번 만든 지도를
+# 모든 세션이 재사용한다. (도시 튜플, 백엔드) 키의 LRU 캐시
+# folium 지도는 HTML 로 렌더링한 결과까지 캐시 (재실행마다 같은 문자열 → 브라우저 캐시 참조로 전송)
+# ---------------------------------------------------------------
+
+import importlib.util
+import itertools
+import os
+import threading
+
+from lru import LRUCache
+
+# folium이 없으면 pydeck으로 대체
+# (설치 여부만 확인하고, 실제 import 는 지도를 처음 만들 때)
+FOLIUM_AVAILABLE = importlib.util.find_spec("folium") is not None
+
+DEFAULT_BACKEND = "folium" if FOLIUM_AVAILABLE else "pydeck"
+MAP_CACHE_SIZE = int(os.environ.get("MAP_CACHE_SIZE", "256"))
+
+def build_map_folium(destinations):
+    import folium
+
+    center_lat, center_lon = destinations[0][2], destinations[0][3]
+    fmap = folium.Map(location=[center_lat, center_lon], zoom_start=4, tiles="CartoDB positron")
+    coords = []
+    for city, country, lat, lon in destinations:
+        folium.Marker([lat, lon], popup=f"{city}, {country}", tooltip=city).add_to(fmap)
+        coords.append((lat, lon))
+    if len(coords) > 1:
+        folium.PolyLine(coords, weight=3, opacity=0.7).add_to(fmap)
+    return fmap
+
+def build_map_pydeck(destinations):
+    import pydeck as pdk
+
+    points = [{"lat": lat, "lon": lon, "name": city, "country": country}
+              for (city, country, lat, lon) in destinations]
+    path = [{"path": [[d[3], d[2]] for d in destinations]}] if len(destinations) > 1 else []
+    view_state = pdk.ViewState(latitude=destinations[0][2], longitude=destinations[0][3], zoom=4)
+
+    layers = [
+        pdk.Layer(
+            "ScatterplotLayer",
+            data=points,
+            get_position="[lon, lat]",
+            get_radius=40000,
+            pickable=True,
+        )
+    ]
+    if path:
+        layers.append(
+            pdk.Layer(
+                "PathLayer",
+                data=path,
+                get_path="path",
+                width_scale=2,
+                width_min_pixels=2,
+            )
+        )
+
+    return pdk.Deck(layers=layers, initial_view_state=view_state, tooltip={"text": "{name}, {country}"})
+
+
+_BUILDERS = {"folium": build_map_folium, "pydeck": build_map_pydeck}
+_cache = LRUCache(maxsize=MAP_CACHE_SIZE)
+
+
+def get_map(destinations, backend=None):
+    # 같은 도시 조합(순서 포함)이면 캐시된 지도 객체를 그대로 돌려준다
+    backend = backend or DEFAULT_BACKEND
+    key = (backend, tuple(tuple(d) for d in destinations))
+    return _cache.get_or_build(key, lambda: _BUILDERS[backend](list(destinations)))
+
+
+def get_map_html(destinations):
+    # folium 지도를 완성된 HTML 문서로 (st.iframe 으로 그대로 표시, 카탈로그의 도시 이름만 들어간다)
+    # st_folium 은 호출마다 지도를 다시 렌더링하지만, 앱은 지도 상호작용 값을 쓰지 않으므로 한 번만 렌더링
+    key = ("folium.html", tuple(tuple(d) for d in destinations))
+    return _cache.get_or_build(key, lambda: get_map(destinations, "folium").get_root().render())
+
+
+# -----------------------------
+# 전체 여행지 지도 (MBTI별) — 카탈로그 전체를 한 번에
+#  - 점 = (목적지, 추천 유형) 쌍. 마커/dict 대신 NumPy 컬럼 (위도, 경도 float32, 유형 번호 uint8)
+#  - folium: FastMarkerCluster — [위도, 경도, 유형] 배열 하나 + JS 콜백 (Python 쪽 마커 객체 없음),
+#    줌 단계별 묶기는 Leaflet.markercluster 가 브라우저에서
+#  - pydeck: 점을 격자(OVERVIEW_CELL_DEG) × 유형으로 미리 합친 컬럼 DataFrame → 전송량이 점 수가 아니라 칸 수에 비례
+#    칸이 OVERVIEW_MAX_CELLS 보다 많으면 격자를 두 배씩 키운다 (전체 지도 줌에서는 히트맵 반경이 수십 도라 티가 안 난다)
+#      heatmap : 유형별 HeatmapLayer (유형 색 한 가지 농도)
+#      hexagon : HexagonLayer (유형 없이 합친 칸으로 전체 밀도) + 유형 색 점 (칸의 유형별 개수)
+# -----------------------------
+OVERVIEW_CELL_DEG = float(os.environ.get("OVERVIEW_CELL_DEG", "0.5"))
+OVERVIEW_MAX_CELLS = int(os.environ.get("OVERVIEW_MAX_CELLS", "4096"))
+OVERVIEW_STYLES = ("heatmap", "hexagon")
+
+# 기질 4그룹 색 (NT 보라 / NF 초록 / SJ 파랑 / SP 노랑), 그룹 안에서는 E → I 로 진하게
+_GROUP_RGB = {"NT": (136, 97, 154), "NF": (51, 164, 116), "SJ": (66, 152, 180), "SP": (228, 174, 58)}
+
+
+def mbti_color(mbti):
+    # 그룹 안 네 유형 = E/I × 나머지 한 글자 (NT/NF 는 J/P, SJ/SP 는 T/F)
+    if mbti[1] == "N":
+        group, rest = mbti[1:3], mbti[3]
+    else:
+        group, rest = mbti[1] + mbti[3], mbti[2]
+    shade = (1.0 if mbti[0] == "E" else 0.7) * (1.0 if rest in "JT" else 0.85)
+    return [int(c * shade) for c in _GROUP_RGB[group]]
+
+
+def overview_points(catalog):
+    # (위도, 경도, 유형 번호, 유형 이름들) — 여러 유형이 추천하는 목적지는 유형마다 한 점
+    import numpy as np
+
+    types = tuple(sorted(catalog.types))
+    code_of = {t: i for i, t in enumerate(types)}
+    ids = [i for i, ts in enumerate(catalog.mbti_of) for _ in ts]
+    codes = np.fromiter((code_of[t] for ts in catalog.mbti_of for t in ts), dtype=np.uint8, count=len(ids))
+    return catalog.lat[ids].astype(np.float32), catalog.lon[ids].astype(np.float32), codes, types
+
+
+def aggregate_cells(lat, lon, code, cell_deg=OVERVIEW_CELL_DEG):
+    # 같은 (유형, 격자 칸) 점들을 한 행으로: 칸 안 점들의 평균 위치 + 개수
+    import numpy as np
+    import pandas as pd
+
+    rows = int(np.ceil(180 / cell_deg)) + 1
+    cols = int(np.ceil(360 / cell_deg)) + 1
+    r = np.floor((lat.astype(np.float64) + 90) / cell_deg).astype(np.int64)
+    c = np.floor((lon.astype(np.float64) + 180) / cell_deg).astype(np.int64)
+    key = (code.astype(np.int64) * rows + r) * cols + c
+    _, first, inv, w = np.unique(key, return_index=True, return_inverse=True, return_counts=True)
+    inv = inv.ravel()
+    return pd.DataFrame({
+        "lat": (np.bincount(inv, weights=lat) / w).round(3),
+        "lon": (np.bincount(inv, weights=lon) / w).round(3),
+        "w": w,
+        "t": code[first],
+    })
+
+
+def build_overview_folium(lat, lon, code, types):
+    import folium
+    import numpy as np
+    from folium.plugins import FastMarkerCluster
+
+    fmap = folium.Map(location=[30, 20], zoom_start=2, tiles="CartoDB positron")
+    colors = ["#%02x%02x%02x" % tuple(mbti_color(t)) for t in types]
+    callback = f"""function (row) {{
+        var colors = {colors}, names = {list(types)};
+        var m = L.circleMarker(new L.LatLng(row[0], row[1]),
+                               {{radius: 6, color: colors[row[2]], fillOpacity: 0.8, weight: 1}});
+        m.bindTooltip(names[row[2]]);
+        return m;
+    }}"""
+    # 위/경도는 소수 4자리 (약 10m) 로 잘라 HTML 크기를 줄인다
+    data = np.column_stack([lat.round(4), lon.round(4), code]).tolist()
+    for row in data:
+        row[2] = int(row[2])
+    FastMarkerCluster(data, callback=callback, name="MBTI 여행지").add_to(fmap)
+    return fmap
+
+
+def build_overview_pydeck(lat, lon, code, types, style="heatmap", cell_deg=OVERVIEW_CELL_DEG,
+                          max_cells=OVERVIEW_MAX_CELLS):
+    import numpy as np
+    import pydeck as pdk
+
+    cells = aggregate_cells(lat, lon, code, cell_deg)
+    while len(cells) > max_cells:
+        cell_deg *= 2
+        cells = aggregate_cells(lat, lon, code, cell_deg)
+    view_state = pdk.ViewState(latitude=30, longitude=20, zoom=1)
+    layers = []
+    if style == "hexagon":
+        layers.append(pdk.Layer(
+            "HexagonLayer",
+            data=aggregate_cells(lat, lon, np.zeros_like(code), cell_deg)[["lon", "lat", "w"]],
+            get_position="[lon, lat]",
+            get_elevation_weight="w",
+            get_color_weight="w",
+            elevation_aggregation="SUM",
+            color_aggregation="SUM",
+            radius=max(cell_deg, 1.0) * 111_000,
+            elevation_scale=2000,
+            extruded=True,
+            opacity=0.35,
+        ))
+    for t, group in cells.groupby("t", sort=True):
+        data = group[["lon", "lat", "w"]]
+        if style == "hexagon":
+            layers.append(pdk.Layer(
+                "ScatterplotLayer",
+                data=data.assign(mbti=types[t]),
+                get_position="[lon, lat]",
+                get_radius="30000 * Math.sqrt(w)",
+                get_fill_color=mbti_color(types[t]),
+                pickable=True,
+            ))
+        else:
+            rgb = mbti_color(types[t])
+            layers.append(pdk.Layer(
+                "HeatmapLayer",
+                data=data,
+                get_position="[lon, lat]",
+                get_weight="w",
+                color_range=[rgb + [a] for a in (40, 90, 140, 190, 230, 255)],
+                radius_pixels=40,
+            ))
+    return pdk.Deck(layers=layers, initial_view_state=view_state, tooltip={"text": "{mbti} · {w}곳"})
+
+
+def get_overview(backend=None, style="heatmap"):
+    # 카탈로그는 프로세스당 하나라 (백엔드, 스타일) 만으로 캐시
+    from catalog import get_catalog
+
+    backend = backend or DEFAULT_BACKEND
+    key = ("overview", backend, style if backend == "pydeck" else None)
+    if backend == "folium":
+        return _cache.get_or_build(key, lambda: build_overview_folium(*overview_points(get_catalog())))
+    return _cache.get_or_build(key, lambda: build_overview_pydeck(*overview_points(get_catalog()), style=style))
+
+
+def get_overview_html():
+    return _cache.get_or_build(("overview.html",), lambda: get_overview("folium").get_root().render())
+
+
+def cache_stats():
+    return _cache.stats()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def all_destination_subsets(data):
+    # sample_destinations 가 고를 수 있는 모든 도시 조합 (경로 최적화 순서로)
+    from route import plan_route
+
+    for info in data.values():
+        dests = info["destinations"]
+        for k in range(1, len(dests) + 1):
+            for combo in itertools.combinations(dests, k):
+                yield plan_route(combo).destinations
+
+
+def warm_up(data=None, backend=None):
+    # main.py 와 같은 경로로 채운다: folium 은 HTML 캐시(get_map_html, 지도 객체도 같이), pydeck 은 get_map
+    if data is None:
+        from travel_core import DATA as data
+    backend = backend or DEFAULT_BACKEND
+    n = 0
+    for dests in all_destination_subsets(data):
+        if backend == "folium":
+            get_map_html(dests)
+        else:
+            get_map(dests, backend)
+        n += 1
+    return n
+
+
+_warm_lock = threading.Lock()
+_warm_started = False
+
+
+def maybe_warm_up():
+    # 프로세스당 한 번만, 백그라운드 스레드로 (첫 세션의 응답을 막지 않도록)
+    global _warm_started
+    if os.environ.get("MAP_WARMUP", "0") != "1":
+        return
+    with _warm_lock:
+        if _warm_started:
+            return
+        _warm_started = True
+    threading.Thread(target=warm_up, name="map-warmup", daemon=True).start()
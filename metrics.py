@@ -0,0 +1,214 @@
+# metrics.py
+# 📊 핫패스 구간 시간 측정 (span) → 프로세스 전역 히스토그램
+#  - with metrics.span("itinerary.generate"): ...   /   @metrics.timed("cards.render")
+#  - 꺼져 있으면 공유된 no-op 컨텍스트를 돌려줘서 비용이 거의 없다
+#  - 켜는 방법: 프로세스 전체는 TRAVEL_METRICS=1 환경변수 / enable() (운영자용),
+#    Streamlit 세션 하나만은 enable_session() (main.py/test.py 의 ?debug=1, fragment 재실행 포함)
+#    세션 플래그는 st.session_state 에 두고(세션이 끝나면 같이 사라짐), 스레드(= 재실행 하나)마다
+#    처음 한 번만 읽어 threading.local 에 둔다. enable_session 을 한 번도 안 부른 프로세스는 확인 자체를 건너뜀
+#  - Prometheus 텍스트 형식으로 내보내기: render_prometheus(), TRAVEL_METRICS_FILE 로 주기적 파일 기록
+# ---------------------------------------------------------------
+
+import bisect
+import functools
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# 초 단위 버킷 경계 (Prometheus 기본값과 같은 모양)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_NAME = "travel_span_seconds"
+
+_enabled = os.environ.get("TRAVEL_METRICS", "0") == "1"
+SESSION_KEY = "_metrics_debug"  # st.session_state 의 세션 측정 플래그
+_ctx = None  # streamlit get_script_run_ctx (enable_session 을 처음 부를 때 가져온다)
+_local = threading.local()  # 이 스레드의 세션 측정 여부 (없으면 아직 안 읽음)
+_NOOP = nullcontext()
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count", "_lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        i = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += seconds
+            self.count += 1
+
+    def quantile(self, q):
+        # 버킷 경계로 근사한 분위수 (초)
+        with self._lock:
+            counts, total = list(self.counts), self.count
+        if not total:
+            return 0.0
+        target, seen = q * total, 0
+        for i, c in enumerate(counts):
+            seen += c
+            if seen >= target:
+                return BUCKETS[i] if i < len(BUCKETS) else float("inf")
+        return float("inf")
+
+
+_hist = {}
+_hist_lock = threading.Lock()
+
+
+def _histogram(name):
+    h = _hist.get(name)
+    if h is None:
+        with _hist_lock:
+            h = _hist.setdefault(name, Histogram())
+    return h
+
+
+def _session_on():
+    on = getattr(_local, "on", None)
+    if on is None:
+        ctx = _ctx(suppress_warning=True)
+        state = ctx.session_state if ctx is not None else {}
+        on = _local.on = SESSION_KEY in state and bool(state[SESSION_KEY])
+    return on
+
+
+def enabled():
+    return _enabled or (_ctx is not None and _session_on())
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def enable_session(on=True):
+    # 지금 실행 중인 Streamlit 세션만 켜고/끈다 (재실행마다 호출, 다른 세션은 계속 no-op)
+    global _ctx
+    if _ctx is None:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        _ctx = get_script_run_ctx
+    ctx = _ctx(suppress_warning=True)
+    if ctx is not None:
+        ctx.session_state[SESSION_KEY] = _local.on = bool(on)
+
+
+class _Span:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _histogram(self.name).observe(time.perf_counter() - self.t0)
+        return False
+
+
+def span(name):
+    return _Span(name) if enabled() else _NOOP
+
+
+def timed(name):
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def observe(name, seconds):
+    _histogram(name).observe(seconds)
+
+
+def reset():
+    with _hist_lock:
+        _hist.clear()
+
+
+def _items():
+    # 다른 스레드의 observe 가 새 이름을 넣는 중에도 안전하게 (dict 복사는 잠금 안에서)
+    with _hist_lock:
+        return sorted(_hist.items())
+
+
+def snapshot():
+    # 이름 → 요약 (디버그 패널용)
+    out = {}
+    for name, h in _items():
+        out[name] = {
+            "count": h.count,
+            "mean_ms": h.sum / h.count * 1000 if h.count else 0.0,
+            "p50_ms": h.quantile(0.50) * 1000,
+            "p95_ms": h.quantile(0.95) * 1000,
+            "total_s": h.sum,
+        }
+    return out
+
+
+def render_prometheus():
+    lines = [f"# HELP {METRIC_NAME} Wall time of instrumented hot-path spans.",
+             f"# TYPE {METRIC_NAME} histogram"]
+    for name, h in _items():
+        with h._lock:
+            counts, total, count = list(h.counts), h.sum, h.count
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        cum = 0
+        for le, c in zip(BUCKETS + (float("inf"),), counts):
+            cum += c
+            le_s = "+Inf" if le == float("inf") else repr(le)
+            lines.append(f'{METRIC_NAME}_bucket{{span="{label}",le="{le_s}"}} {cum}')
+        lines.append(f'{METRIC_NAME}_sum{{span="{label}"}} {total!r}')
+        lines.append(f'{METRIC_NAME}_count{{span="{label}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    # node_exporter textfile collector 가 반쯤 쓴 파일을 읽지 않도록 임시 파일 → rename
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp, path)
+
+
+_exporter_lock = threading.Lock()
+_exporter = None
+
+
+def start_exporter(path, interval=15.0):
+    # 프로세스당 하나의 백그라운드 스레드가 interval 초마다 파일을 다시 쓴다
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            return _exporter
+
+        def loop():
+            while True:
+                try:
+                    write_prometheus(path)
+                except OSError:
+                    pass
+                time.sleep(interval)
+
+        _exporter = threading.Thread(target=loop, name="metrics-exporter", daemon=True)
+        _exporter.start()
+        return _exporter
+
+
+def maybe_start_exporter():
+    path = os.environ.get("TRAVEL_METRICS_FILE")
+    if path:
+        enable()
+        start_exporter(path, float(os.environ.get("TRAVEL_METRICS_INTERVAL", "15")))
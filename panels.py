@@ -0,0 +1,57 @@
+# panels.py
+# 🧩 main.py 의 부가 화면 구역 (켤 때만 보이는 구역을 모아 두고 main.py 는 호출만 한다)
+# ---------------------------------------------------------------
+
+import streamlit as st
+
+import maps
+import metrics
+from maps import FOLIUM_AVAILABLE
+from travel_core import CATALOG, DATA
+
+# 장기 여행: 한 페이지(PAGE_DAYS 일)만 표로 (페이지 이동은 이 구역만 다시 실행)
+PAGE_DAYS = 14
+
+# 전체 여행지 지도 표시 방식 (pydeck)
+OVERVIEW_STYLE_LABELS = {"heatmap": "🔥 히트맵", "hexagon": "⬢ 육각 막대"}
+
+
+@st.fragment
+def long_itinerary(table, days, start_date, sel_dests, summary):
+    st.markdown(f"## 🗓 장기 여행 일정 ({days}일)")
+    tab_days, tab_weeks, tab_cities = st.tabs(["📅 일정", "🗓 주별 요약", "📍 도시별 요약"])
+    with tab_days:
+        pages = -(-days // PAGE_DAYS)
+        page = st.number_input(f"페이지 ({PAGE_DAYS}일씩, 총 {pages}쪽)", min_value=1, max_value=pages, value=1, step=1)
+        lo = (page - 1) * PAGE_DAYS
+        with metrics.span("itinerary.page"):
+            st.dataframe(table.frame(days, start_date, sel_dests, lo, lo + PAGE_DAYS), use_container_width=True)
+    with tab_weeks:
+        st.dataframe(summary.week_table(), use_container_width=True, hide_index=True)
+    with tab_cities:
+        st.dataframe(summary.city_table(), use_container_width=True, hide_index=True)
+
+
+# 전체 여행지 지도 (MBTI별): 켤 때만 만든다 (프로세스 전역 지도 캐시 → 두 번째부터는 조회만)
+@st.fragment
+def overview_map():
+    if not st.toggle("🗺 전체 여행지 지도 (MBTI별)"):
+        return
+    st.caption("색: 보라 NT · 초록 NF · 파랑 SJ · 노랑 SP (I 유형은 더 진하게)")
+    if FOLIUM_AVAILABLE:
+        with metrics.span("overview.build"):
+            map_html = maps.get_overview_html()
+        st.iframe(map_html, height=520)
+    else:
+        style = st.radio("표시 방식", maps.OVERVIEW_STYLES, horizontal=True, format_func=OVERVIEW_STYLE_LABELS.get)
+        with metrics.span("overview.build"):
+            deck = maps.get_overview(style=style)
+        st.pydeck_chart(deck, use_container_width=True, height=520)
+
+
+def similar_types(mbti):
+    # 비슷한 유형: 프로세스당 한 번 만든 유사도 표에서 조회만
+    with st.expander("👥 나와 비슷한 유형"):
+        for other, score in CATALOG.similarity.neighbors(mbti):
+            st.markdown(f"**{other}** · {DATA[other]['style']} (유사도 {score:.2f})  \n"
+                        + " · ".join(d.city for d in DATA[other]["destinations"]))
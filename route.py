@@ -0,0 +1,128 @@
+# route.py
+# 🛣 선택 도시 방문 순서 최적화 (열린 경로, 최근접 이웃 + 2-opt)
+#  - 대원(great-circle) 거리 행렬은 spatial.haversine 으로 한 번에 계산
+#  - 열린 경로는 "모든 도시와 거리 0 인 가상 도시"를 넣은 순환 경로로 풀고 가상 도시를 잘라낸다
+#  - 일정의 도시 배정은 경로 순서대로 연속된 날짜 블록 (앞 도시부터 하루씩 더)
+#    도시가 일수보다 많으면 하루도 못 받는 도시는 경로에서 뺀다 (visited_route)
+# main.py 가 시작할 때 import 하므로 numpy 는 각 함수 안에서 import
+# ---------------------------------------------------------------
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from spatial import haversine
+
+
+class Route(NamedTuple):
+    destinations: tuple  # 방문 순서대로
+    total_km: float
+    legs_km: tuple       # 구간별 거리
+
+
+def distance_matrix(lat, lon):
+    import numpy as np
+
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    return haversine(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+
+
+def nearest_neighbour(dist, start):
+    import numpy as np
+
+    n = len(dist)
+    tour = [start]
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    for _ in range(n - 1):
+        d = np.where(visited, np.inf, dist[tour[-1]])
+        nxt = int(np.argmin(d))
+        tour.append(nxt)
+        visited[nxt] = True
+    return tour
+
+
+def two_opt(tour, dist):
+    # 순환 경로 2-opt: i 마다 모든 j 의 이득을 벡터로 계산해 가장 좋은 뒤집기를 적용
+    import numpy as np
+
+    t = np.asarray(tour)
+    m = len(t)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(m - 2):
+            a, b = t[i], t[i + 1]
+            js = np.arange(i + 2, m if i > 0 else m - 1)
+            if not len(js):
+                continue
+            c, d = t[js], t[(js + 1) % m]
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                t[i + 1:js[j] + 1] = t[i + 1:js[j] + 1][::-1].copy()
+                improved = True
+    return t.tolist()
+
+
+def optimize_order(dist):
+    # 열린 경로 최적 순서 (도시 번호 리스트)
+    import numpy as np
+
+    n = len(dist)
+    if n <= 2:
+        return list(range(n))
+    ext = np.zeros((n + 1, n + 1))
+    ext[:n, :n] = dist
+    # 가상 도시(n)에서 출발하는 최근접 이웃은 항상 같은 점을 고르므로, 실제 도시 각각을 출발점으로 시도
+    best, best_len = None, np.inf
+    for s in range(n):
+        tour = [n] + nearest_neighbour(dist, s)
+        length = ext[tour, np.roll(tour, -1)].sum()
+        if length < best_len:
+            best, best_len = tour, length
+    tour = two_opt(best, ext)
+    k = tour.index(n)
+    order = tour[k + 1:] + tour[:k]
+    # 방향은 결정적으로: 원래 목록에서 앞선 도시가 출발점이 되도록
+    return order if order[0] < order[-1] else order[::-1]
+
+
+@lru_cache(maxsize=4096)
+def _plan(destinations):
+    if not destinations:
+        return Route((), 0.0, ())
+    lat = [d[2] for d in destinations]
+    lon = [d[3] for d in destinations]
+    dist = distance_matrix(lat, lon)
+    order = optimize_order(dist)
+    legs = tuple(float(dist[a, b]) for a, b in zip(order, order[1:]))
+    return Route(tuple(destinations[i] for i in order), sum(legs), legs)
+
+
+def plan_route(destinations):
+    # 같은 도시 집합이면 입력 순서와 상관없이 같은 경로 (지도 캐시 키도 줄어든다)
+    return _plan(tuple(sorted(destinations)))
+
+
+def visited_route(route, days):
+    # 일수보다 도시가 많으면 allocate_days 는 뒤쪽 도시에 0일을 준다 → 실제로 가는 앞 days 곳만 남긴 경로
+    if len(route.destinations) <= days:
+        return route
+    legs = route.legs_km[:max(days - 1, 0)]
+    return Route(route.destinations[:days], sum(legs), legs)
+
+
+def allocate_days(days, n_cities, lo=0, hi=None):
+    # 날짜 i → 도시 번호 (연속 블록). 예: 7일, 3도시 → [0,0,0,1,1,2,2]
+    # lo/hi 를 주면 [lo, hi) 날짜만 (긴 일정을 조각으로 만들 때 전체 배열을 만들지 않음)
+    import numpy as np
+
+    if n_cities <= 0:
+        raise ValueError("도시가 하나 이상 필요합니다")
+    per_city = np.full(n_cities, days // n_cities)
+    per_city[:days % n_cities] += 1
+    if lo == 0 and hi is None:
+        return np.repeat(np.arange(n_cities), per_city)
+    hi = days if hi is None else min(hi, days)
+    return np.searchsorted(np.cumsum(per_city), np.arange(lo, hi), side="right")
@@ -0,0 +1,127 @@
+# similarity.py
+# 👥 MBTI 유형끼리의 유사도 → "나와 비슷한 유형" 추천 + 비슷한 유형의 도시/활동 섞기 (travel_core)
+#  - 텍스트: 스타일 + 설명 + 활동 문장의 글자 2~3-gram TF-IDF (1+log tf, 부드러운 idf, L2 정규화)
+#    한국어는 띄어쓰기/조사 때문에 단어보다 글자 n-gram 이 잘 맞는다
+#  - 목적지: 겹치는 도시의 Jaccard. 유형당 도시는 몇 개뿐이라 (유형 × 목적지) 행렬 대신
+#    목적지 → 유형 역색인에서 같은 도시를 가진 (유형, 유형) 쌍만 세어 교집합 크기를 구한다
+#  - 유사도 = TEXT_WEIGHT · 코사인 + DEST_WEIGHT · Jaccard. 유형마다 상위 TOP_K 개만 표로 남긴다
+#  - 유형이 많아도 (유형 × 유형) 전체 행렬을 만들지 않도록 BLOCK 행씩 곱하고 argpartition
+#  - 프로세스당 한 번 (catalog.Catalog.similarity, 처음 쓸 때) → 재실행마다 dict 조회 한 번
+# ---------------------------------------------------------------
+
+import math
+import re
+from collections import Counter
+
+TOP_K = 3
+TEXT_WEIGHT = 0.6
+DEST_WEIGHT = 0.4
+NGRAMS = (2, 3)
+MAX_FEATURES = 8192  # 문서 빈도가 높은 n-gram 부터 (유형이 아주 많을 때 행렬 폭 제한)
+BLOCK = 1024
+
+_word = re.compile(r"[0-9a-z가-힣]+")
+
+
+def char_ngrams(text):
+    # 단어마다 앞뒤에 공백을 붙여 글자 n-gram (단어 경계도 특징이 되도록)
+    grams = []
+    for w in _word.findall(text.lower()):
+        w = f" {w} "
+        for n in NGRAMS:
+            grams.extend(w[i:i + n] for i in range(len(w) - n + 1))
+    return grams
+
+
+def tfidf_matrix(texts, max_features=MAX_FEATURES):
+    """텍스트 목록 → (행 L2 정규화된 float32 TF-IDF 행렬, n-gram 목록)."""
+    import numpy as np
+
+    counts = [Counter(char_ngrams(t)) for t in texts]
+    df = Counter()
+    for c in counts:
+        df.update(c.keys())
+    vocab = [g for g, _ in df.most_common(max_features)]
+    col = {g: j for j, g in enumerate(vocab)}
+    n = len(texts)
+    idf = np.array([math.log((1 + n) / (1 + df[g])) + 1.0 for g in vocab], dtype=np.float32)
+    mat = np.zeros((n, len(vocab)), dtype=np.float32)
+    for i, c in enumerate(counts):
+        js = [col[g] for g in c if g in col]
+        if js:
+            mat[i, js] = [1.0 + math.log(c[vocab[j]]) for j in js]
+    mat *= idf
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    np.divide(mat, norms, out=mat, where=norms > 0)
+    return mat, vocab
+
+
+def shared_pairs(dest_ids):
+    # 같은 목적지를 가진 유형 쌍 (i, j) — i 순으로 정렬 (i == j 포함). 겹침 하나당 한 쌍
+    import numpy as np
+
+    owners = {}
+    for i, ids in enumerate(dest_ids):
+        for d in set(ids):
+            owners.setdefault(d, []).append(i)
+    pi, pj = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for ts in owners.values():
+        ts = np.asarray(ts, dtype=np.int64)
+        pi.append(np.repeat(ts, len(ts)))
+        pj.append(np.tile(ts, len(ts)))
+    pi, pj = np.concatenate(pi), np.concatenate(pj)
+    order = np.argsort(pi, kind="stable")
+    return pi[order], pj[order]
+
+
+def top_k_similar(text, dest_ids, k=TOP_K, text_weight=TEXT_WEIGHT, dest_weight=DEST_WEIGHT, block=BLOCK):
+    """유형별 상위 k 이웃 (번호 행렬, 점수 행렬). text: TF-IDF 행렬, dest_ids: 유형별 목적지 번호들."""
+    import numpy as np
+
+    n = text.shape[0]
+    k = min(k, n - 1)
+    idx = np.empty((n, max(k, 0)), dtype=np.int64)
+    score = np.empty((n, max(k, 0)), dtype=np.float32)
+    if k <= 0:
+        return idx, score
+    sizes = np.array([len(set(ids)) for ids in dest_ids], dtype=np.float32)
+    pi, pj = shared_pairs(dest_ids)
+    for lo in range(0, n, block):
+        hi = min(lo + block, n)
+        sim = text[lo:hi] @ text.T
+        inter = np.zeros_like(sim)
+        a, b = np.searchsorted(pi, [lo, hi])
+        np.add.at(inter, (pi[a:b] - lo, pj[a:b]), 1.0)
+        union = sizes[lo:hi, None] + sizes[None, :] - inter
+        jac = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        sim = text_weight * sim + dest_weight * jac
+        sim[np.arange(hi - lo), np.arange(lo, hi)] = -np.inf  # 자기 자신 제외
+        part = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+        part_score = np.take_along_axis(sim, part, axis=1)
+        order = np.argsort(-part_score, axis=1, kind="stable")
+        idx[lo:hi] = np.take_along_axis(part, order, axis=1)
+        score[lo:hi] = np.take_along_axis(part_score, order, axis=1)
+    return idx, score
+
+
+class SimilarityIndex:
+    # 유형 → ((이웃 유형, 점수), ...) 점수 내림차순. 만든 뒤에는 읽기 전용
+    def __init__(self, types, idx, score):
+        self.types = tuple(types)
+        self._neighbors = {t: tuple((self.types[j], float(s)) for j, s in zip(idx[i], score[i]))
+                           for i, t in enumerate(self.types)}
+
+    def __len__(self):
+        return len(self.types)
+
+    def neighbors(self, mbti, k=None):
+        nb = self._neighbors.get(mbti, ())
+        return nb if k is None else nb[:k]
+
+
+def build_similarity(types, k=TOP_K):
+    """types: {유형: (스타일, 설명, 활동들, 목적지 번호들)} → SimilarityIndex."""
+    texts = [" ".join([style, desc, *acts]) for style, desc, acts, _ in types.values()]
+    text, _ = tfidf_matrix(texts)
+    idx, score = top_k_similar(text, [ids for *_, ids in types.values()], k)
+    return SimilarityIndex(list(types), idx, score)
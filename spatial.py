@@ -0,0 +1,130 @@
+# spatial.py
+# 🧭 위경도 공간 인덱스: 벡터화 haversine + 격자(grid) 버킷
+#  - within(위도, 경도, 반경km): 반경 안의 모든 점 (가까운 순)
+#  - nearest(위도, 경도, k): 가장 가까운 k개 (반경을 두 배씩 넓혀 정확히 찾음)
+# 격자 칸 번호 = 행 * 열개수 + 열 → 한 행의 연속된 열은 정렬된 배열에서 연속 구간이라
+# 행마다 searchsorted 두 번으로 후보를 모은다.
+# (route.py 를 통해 앱 시작 때 import 되므로 numpy 는 함수 안에서)
+# ---------------------------------------------------------------
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS_KM
+KM_PER_DEG = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    # 도(degree) 단위 입력, km 반환. 배열끼리 브로드캐스팅 가능
+    import numpy as np
+
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _sorted_hits(idx, dist, limit=None):
+    import numpy as np
+
+    order = np.argsort(dist, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    return idx[order], dist[order]
+
+
+def brute_within(lat, lon, q_lat, q_lon, radius_km):
+    import numpy as np
+
+    dist = haversine(q_lat, q_lon, lat, lon)
+    idx = np.flatnonzero(dist <= radius_km)
+    return _sorted_hits(idx, dist[idx])
+
+
+def brute_nearest(lat, lon, q_lat, q_lon, k):
+    import numpy as np
+
+    dist = haversine(q_lat, q_lon, lat, lon)
+    k = min(k, len(dist))
+    idx = np.argpartition(dist, k - 1)[:k] if k else np.empty(0, dtype=np.int64)
+    return _sorted_hits(idx, dist[idx])
+
+
+class GridIndex:
+    def __init__(self, lat, lon, cell_deg=1.0):
+        import numpy as np
+
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.cell_deg = cell_deg
+        self.n_rows = int(math.ceil(180 / cell_deg))
+        self.n_cols = int(math.ceil(360 / cell_deg))
+        cells = self._row(self.lat) * self.n_cols + self._col(self.lon)
+        self._order = np.argsort(cells, kind="stable")
+        self._cells = cells[self._order]
+
+    def __len__(self):
+        return len(self.lat)
+
+    def _row(self, lat):
+        import numpy as np
+
+        return np.clip(((np.asarray(lat) + 90) // self.cell_deg).astype(np.int64), 0, self.n_rows - 1)
+
+    def _col(self, lon):
+        import numpy as np
+
+        return (((np.asarray(lon) + 180) // self.cell_deg).astype(np.int64)) % self.n_cols
+
+    def _candidates(self, q_lat, q_lon, radius_km):
+        # 반경을 덮는 격자 칸들의 점 번호 (경도 ±180 경계 넘어가면 둘로 나눔)
+        import numpy as np
+
+        dlat = radius_km / KM_PER_DEG
+        lat_lo, lat_hi = max(-90.0, q_lat - dlat), min(90.0, q_lat + dlat)
+        max_abs = max(abs(lat_lo), abs(lat_hi))
+        if lat_hi >= 90 or lat_lo <= -90 or max_abs >= 89.9:
+            dlon = 180.0
+        else:
+            dlon = min(180.0, dlat / math.cos(math.radians(max_abs)))
+        r0, r1 = int(self._row(lat_lo)), int(self._row(lat_hi))
+        if dlon >= 180:
+            spans = [(0, self.n_cols - 1)]
+        else:
+            c0, c1 = int(self._col(q_lon - dlon)), int(self._col(q_lon + dlon))
+            spans = [(c0, c1)] if c0 <= c1 else [(c0, self.n_cols - 1), (0, c1)]
+        los, his = [], []
+        for r in range(r0, r1 + 1):
+            base = r * self.n_cols
+            for c0, c1 in spans:
+                los.append(base + c0)
+                his.append(base + c1)
+        starts = np.searchsorted(self._cells, los, side="left")
+        ends = np.searchsorted(self._cells, his, side="right")
+        parts = [self._order[s:e] for s, e in zip(starts, ends) if e > s]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def within(self, q_lat, q_lon, radius_km):
+        cand = self._candidates(q_lat, q_lon, radius_km)
+        dist = haversine(q_lat, q_lon, self.lat[cand], self.lon[cand])
+        keep = dist <= radius_km
+        return _sorted_hits(cand[keep], dist[keep])
+
+    def nearest(self, q_lat, q_lon, k, exclude=()):
+        # exclude: 결과에서 뺄 점 번호들 (예: 이미 고른 도시 자신)
+        import numpy as np
+
+        exclude = np.asarray(list(exclude), dtype=np.int64)
+        want = min(k, len(self) - len(np.unique(exclude)))
+        if want <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        # 첫 반경: 점이 고르게 퍼져 있다고 보고 k개가 들어올 만한 크기에서 시작
+        radius = max(2 * EARTH_RADIUS_KM * math.sqrt((want + len(exclude)) / len(self)), 1.0)
+        while True:
+            idx, dist = self.within(q_lat, q_lon, radius)
+            if len(exclude):
+                keep = ~np.isin(idx, exclude)
+                idx, dist = idx[keep], dist[keep]
+            # 반경 안은 빠짐없이 찾았으므로 k개가 모이면 정확한 답
+            if len(idx) >= want or radius >= HALF_CIRCUMFERENCE_KM:
+                return idx[:want], dist[:want]
+            radius *= 2
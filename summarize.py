@@ -0,0 +1,245 @@
+# summarize.py
+# 📝 여행 글 묶음 요약: 글 모음 폴더 → 문서별 요약 → 도시별 요약 색인 (data/city_summaries.json)
+#  - sumy LexRank / LSA. 문장/단어 분리는 정규식 토크나이저 (nltk 데이터 내려받기 없이, 한글/영문 공통)
+#  - 프로세스 풀(multiprocessing.Pool.imap_unordered)로 문서를 나눠 요약, 파일은 조각(CHUNK_BYTES)씩 읽으며 해시
+#  - 요약은 .cache/summaries/ 에 내용 해시(+ 알고리즘/문장 수)로 저장 → 다시 돌리면 새 글/바뀐 글만 요약
+#    (manifest.json 에 경로별 mtime/크기/해시 — 안 바뀐 파일은 읽지도 않는다)
+#  - 도시: 폴더 이름이 카탈로그 도시면 그 도시, 아니면 본문에 가장 많이 나온 도시 (feeds.CityMatcher)
+#  - 도시별로 문서 요약 문장을 모아 한 번 더 요약 → 작은 JSON 색인. 앱은 시작할 때 이것만 읽는다
+# 사용법:
+#   python summarize.py 글폴더/ [--algo lexrank|lsa] [--sentences 3] [--workers 4]
+# 색인 경로는 CITY_SUMMARIES, 요약 캐시 폴더는 SUMMARY_CACHE_DIR 환경변수로 바꿀 수 있다.
+# ---------------------------------------------------------------
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_INDEX = os.environ.get("CITY_SUMMARIES", str(ROOT / "data" / "city_summaries.json"))
+DEFAULT_CACHE = os.environ.get("SUMMARY_CACHE_DIR", str(ROOT / ".cache" / "summaries"))
+VERSION = 1                 # 요약 방식이 바뀌면 올림 (예전 캐시 무시)
+ALGOS = ("lexrank", "lsa")
+SUFFIXES = (".txt", ".html", ".htm")
+CHUNK_BYTES = 64 * 1024     # 파일을 읽는 조각 크기
+MAX_DOC_BYTES = 512 * 1024  # 요약에 쓰는 앞부분 (해시는 파일 전체)
+
+
+class RegexTokenizer:
+    # sumy 가 쓰는 토크나이저 인터페이스 (language / to_sentences / to_words)
+    language = "korean"
+    _sentence = re.compile(r"(?<=[.!?。])\s+|\n+")
+    _word = re.compile(r"[0-9a-z가-힣]+")
+
+    def to_sentences(self, text):
+        return [s.strip() for s in self._sentence.split(text) if len(s.strip()) > 1]
+
+    def to_words(self, sentence):
+        return self._word.findall(sentence.lower())
+
+
+def summarize_text(text, algo="lexrank", sentences=3):
+    """텍스트 → 중요한 문장 sentences 개 (원문 순서)."""
+    from sumy.parsers.plaintext import PlaintextParser
+    from sumy.summarizers.lex_rank import LexRankSummarizer
+    from sumy.summarizers.lsa import LsaSummarizer
+
+    tok = RegexTokenizer()
+    parts = list(dict.fromkeys(tok.to_sentences(text)))  # 같은 문장 반복은 하나로
+    if len(parts) <= sentences:
+        return parts
+    summarizer = (LsaSummarizer if algo == "lsa" else LexRankSummarizer)()
+    summarizer.stop_words = ()
+    parser = PlaintextParser.from_string("\n".join(parts), tok)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # LSA: 단어 수 < 문장 수 경고
+        return [str(s) for s in summarizer(parser.document, sentences)]
+
+
+def read_document(path):
+    """파일을 조각씩 읽어 (내용 해시, 앞부분 텍스트). HTML 은 본문만 추출."""
+    h = hashlib.sha256()
+    head = bytearray()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+            h.update(chunk)
+            if len(head) < MAX_DOC_BYTES:
+                head += chunk[:MAX_DOC_BYTES - len(head)]
+    text = bytes(head).decode("utf-8", errors="ignore")
+    if str(path).lower().endswith((".html", ".htm")):
+        from feeds import extract_text
+
+        text = extract_text(text)
+    return h.hexdigest(), text
+
+
+def memo_path(cache_dir, content_hash, algo, sentences):
+    key = hashlib.sha256(f"{content_hash}:{algo}:{sentences}:v{VERSION}".encode()).hexdigest()
+    return os.path.join(cache_dir, key[:2], key + ".json")
+
+
+def _write_json(path, obj):
+    parent = os.path.dirname(path)
+    if parent:  # --out idx.json 처럼 파일 이름만이면 현재 디렉터리
+        os.makedirs(parent, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _read_json(path, default=None):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+_matcher = None
+
+
+def _city_matcher():
+    # 작업 프로세스마다 한 번
+    global _matcher
+    if _matcher is None:
+        from catalog import get_catalog
+        from feeds import CityMatcher, load_config
+
+        _matcher = CityMatcher([d.city for d in get_catalog().destinations], load_config().get("aliases"))
+    return _matcher
+
+
+def _summarize_file(task):
+    # 작업 프로세스: (경로, 알고리즘, 문장 수, 캐시 폴더) → (경로, 해시, 요약 dict, 캐시 적중 여부)
+    path, algo, sentences, cache_dir = task
+    # 문서 하나가 깨져 있어도(본문 추출/sumy/도시 매칭 예외) 전체 실행은 계속 → 실패로만 집계
+    try:
+        content_hash, text = read_document(path)
+    except Exception as e:
+        return path, None, {"error": f"{type(e).__name__}: {e}"}, False
+    memo = memo_path(cache_dir, content_hash, algo, sentences)
+    cached = _read_json(memo)
+    if cached is not None:
+        return path, content_hash, cached, True
+    try:
+        result = {"sentences": summarize_text(text, algo, sentences),
+                  "cities": _city_matcher().match(text)[:3]}
+    except Exception as e:
+        return path, None, {"error": f"{type(e).__name__}: {e}"}, False
+    _write_json(memo, result)
+    return path, content_hash, result, False
+
+
+def _summarize_city(task):
+    city, parts, algo, sentences = task
+    return city, summarize_text("\n".join(parts), algo, sentences)
+
+
+def iter_documents(root):
+    """root 아래 글 파일을 (경로, 상대 경로, stat) 으로 하나씩 (전체 목록을 메모리에 만들지 않음)."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(SUFFIXES):
+                    yield entry.path, os.path.relpath(entry.path, root), entry.stat()
+
+
+def build_index(root, out=DEFAULT_INDEX, algo="lexrank", sentences=3, workers=None,
+                cache_dir=DEFAULT_CACHE, chunksize=8):
+    """글 폴더 → 도시별 요약 색인 파일. 실행 통계 dict 를 돌려준다."""
+    from catalog import get_catalog
+    from multiprocessing import Pool
+
+    if algo not in ALGOS:
+        raise ValueError(f"algo 는 {ALGOS} 중 하나")
+    t0 = time.perf_counter()
+    cities = {d.city for d in get_catalog().destinations}
+    manifest_path = os.path.join(cache_dir, f"manifest-{algo}{sentences}.json")
+    old = _read_json(manifest_path, {})
+    manifest, docs, hints, tasks = {}, {}, {}, []
+    stats = {"files": 0, "unchanged": 0, "memo_hits": 0, "summarized": 0, "failed": 0}
+
+    for path, rel, st in iter_documents(root):
+        stats["files"] += 1
+        top = Path(rel).parts[0] if len(Path(rel).parts) > 1 else None
+        hints[path] = top if top in cities else None
+        prev = old.get(rel)
+        if prev and prev[:2] == [st.st_mtime_ns, st.st_size]:
+            cached = _read_json(memo_path(cache_dir, prev[2], algo, sentences))
+            if cached is not None:
+                stats["unchanged"] += 1
+                manifest[rel], docs[path] = prev, cached
+                continue
+        tasks.append((path, rel, st))
+
+    def results():
+        jobs = ((path, algo, sentences, cache_dir) for path, _, _ in tasks)
+        if (workers or os.cpu_count() or 1) <= 1:
+            yield from map(_summarize_file, jobs)
+        else:
+            with Pool(workers) as pool:
+                yield from pool.imap_unordered(_summarize_file, jobs, chunksize=chunksize)
+
+    stat_of = {path: (rel, st) for path, rel, st in tasks}
+    for path, content_hash, result, hit in results():
+        if content_hash is None:
+            stats["failed"] += 1
+            continue
+        stats["memo_hits" if hit else "summarized"] += 1
+        rel, st = stat_of[path]
+        manifest[rel] = [st.st_mtime_ns, st.st_size, content_hash]
+        docs[path] = result
+
+    # 도시별: 문서 요약 문장을 모아(경로 순서로 고정) 한 번 더 요약
+    by_city = {}
+    for path in sorted(docs):
+        doc = docs[path]
+        city = hints[path] or (doc["cities"][0] if doc["cities"] else None)
+        if city and doc["sentences"]:
+            by_city.setdefault(city, []).append(doc["sentences"])
+    city_tasks = [(city, [s for sents in parts for s in sents], algo, sentences)
+                  for city, parts in by_city.items()]
+    t1 = time.perf_counter()
+    if (workers or os.cpu_count() or 1) <= 1 or len(city_tasks) < 2:
+        city_summaries = dict(map(_summarize_city, city_tasks))
+    else:
+        with Pool(workers) as pool:
+            city_summaries = dict(pool.imap_unordered(_summarize_city, city_tasks))
+
+    index = {"version": VERSION, "algo": algo, "sentences": sentences,
+             "built": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+             "cities": {city: {"summary": city_summaries[city], "documents": len(by_city[city])}
+                        for city in sorted(city_summaries)}}
+    _write_json(out, index)
+    _write_json(manifest_path, manifest)
+    stats.update(cities=len(city_summaries), seconds=time.perf_counter() - t0,
+                 city_seconds=time.perf_counter() - t1)
+    return stats
+
+
+def load_index(path=DEFAULT_INDEX):
+    """도시 → {"summary": [문장...], "documents": n}. 색인이 없으면 빈 dict."""
+    index = _read_json(path, {})
+    return index.get("cities", {}) if index.get("version") == VERSION else {}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="여행 글 폴더 → 도시별 요약 색인")
+    ap.add_argument("root")
+    ap.add_argument("--out", default=DEFAULT_INDEX)
+    ap.add_argument("--algo", choices=ALGOS, default="lexrank")
+    ap.add_argument("--sentences", type=int, default=3)
+    ap.add_argument("--workers", type=int, default=None, help="기본: CPU 수")
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE)
+    args = ap.parse_args()
+    print(build_index(args.root, args.out, args.algo, args.sentences, args.workers, args.cache_dir))
@@ -1,5 +1,9 @@
 import streamlit as st
 
+import metrics
+from cards import CARD_CSS, cards_block
+from workbooks import GRADES, get_source
+
 # ===============================
 # 페이지 설정
 # ===============================
@@ -10,250 +14,57 @@ st.set_page_config(
 )
 
 # ===============================
-# CSS 스타일 (화려한 카드 디자인)
+# 데이터: data/workbooks.json (workbooks.py)
+# 파일이 바뀌면 백그라운드에서 다시 읽어 교체 → 재실행마다 그 시점의 스냅샷 하나만 사용
 # ===============================
-st.markdown(
-    """
-    <style>
-    body {
-        background: linear-gradient(135deg, #FF6B6B, #FFD93D, #6BCB77, #4D96FF, #9D4EDD);
-        background-attachment: fixed;
-        font-family: 'Segoe UI', sans-serif;
-        color: white;
-    }
-    h1, h2, h3, h4 {
-        text-shadow: 2px 2px 6px rgba(0,0,0,0.7);
-    }
-    .card {
-        background: rgba(0,0,0,0.5);
-        border-radius: 20px;
-        padding: 20px;
-        margin-bottom: 15px;
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-        transition: transform 0.3s, box-shadow 0.3s;
-    }
-    .card:hover {
-        transform: translateY(-5px) scale(1.03);
-        box-shadow: 0 12px 36px rgba(0,0,0,0.6);
-    }
-    .btn-link {
-        display: inline-block;
-        margin-top: 10px;
-        padding: 8px 16px;
-        border-radius: 12px;
-        font-weight: bold;
-        text-decoration: none;
-        background: linear-gradient(90deg, #FFD93D, #6BCB77, #4D96FF);
-        color: black;
-    }
-    .btn-link:hover {
-        filter: brightness(1.2);
-    }
-    </style>
-    """, unsafe_allow_html=True
-)
-
-# ===============================
-# 데이터 정의 (모든 과목/등급)
-# ===============================
-data = {
-    "국어": {
-        "1~2등급": {
-            "문제집":[
-                {"책":"매삼문","설명":"상위권 평가원 기출 기반, 빠르게 문제 풀이.","링크":"https://search.shopping.naver.com/search/all?query=매삼문"},
-                {"책":"마더텅 국어 문학","설명":"독학 최적화, 해설 충실.","링크":"https://search.shopping.naver.com/search/all?query=마더텅+국어+문학"},
-                {"책":"빠작 고전문학","설명":"핵심 고전문학 체계적 정리.","링크":"https://search.shopping.naver.com/search/all?query=빠작+고전+문학"}
-            ],
-            "루트":"문학 기초 → 기출문제 풀이 → 심화 작품 분석 → 모의고사 실전 연습",
-            "루트이유":"기초부터 난이도를 점진적으로 높이며 문학 감각과 문제 해결력을 동시에 향상."
-        },
-        "3~4등급": {
-            "문제집":[
-                {"책":"EBS 올림포스 국어","설명":"내신+기출 연계, 중위권 학습 적합.","링크":"https://search.shopping.naver.com/search/all?query=EBS+올림포스+국어"},
-                {"책":"마더텅 국어 문학 기본편","설명":"기본 개념 이해와 문제풀이 병행.","링크":"https://search.shopping.naver.com/search/all?query=마더텅+국어+문학+기본편"},
-                {"책":"쎈 국어 문학","설명":"중위권 반복 학습에 좋음.","링크":"https://search.shopping.naver.com/search/all?query=쎈+국어+문학"}
-            ],
-            "루트":"문학 기초 확인 → 기출 문제 풀이 반복 → 중요 작품 분석 → 모의고사 연습",
-            "루트이유":"기초 부족 부분 보완, 중급 독해 및 문학 감각 강화."
-        },
-        "5등급 이하": {
-            "문제집":[
-                {"책":"천일문 국어","설명":"기초 다지기 및 독해 연습.","링크":"https://search.shopping.naver.com/search/all?query=천일문+국어"},
-                {"책":"EBS 수능특강 국어","설명":"기초 개념과 유형 학습.","링크":"https://search.shopping.naver.com/search/all?query=EBS+수능특강+국어"},
-                {"책":"빠작 국어 기초","설명":"쉬운 문제로 문법/독해 감각 확보.","링크":"https://search.shopping.naver.com/search/all?query=빠작+국어+기초"}
-            ],
-            "루트":"기초 문법과 독해 이해 → 쉬운 문제 반복 → 유형별 연습 → 점진적 난이도 상승",
-            "루트이유":"국어 자신감 회복, 기초 문법/독해 능력 강화."
-        }
-    },
-    "영어": {
-        "1~2등급": {
-            "문제집":[
-                {"책":"EBS 수능특강 영어","설명":"상위권 독해 및 연계 대비.","링크":"https://search.shopping.naver.com/search/all?query=EBS+수능특강+영어"},
-                {"책":"쎄듀 빈칸 실전편","설명":"킬러 문항 집중 연습.","링크":"https://search.shopping.naver.com/search/all?query=쎄듀+영어"},
-                {"책":"어법끝 ESSENTIAL","설명":"상위권 어법 완성.","링크":"https://search.shopping.naver.com/search/all?query=어법끝"}
-            ],
-            "루트":"문법 심화 → 독해 고난도 지문 → 어휘 심화 암기 → 실전 문제풀이",
-            "루트이유":"상위권은 실수를 최소화하며, 고난도 문제 완벽 해결 능력 향상."
-        },
-        "3~4등급": {
-            "문제집":[
-                {"책":"파워업 독해실전","설명":"중위권 독해 실력 향상.","링크":"https://search.shopping.naver.com/search/all?query=파워업+독해실전"},
-                {"책":"천일문 핵심","설명":"문장 구조+독해 병행.","링크":"https://search.shopping.naver.com/search/all?query=천일문+핵심"},
-                {"책":"어휘끝 수능","설명":"중급 어휘 학습.","링크":"https://search.shopping.naver.com/search/all?query=어휘끝+수능"}
-            ],
-            "루트":"문법 점검 → 독해 중급 지문 → 어휘 암기 → 기출 문제풀이",
-            "루트이유":"기초 부족 부분 보완, 반복 학습으로 난이도 점진 상승."
-        },
-        "5등급 이하": {
-            "문제집":[
-                {"책":"어법끝 START","설명":"기초 문법 다지기.","링크":"https://search.shopping.naver.com/search/all?query=어법끝+START"},
-                {"책":"파워업 독해유형","설명":"쉬운 독해 문제 반복.","링크":"https://search.shopping.naver.com/search/all?query=파워업+독해유형"},
-                {"책":"어휘끝 고교기본","설명":"기초 단어 암기.","링크":"https://search.shopping.naver.com/search/all?query=어휘끝+고교기본"}
-            ],
-            "루트":"문법 기초 → 짧은 독해 → 기초 어휘 → 쉬운 문제 반복",
-            "루트이유":"영어 기초 실력 확보, 정확한 문장 이해와 단어 활용 능력 향상."
-        }
-    },
-    "수학": {
-        "1~2등급": {
-            "문제집":[
-                {"책":"정석","설명":"개념 빠르게 훑고 심화 문제 위주 학습.","링크":"https://search.shopping.naver.com/search/all?query=정석"},
-                {"책":"쎈","설명":"상위권 문제 집중.","링크":"https://search.shopping.naver.com/search/all?query=쎈"},
-                {"책":"블랙라벨","설명":"심화+실모 병행.","링크":"https://search.shopping.naver.com/search/all?query=블랙라벨"}
-            ],
-            "루트":"정석 → 쎈 → 블랙라벨/일품 → 한완수 → 실모 병행",
-            "루트이유":"상위권은 개념 빠르게 훑고 심화 문제 위주 학습, 기출 분석 철저."
-        },
-        "3~4등급": {
-            "문제집":[
-                {"책":"개념원리","설명":"중위권 개념 정리","링크":"https://search.shopping.naver.com/search/all?query=개념원리"},
-                {"책":"쎈+RPM","설명":"유형 반복 연습","링크":"https://search.shopping.naver.com/search/all?query=쎈+RPM"},
-                {"책":"자이스토리/마더텅","설명":"수능 대비","링크":"https://search.shopping.naver.com/search/all?query=자이스토리+마더텅"}
-            ],
-            "루트":"개념원리 → 쎈+RPM → 자이스토리/마더텅 → 수능특강",
-            "루트이유":"개념 정리와 유형 반복 학습, 내신+수능 병행."
-        },
-        "5등급 이하": {
-            "문제집":[
-                {"책":"스타트업","설명":"기초 개념 학습","링크":"https://search.shopping.naver.com/search/all?query=스타트업"},
-                {"책":"RPM+체크체크","설명":"반복 복습","링크":"https://search.shopping.naver.com/search/all?query=RPM+체크체크"},
-                {"책":"기초문제 반복","설명":"강의 병행","링크":"https://search.shopping.naver.com/search/all?query=기초문제+반복"}
-            ],
-            "루트":"개념원리/스타트업 → RPM+체크체크 → 반복 복습+강의 병행",
-            "루트이유":"기초 개념부터 차근차근 학습, 하루 1단원 정확히 이해."
-        }
-    },
-    "과탐": {
-        "물리": {
-            "1~2등급":[
-                {"책":"완자 물리학1","설명":"상위권 대비","링크":"https://search.shopping.naver.com/search/all?query=완자+물리학1"},
-                {"책":"오투 물리학1","설명":"기출 분석","링크":"https://search.shopping.naver.com/search/all?query=오투+물리학1"},
-                {"책":"하이탑 물리학1","설명":"심화 문제 포함","링크":"https://search.shopping.naver.com/search/all?query=하이탑+물리학1"}
-            ],
-            "3~4등급":[
-                {"책":"완자 물리학1 기본","설명":"중위권 대비","링크":"https://search.shopping.naver.com/search/all?query=완자+물리학1+기본"},
-                {"책":"오투 물리학1 기초","설명":"난이도 낮음","링크":"https://search.shopping.naver.com/search/all?query=오투+물리학1+기초"},
-                {"책":"하이탑 물리학1 기초","설명":"문제 풀이 중심","링크":"https://search.shopping.naver.com/search/all?query=하이탑+물리학1+기초"}
-            ],
-            "5등급 이하":[
-                {"책":"물리 기초","설명":"개념 이해","링크":"https://search.shopping.naver.com/search/all?query=물리+기초"},
-                {"책":"쉬운 물리 문제","설명":"문제 반복","링크":"https://search.shopping.naver.com/search/all?query=쉬운+물리+문제"},
-                {"책":"물리 기본서","설명":"자습용","링크":"https://search.shopping.naver.com/search/all?query=물리+기본서"}
-            ],
-            "루트":"기초 개념 → 유형별 문제 풀이 → 기출 심화 → 실전 문제 풀이",
-            "루트이유":"기초부터 실전까지 단계별 학습으로 실력 향상."
-        },
-        "화학": {
-            "1~2등급":[
-                {"책":"완자 화학1","설명":"상위권 심화 문제 대비","링크":"https://search.shopping.naver.com/search/all?query=완자+화학1"},
-                {"책":"하이탑 화학1","설명":"상위권 개념+문제 집중","링크":"https://search.shopping.naver.com/search/all?query=하이탑+화학1"},
-                {"책":"EBS 개념완성 화학1","설명":"내신+수능 대비","링크":"https://search.shopping.naver.com/search/all?query=EBS+개념완성+화학1"}
-            ],
-            "3~4등급":[
-                {"책":"완자 화학1 기본","설명":"중위권 개념+문제풀이","링크":"https://search.shopping.naver.com/search/all?query=완자+화학1+기본"},
-                {"책":"오투 화학1","설명":"중급 난이도 문제","링크":"https://search.shopping.naver.com/search/all?query=오투+화학1"},
-                {"책":"하이탑 화학1 기본","설명":"개념 이해 중심","링크":"https://search.shopping.naver.com/search/all?query=하이탑+화학1+기본"}
-            ],
-            "5등급 이하":[
-                {"책":"화학 기초","설명":"개념 이해 및 문제풀이","링크":"https://search.shopping.naver.com/search/all?query=화학+기초"},
-                {"책":"쉬운 화학 문제","설명":"문제 반복","링크":"https://search.shopping.naver.com/search/all?query=쉬운+화학+문제"},
-                {"책":"화학 기본서","설명":"자습용","링크":"https://search.shopping.naver.com/search/all?query=화학+기본서"}
-            ],
-            "루트":"기초 개념 → 문제풀이 → 심화 연습 → 실전 대비",
-            "루트이유":"기초부터 실전까지 단계별 학습으로 이해도 향상."
-        },
-        "생명": {
-            "1~2등급":[
-                {"책":"완자 생명과학","설명":"상위권 심화 문제 대비","링크":"https://search.shopping.naver.com/search/all?query=완자+생명과학"},
-                {"책":"하이탑 생명과학","설명":"심화 개념+문제","링크":"https://search.shopping.naver.com/search/all?query=하이탑+생명과학"},
-                {"책":"오투 생명과학","설명":"기출 대비","링크":"https://search.shopping.naver.com/search/all?query=오투+생명과학"}
-            ],
-            "3~4등급":[
-                {"책":"완자 생명과학 기본","설명":"중위권 개념+문제풀이","링크":"https://search.shopping.naver.com/search/all?query=완자+생명과학+기본"},
-                {"책":"하이탑 생명과학 기초","설명":"개념 이해 중심","링크":"https://search.shopping.naver.com/search/all?query=하이탑+생명과학+기초"},
-                {"책":"오투 생명과학 기초","설명":"문제 풀이 반복","링크":"https://search.shopping.naver.com/search/all?query=오투+생명과학+기초"}
-            ],
-            "5등급 이하":[
-                {"책":"생명과학 기초","설명":"개념+문제 반복 학습","링크":"https://search.shopping.naver.com/search/all?query=생명과학+기초"},
-                {"책":"쉬운 생명 문제","설명":"반복 학습","링크":"https://search.shopping.naver.com/search/all?query=쉬운+생명+문제"},
-                {"책":"생명과학 기본서","설명":"자습용","링크":"https://search.shopping.naver.com/search/all?query=생명과학+기본서"}
-            ],
-            "루트":"기초 개념 → 문제풀이 반복 → 심화 문제 → 실전 대비",
-            "루트이유":"기초부터 실전까지 단계별 학습으로 이해도 향상."
-        },
-        "지구": {
-            "1~2등급":[
-                {"책":"완자 지구과학1","설명":"상위권 심화 문제 대비","링크":"https://search.shopping.naver.com/search/all?query=완자+지구과학1"},
-                {"책":"하이탑 지구과학1","설명":"상위권 개념+문제","링크":"https://search.shopping.naver.com/search/all?query=하이탑+지구과학1"},
-                {"책":"뉴올리드 지구과학1","설명":"체계적 개념 정리","링크":"https://search.shopping.naver.com/search/all?query=뉴올리드+지구과학1"}
-            ],
-            "3~4등급":[
-                {"책":"완자 지구과학1 기본","설명":"중위권 학습 적합","링크":"https://search.shopping.naver.com/search/all?query=완자+지구과학1+기본"},
-                {"책":"하이탑 지구과학1 기초","설명":"기초 개념 정리","링크":"https://search.shopping.naver.com/search/all?query=하이탑+지구과학1+기초"},
-                {"책":"투플러스 지구과학1","설명":"문제 풀이 반복","링크":"https://search.shopping.naver.com/search/all?query=투플러스+지구과학1"}
-            ],
-            "5등급 이하":[
-                {"책":"지구과학 기초","설명":"기본 개념+쉬운 문제","링크":"https://search.shopping.naver.com/search/all?query=지구과학+기초"},
-                {"책":"쉬운 지구 문제","설명":"반복 학습","링크":"https://search.shopping.naver.com/search/all?query=쉬운+지구+문제"},
-                {"책":"지구과학 기본서","설명":"자습용","링크":"https://search.shopping.naver.com/search/all?query=지구과학+기본서"}
-            ],
-            "루트":"기초 개념 → 문제풀이 → 심화 문제 → 실전 대비",
-            "루트이유":"기초부터 실전까지 단계별 학습으로 이해도 향상."
-        }
-    }
-}
+catalog = get_source().current
 
 # ===============================
 # 카드 출력 함수
+# (과목, 분야, 등급)별 카드 HTML 은 카탈로그를 읽을 때 미리 만들어 두고, 재실행 때는 요소 하나로 내보낸다
+# CSS 는 재실행마다 처음 나가는 카드 블록 맨 앞에만 붙인다 (검색 결과가 먼저 나가면 그쪽에)
 # ===============================
-def show_cards(items):
-    for item in items:
-        st.markdown(f"""
-        <div class="card">
-            <h3>📚 {item['책']}</h3>
-            <p>{item['설명']}</p>
-            <a class="btn-link" href="{item['링크']}" target="_blank">🔗 구매하러 가기</a>
-        </div>
-        """, unsafe_allow_html=True)
+@metrics.timed("cards.render")
+def show_cards(subject, field, grade, css=CARD_CSS):
+    block = catalog.blocks.get((subject, field, grade), "")
+    st.markdown(css + block if block else "", unsafe_allow_html=True)
+
+def show_route(subject, field, grade):
+    route = catalog.route_for(subject, field, grade)
+    if route:
+        st.success(f"📌 학습 루트: {route.route}\n💡 이유: {route.reason}")
 
 # ===============================
 # UI
 # ===============================
 st.title("🌈 고2 과목&등급별 문제집 추천 🌈")
 
-subject = st.selectbox("과목 선택", list(data.keys()))
+# ?debug=1 이면 이 세션의 카드 렌더링 시간도 측정 (TRAVEL_METRICS_FILE 이 있으면 프로세스 전체를 파일로 기록)
+metrics.maybe_start_exporter()
+metrics.enable_session(st.query_params.get("debug") == "1")
+
+# 검색: 과목/등급을 몰라도 책 이름·설명으로 바로 찾기 (예: 기출, 마더텅)
+query = st.text_input("🔎 문제집 검색", placeholder="책 이름이나 설명으로 찾기 (예: 기출, 마더텅)")
+css = CARD_CSS  # 이번 재실행에서 아직 안 보낸 카드 CSS
+if query.strip():
+    with metrics.span("search.query"):
+        results = catalog.index.search(query, k=30)
+    if results:
+        st.caption(f"'{query}' 검색 결과 {len(results)}권")
+        st.markdown(cards_block([
+            {"책": b["책"], "링크": b["링크"],
+             "설명": f"[{' '.join(x for x in (b['과목'], b['분야'], b['등급']) if x)}] {b['설명']}"}
+            for _, b in results], css=css), unsafe_allow_html=True)
+        css = ""
+    else:
+        st.info(f"'{query}'에 맞는 문제집이 없어요.")
+    st.markdown("---")
 
-if subject == "과탐":
-    field = st.selectbox("과탐 분야 선택", list(data[subject].keys()))
-    grade = st.selectbox("등급 선택", ["1~2등급", "3~4등급", "5등급 이하"])
-    st.subheader(f"{field} {grade} 추천 문제집")
-    show_cards(data[subject][field][grade])
-    if st.button("학습 루트 보기"):
-        st.success(f"📌 학습 루트: {data[subject][field]['루트']}\n💡 이유: {data[subject][field]['루트이유']}")
-else:
-    grade = st.selectbox("등급 선택", ["1~2등급", "3~4등급", "5등급 이하"])
-    st.subheader(f"{subject} {grade} 추천 문제집")
-    show_cards(data[subject][grade]["문제집"])
-    if st.button("학습 루트 보기"):
-        st.success(f"📌 학습 루트: {data[subject][grade]['루트']}\n💡 이유: {data[subject][grade]['루트이유']}")
+subject = st.selectbox("과목 선택", catalog.subjects)
+fields = catalog.fields_of(subject)
+field = st.selectbox(f"{subject} 분야 선택", fields) if fields else None
+grade = st.selectbox("등급 선택", GRADES)
+st.subheader(f"{field or subject} {grade} 추천 문제집")
+show_cards(subject, field, grade, css)
+if st.button("학습 루트 보기"):
+    show_route(subject, field, grade)
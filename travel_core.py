@@ -0,0 +1,349 @@
+# travel_core.py
+# 🧳 MBTI 여행 추천의 데이터 + 일정 생성 로직 (streamlit 없이 import 가능)
+# main.py 와 배치 생성/벤치마크 스크립트가 함께 사용
+# numpy/pandas 는 콜드 스타트를 줄이려고 처음 쓰는 함수 안에서 import
+# ---------------------------------------------------------------
+
+from functools import lru_cache
+
+from catalog import get_catalog
+from trip_rng import DAY_STREAM, DEST_STREAM, TripRNG
+
+# -----------------------------
+# 데이터: 16개 MBTI 유형별 추천 (data/catalog.json → catalog.py)
+# 각 목적지는 Destination(도시, 나라, 위도, 경도)
+# -----------------------------
+CATALOG = get_catalog()
+DATA = CATALOG.as_data()
+
+# 대표 이미지 (공개 이미지 URL 예시) — 카탈로그의 image 항목
+DEFAULT_IMAGES = CATALOG.images
+
+# 일정 생성 로직이 바뀌면 올린다 (저장된 일정의 키에 포함 → 예전 결과를 재사용하지 않음)
+# 4: 난수 스트림이 (시드, MBTI) 기준 — 같은 시드라도 유형마다 독립
+# 5: 비슷한 유형 섞기(blend) 가중치를 "뽑힌 항목 중 다른 유형 비율 = blend" 가 되도록 보정
+ITINERARY_VERSION = 5
+MEALS_TEXT = "현지 음식 맛보기(로컬 식당/마켓)"
+CHUNK_DAYS = 91  # 긴 일정을 만들고/요약하고/내보낼 때 한 번에 다루는 날짜 수 (약 석 달)
+
+
+def trip_rng(mbti, seed):
+    # 일정 하나의 난수: 시드 + MBTI(4글자 → 정수 문맥)로 나눈 스트림
+    return TripRNG(seed, int.from_bytes(str(mbti).encode("utf-8"), "big"))
+
+
+def _foreign_share(n_own, n_foreign, weight, k):
+    # 자기 항목 n_own 개(각 가중치 1) + 다른 유형 항목 n_foreign 개(합계 weight, 고르게 나눴다고 보고)에서
+    # k 개를 비복원 가중 추출할 때 다른 유형 항목의 기대 비율 (뽑힌 (자기, 다른) 개수별 확률을 한 단계씩)
+    probs = {(0, 0): 1.0}
+    expected = 0.0
+    for _ in range(k):
+        nxt = {}
+        for (a, b), p in probs.items():
+            own, foreign = n_own - a, weight * (n_foreign - b) / n_foreign
+            q = foreign / (own + foreign) if own + foreign > 0 else 0.0
+            expected += p * q
+            nxt[a + 1, b] = nxt.get((a + 1, b), 0.0) + p * (1 - q)
+            nxt[a, b + 1] = nxt.get((a, b + 1), 0.0) + p * q
+        probs = nxt
+    return expected / k
+
+
+@lru_cache(maxsize=1024)
+def blend_pool(mbti, blend, field, k):
+    # 유형 자신의 항목(가중치 1) + 비슷한 유형(CATALOG.similarity 상위 이웃)의 항목 (가중치는 유사도에 비례)
+    # k 개를 뽑을 때 다른 유형 항목의 기대 비율이 blend 가 되도록 다른 유형 가중치의 합을 이분 탐색으로 맞춘다
+    # field: "destinations" | "activities". (mbti, blend, k) 마다 한 번만 만든다
+    import numpy as np
+
+    items = list(DATA[mbti][field])
+    n_own = len(items)
+    seen = set(items)
+    sims = []
+    for other, score in CATALOG.similarity.neighbors(mbti):
+        for x in DATA[other][field]:
+            if x not in seen:
+                seen.add(x)
+                items.append(x)
+                sims.append(max(score, 0.0))
+    weights = np.ones(len(items))
+    if not sims:
+        return tuple(items), weights
+    k = min(k, len(items))
+    lo, hi = 0.0, 1.0
+    while _foreign_share(n_own, len(sims), hi, k) < blend and hi < 1e9:
+        hi *= 2
+    for _ in range(50):
+        mid = (lo + hi) / 2
+        lo, hi = (mid, hi) if _foreign_share(n_own, len(sims), mid, k) < blend else (lo, mid)
+    sims = np.array(sims) if sum(sims) > 0 else np.ones(len(sims))
+    weights[n_own:] = hi * sims / sims.sum()
+    return tuple(items), weights
+
+
+def _weighted_top(u, weights, k):
+    # 가중치 비복원 추출 (Efraimidis–Spirakis): 키 log(u)/w 가 큰 순서로 k개
+    import numpy as np
+
+    with np.errstate(divide="ignore"):
+        keys = np.log(u) / weights
+    return np.argsort(-keys, axis=1, kind="stable")[:, :k]
+
+
+def sample_destinations(mbti, count, rng, blend=0.0):
+    # rng: trip_rng(mbti, seed) (일정마다 시드에서 만든 독립 스트림)
+    # blend > 0 이면 비슷한 유형의 도시도 후보 (blend=0 이면 예전과 같은 결과)
+    if blend > 0:
+        items, weights = blend_pool(mbti, blend, "destinations", count)
+        u = rng.uniform(DEST_STREAM, 1, len(items))
+        return [items[i] for i in _weighted_top(u, weights, min(count, len(items)))[0]]
+    lst = DATA[mbti]["destinations"]
+    if count >= len(lst):
+        return lst
+    return [lst[i] for i in rng.sample(DEST_STREAM, 0, len(lst), count)[0]]
+
+
+class DayTable:
+    """한 (MBTI, 난수) 의 날짜별 아침/오후/저녁 — 필요한 날짜까지만 뽑아 두고 늘릴 때는 새 날짜만.
+
+    날짜 i 의 활동은 rng 의 (DAY_STREAM, i) 에서만 나오므로 일수를 늘리거나 줄여도 앞 날짜는 그대로다.
+    날짜/도시 열은 frame() 때마다 계산 (시작일이 바뀌면 일자만 다시 쓰고, 활동은 다시 뽑지 않는다).
+    긴 일정은 chunks() 로 chunk_days 일씩 (뽑아 둔 적 없는 날짜는 저장하지 않고 바로 버린다).
+    """
+
+    def __init__(self, mbti, rng, blend=0.0):
+        self.mbti = mbti
+        self.rng = rng
+        self.blend = blend
+        self.style = DATA[mbti]["style"]
+        self.morning, self.afternoon, self.evening = [], [], []
+
+    def __len__(self):
+        return len(self.morning)
+
+    def _draw(self, lo, hi):
+        # [lo, hi) 날짜의 (아침, 오후, 저녁) 문자열 목록
+        if self.blend > 0:
+            acts, weights = blend_pool(self.mbti, self.blend, "activities", 3)
+            picks = _weighted_top(self.rng.uniform(DAY_STREAM, range(lo, hi), len(acts)), weights, min(3, len(acts)))
+        else:
+            acts = DATA[self.mbti]["activities"]
+            picks = self.rng.sample(DAY_STREAM, range(lo, hi), len(acts), min(3, len(acts)))
+        morning, afternoon, evening = [], [], []
+        for row in picks:
+            day_acts = [acts[j] for j in row]
+            morning.append(f"[아침] {day_acts[0]}")
+            afternoon.append(f"[오후] {day_acts[1] if len(day_acts)>1 else '자유 일정'}")
+            evening.append(f"[저녁] {day_acts[2] if len(day_acts)>2 else '야경 산책'}")
+        return morning, afternoon, evening
+
+    def ensure(self, days):
+        # 이미 있는 날짜는 건너뛰고 [len, days) 만 새로 뽑는다. 새로 뽑은 날짜 수를 돌려준다
+        have = len(self)
+        if days <= have:
+            return 0
+        for col, new in zip((self.morning, self.afternoon, self.evening), self._draw(have, days)):
+            col.extend(new)
+        return days - have
+
+    def frame(self, days, base_date, selected_destinations, lo=0, hi=None, keep=True):
+        """days 일 일정의 [lo, hi) 행. 뽑아 둔 날짜에 이어지는 범위만 저장 (keep=False 면 저장 안 함)."""
+        import numpy as np
+        import pandas as pd
+
+        from route import allocate_days
+
+        hi = days if hi is None else min(hi, days)
+        if keep and lo <= len(self):
+            self.ensure(hi)
+        if hi <= len(self):
+            acts = (self.morning[lo:hi], self.afternoon[lo:hi], self.evening[lo:hi])
+        else:
+            acts = self._draw(lo, hi)
+        city_of_day = allocate_days(days, len(selected_destinations), lo, hi)
+        dates = np.datetime64(base_date, "D") + np.arange(lo, hi).astype("timedelta64[D]")
+        n = hi - lo
+        return pd.DataFrame({
+            "일자": np.datetime_as_string(dates, unit="D").astype(object),
+            "MBTI 스타일": [self.style] * n,
+            "도시": [selected_destinations[c][0] for c in city_of_day],
+            "국가": [selected_destinations[c][1] for c in city_of_day],
+            "아침": acts[0],
+            "오후": acts[1],
+            "저녁": acts[2],
+            "식사": [MEALS_TEXT] * n,
+        }, index=pd.RangeIndex(lo, hi))
+
+    def chunks(self, days, base_date, selected_destinations, chunk_days=None):
+        # chunk_days 일씩 DataFrame 을 하나씩 (전체 표를 한 번에 만들지 않음)
+        chunk_days = chunk_days or CHUNK_DAYS
+        for lo in range(0, days, chunk_days):
+            yield self.frame(days, base_date, selected_destinations, lo, lo + chunk_days, keep=False)
+
+
+class TripSummary:
+    """일정 조각을 받을 때마다 주별/도시별 요약을 누적 (전체 표 없이 긴 일정 요약)."""
+
+    def __init__(self):
+        self.days = 0
+        self.weeks = {}   # 주차 → [첫날, 마지막 날, 일수, {도시: None}]
+        self.cities = {}  # 도시 → [국가, 첫날, 마지막 날, 일수]
+
+    def add(self, chunk):
+        for i, day, city, country in zip(chunk.index, chunk["일자"], chunk["도시"], chunk["국가"]):
+            week = self.weeks.setdefault(i // 7 + 1, [day, day, 0, {}])
+            week[1] = day
+            week[2] += 1
+            week[3][city] = None
+            stay = self.cities.setdefault(city, [country, day, day, 0])
+            stay[2] = day
+            stay[3] += 1
+        self.days += len(chunk)
+        return self
+
+    def week_table(self):
+        import pandas as pd
+
+        return pd.DataFrame([{"주차": f"{w}주차", "기간": f"{a} ~ {b}", "일수": n, "도시": " → ".join(cities)}
+                             for w, (a, b, n, cities) in self.weeks.items()])
+
+    def city_table(self):
+        import pandas as pd
+
+        return pd.DataFrame([{"도시": city, "국가": country, "기간": f"{a} ~ {b}", "일수": n}
+                             for city, (country, a, b, n) in self.cities.items()])
+
+
+def generate_itinerary(mbti, days, base_date, selected_destinations, rng, blend=0.0):
+    # selected_destinations 는 방문 순서대로 (route.plan_route). 도시마다 연속된 날짜를 배정
+    # 한 번 쓰고 버리는 DayTable (세션에서는 DayTable 을 들고 있다가 늘리거나 줄일 때 다시 쓴다)
+    return DayTable(mbti, rng, blend).frame(days, base_date, selected_destinations)
+
+
+# -----------------------------
+# 배치 일정 생성 (캠페인용 사전 생성)
+# 여러 (mbti, 일수, 시작일, 시드, 도시 수) 조합을 한 번에 만들어
+# 하나의 컬럼형 DataFrame 으로 돌려준다.
+# 같은 시드면 main.py 의 단일 일정(trip_rng(mbti, seed) → sample_destinations →
+# plan_route → generate_itinerary)과 행 단위로 완전히 같은 결과가 나온다.
+# 난수도 trip_rng 의 카운터 방식이라 일정/날짜 전체를 배열 연산 몇 번으로 뽑는다.
+# -----------------------------
+ITINERARY_COLUMNS = ["일자", "MBTI 스타일", "도시", "국가", "아침", "오후", "저녁", "식사"]
+
+
+def _build_tables():
+    # 모든 유형의 활동/도시를 평탄화한 배열 + 유형별 오프셋
+    # (문자열 포맷은 여기서 한 번만 해두고, 행 생성은 인덱스 연산으로 처리)
+    import numpy as np
+
+    types = list(DATA.keys())
+    act_offset, dest_offset = {}, {}
+    acts, dests = [], []
+    for t in types:
+        act_offset[t] = len(acts)
+        acts.extend(DATA[t]["activities"])
+        dest_offset[t] = len(dests)
+        dests.extend(DATA[t]["destinations"])
+    # 마지막 칸은 활동이 3개 미만일 때 쓰는 빈 칸(-1 인덱스)
+    def blocks(prefix, fallback):
+        return np.array([f"[{prefix}] {a}" for a in acts] + [f"[{prefix}] {fallback}"], dtype=object)
+    return {
+        "act_offset": act_offset,
+        "dest_offset": dest_offset,
+        "morning": blocks("아침", ""),
+        "afternoon": blocks("오후", "자유 일정"),
+        "evening": blocks("저녁", "야경 산책"),
+        "city": np.array([d[0] for d in dests], dtype=object),
+        "country": np.array([d[1] for d in dests], dtype=object),
+        "style": {t: DATA[t]["style"] for t in types},
+    }
+
+
+@lru_cache(maxsize=None)
+def _tables():
+    return _build_tables()
+
+
+@lru_cache(maxsize=None)
+def _route_order(mbti, chosen):
+    # 유형 안 도시 번호들 → 경로 최적화 순서의 번호들
+    from route import plan_route
+
+    dests = DATA[mbti]["destinations"]
+    pos = {dests[i]: i for i in chosen}
+    return tuple(pos[d] for d in plan_route([dests[i] for i in chosen]).destinations)
+
+
+def _broadcast(value, n, name):
+    import numpy as np
+
+    try:
+        return np.broadcast_to(np.asarray(value), (n,))
+    except ValueError:
+        raise ValueError(f"{name} 길이가 mbtis 길이({n})와 다릅니다") from None
+
+
+@lru_cache(maxsize=65536)
+def _seed_keys(mbti, seed):
+    return trip_rng(mbti, seed).keys
+
+
+def generate_itinerary_batch(mbtis, days, start_dates, seeds, dest_counts=2):
+    """여러 일정을 한 번에 생성해 `trip` 컬럼이 붙은 하나의 DataFrame 으로 반환."""
+    import numpy as np
+    import pandas as pd
+
+    from route import allocate_days
+    from trip_rng import sample_rows
+
+    tb = _tables()
+    mbtis = list(mbtis)
+    n = len(mbtis)
+    days = _broadcast(days, n, "days").astype(np.int64)
+    seeds = _broadcast(seeds, n, "seeds")
+    dest_counts = _broadcast(dest_counts, n, "dest_counts").astype(np.int64)
+    starts = _broadcast(np.asarray(start_dates, dtype="datetime64[D]"), n, "start_dates")
+
+    total = int(days.sum())
+    trip_of_row = np.repeat(np.arange(n), days)
+    row_start = np.cumsum(days) - days
+    day_idx = np.arange(total) - np.repeat(row_start, days)
+    keys = np.array([_seed_keys(m, int(s)) for m, s in zip(mbtis, seeds)], dtype=np.uint64).reshape(n, -1)
+    n_dest = np.array([len(DATA[m]["destinations"]) for m in mbtis])
+    n_act = np.array([len(DATA[m]["activities"]) for m in mbtis])
+
+    # 도시: 유형의 도시 수가 같은 일정끼리 한 번에 순열을 뽑고, 앞 k개를 경로 순서로
+    dest_idx = np.empty(total, dtype=np.int64)
+    for nd in np.unique(n_dest):
+        trips = np.flatnonzero(n_dest == nd)
+        perms = sample_rows(keys[trips, DEST_STREAM], np.zeros(len(trips)), nd, nd)
+        for t, perm in zip(trips, perms):
+            k = dest_counts[t]
+            chosen = tuple(range(nd)) if k >= nd else tuple(perm[:k].tolist())
+            chosen = _route_order(mbtis[t], chosen)
+            lo, hi = row_start[t], row_start[t] + days[t]
+            dest_idx[lo:hi] = tb["dest_offset"][mbtis[t]] + np.asarray(chosen)[allocate_days(int(days[t]), len(chosen))]
+
+    # 활동: 활동 수가 같은 행끼리 (키, 날짜 번호) → 3개씩 한 번에
+    act_idx = np.full((total, 3), -1, dtype=np.int64)
+    act_off = np.array([tb["act_offset"][m] for m in mbtis])
+    row_n_act = n_act[trip_of_row]
+    for na in np.unique(n_act):
+        rows = np.flatnonzero(row_n_act == na)
+        kk = min(3, int(na))
+        picks = sample_rows(keys[trip_of_row[rows], DAY_STREAM], day_idx[rows], na, kk)
+        act_idx[rows, :kk] = picks + act_off[trip_of_row[rows], None]
+    style = np.array([tb["style"][m] for m in mbtis], dtype=object)
+
+    dates = starts[trip_of_row] + day_idx.astype("timedelta64[D]")
+    return pd.DataFrame({
+        "trip": trip_of_row,
+        "일자": np.datetime_as_string(dates, unit="D").astype(object),
+        "MBTI 스타일": style[trip_of_row],
+        "도시": tb["city"][dest_idx],
+        "국가": tb["country"][dest_idx],
+        "아침": tb["morning"][act_idx[:, 0]],
+        "오후": tb["afternoon"][act_idx[:, 1]],
+        "저녁": tb["evening"][act_idx[:, 2]],
+        "식사": np.full(total, MEALS_TEXT, dtype=object),
+    })
@@ -0,0 +1,75 @@
+# trip_rng.py
+# 🎲 일정마다 독립된 난수 스트림 (전역 random.seed 대체)
+# 시드(+문맥)로 NumPy SeedSequence 를 만들고, 용도별(도시 선택/날짜별 활동) 64비트 키를 뽑는다.
+# 실제 난수는 (키, 행 번호, 열 번호)를 SplitMix64 로 섞어 만드는 카운터 방식이라
+#  - 상태가 없어 여러 스레드(세션)가 동시에 써도 서로 영향이 없고
+#  - 같은 날짜 번호면 언제, 몇 번째로 계산하든 같은 값이 나오며
+#  - 여러 일정/여러 날을 배열 연산 한 번에 뽑을 수 있다.
+# numpy 는 콜드 스타트를 줄이려고 처음 쓰는 함수 안에서 import (travel_core → main.py 가 이 모듈을 import)
+# ---------------------------------------------------------------
+
+DEST_STREAM = 0  # 추천 도시 고르기
+DAY_STREAM = 1   # 날짜별 아침/오후/저녁 활동
+N_STREAMS = 2
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_M1 = 0xBF58476D1CE4E5B9
+_M2 = 0x94D049BB133111EB
+_COL_BITS = 20  # 한 행의 열 수는 2^20 미만
+
+
+def _splitmix64(x):
+    # uint64 배열 연산은 overflow 시 2^64 로 감긴다 (의도된 동작)
+    import numpy as np
+
+    x = x + np.uint64(_GOLDEN)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(_M1)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(_M2)
+    return x ^ (x >> np.uint64(31))
+
+
+def uniforms(keys, rows, width):
+    # keys, rows: 같은 길이(또는 브로드캐스트 가능)의 배열 → (행 수, width) 의 [0, 1) 실수
+    import numpy as np
+
+    keys = np.asarray(keys, dtype=np.uint64).reshape(-1, 1)
+    rows = np.asarray(rows, dtype=np.uint64).reshape(-1, 1)
+    counter = (rows << np.uint64(_COL_BITS)) | np.arange(width, dtype=np.uint64)
+    x = _splitmix64(_splitmix64(counter) ^ keys)
+    return (x >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def sample_rows(keys, rows, n, k):
+    # 행마다 n개 중 k개를 중복 없이 뽑은 번호 (무작위 키 정렬)
+    import numpy as np
+
+    return np.argsort(uniforms(keys, rows, n), axis=1, kind="stable")[:, :k]
+
+
+class TripRNG:
+    def __init__(self, seed, *context):
+        # context: 같은 시드라도 스트림을 나누고 싶을 때 덧붙이는 정수들
+        self.seed = int(seed)
+        self.context = tuple(int(c) for c in context)
+        import numpy as np
+
+        ss = np.random.SeedSequence(self.seed, spawn_key=self.context)
+        self.keys = ss.generate_state(N_STREAMS, dtype=np.uint64)
+
+    def __repr__(self):
+        return f"TripRNG(seed={self.seed}, context={self.context})"
+
+    def key(self, stream):
+        return self.keys[stream]
+
+    def uniform(self, stream, rows, width):
+        import numpy as np
+
+        rows = np.atleast_1d(rows)
+        return uniforms(np.full(len(rows), self.keys[stream], dtype=np.uint64), rows, width)
+
+    def sample(self, stream, rows, n, k):
+        import numpy as np
+
+        rows = np.atleast_1d(rows)
+        return sample_rows(np.full(len(rows), self.keys[stream], dtype=np.uint64), rows, n, k)
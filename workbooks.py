@@ -0,0 +1,247 @@
+# workbooks.py
+# 📚 문제집 카탈로그 (test.py): data/workbooks.json 을 읽어 프로세스 전체가 공유
+#  - 평평한 스키마 하나: 책 한 권 = {subject, field, grade, title, description, link}
+#    (과탐처럼 분야가 있는 과목만 field 가 있고, 나머지는 null)
+#    학습 루트 = {subject, field, grade, route, reason} — 등급별이면 grade, 분야별이면 grade 가 null
+#  - 읽을 때 검증 → (과목, 분야, 등급) 인덱스, 카드 HTML 블록, 검색 색인까지 한 번에 만든
+#    읽기 전용 스냅샷(WorkbookCatalog)
+#  - WorkbookSource: 파일 mtime 이 바뀌면 백그라운드 스레드가 새 스냅샷을 만들어 참조만 바꿔 끼운다
+#    (세션은 .current 를 읽기만 하므로 다시 읽는 동안에도 기다리지 않는다. 검증 실패나 파일이 없어지면 이전 것 유지)
+#    책이 추가만 됐으면 검색 색인은 새로 만들지 않고 이전 색인에 새 책만 add (빠지거나 바뀐 책이 있으면 새로)
+# 파일 경로는 WORKBOOKS_PATH, 확인 주기(초)는 WORKBOOKS_RELOAD_INTERVAL 환경변수로 바꿀 수 있다.
+# ---------------------------------------------------------------
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+DEFAULT_PATH = os.environ.get("WORKBOOKS_PATH", str(Path(__file__).resolve().parent / "data" / "workbooks.json"))
+RELOAD_INTERVAL = float(os.environ.get("WORKBOOKS_RELOAD_INTERVAL", "2"))
+GRADES = ("1~2등급", "3~4등급", "5등급 이하")
+
+
+class Book(NamedTuple):
+    subject: str
+    field: str  # 분야가 없는 과목은 None
+    grade: str
+    title: str
+    description: str
+    link: str
+
+    def as_item(self):
+        # cards.py / book_search.py 가 쓰는 카드 dict
+        return {"책": self.title, "설명": self.description, "링크": self.link}
+
+
+class StudyRoute(NamedTuple):
+    route: str
+    reason: str
+
+
+def _s(x):
+    return sys.intern(x) if x is not None else None
+
+
+def validate(raw):
+    """스키마 오류 목록 (비어 있으면 통과)."""
+    errors = []
+    if not isinstance(raw, dict) or not isinstance(raw.get("books"), list) or not isinstance(raw.get("routes"), list):
+        return ["최상위는 {\"books\": [...], \"routes\": [...]} 여야 합니다"]
+    keys = set()
+    for i, b in enumerate(raw["books"]):
+        if not isinstance(b, dict):
+            errors.append(f"books[{i}]: 객체({{...}})가 아닙니다")
+            continue
+        for name in ("subject", "grade", "title", "description", "link"):
+            if not isinstance(b.get(name), str) or not b[name].strip():
+                errors.append(f"books[{i}]: {name} 가 비어 있거나 문자열이 아닙니다")
+        if b.get("field") is not None and not isinstance(b["field"], str):
+            errors.append(f"books[{i}]: field 는 문자열 또는 null")
+        if b.get("grade") not in GRADES:
+            errors.append(f"books[{i}]: 알 수 없는 등급 {b.get('grade')!r}")
+        if isinstance(b.get("link"), str) and not b["link"].startswith(("http://", "https://")):
+            errors.append(f"books[{i}]: link 는 http(s) URL 이어야 합니다")
+        # 키는 문자열(분야만 null 허용)일 때만 — 리스트 등은 위에서 이미 오류로 잡혔다
+        key = (b.get("subject"), b.get("field"), b.get("grade"))
+        if isinstance(key[0], str) and isinstance(key[2], str) and (key[1] is None or isinstance(key[1], str)):
+            keys.add(key)
+    fields_of = {}
+    for s, f, _ in keys:
+        fields_of.setdefault(s, set()).add(f)
+    for s, fields in fields_of.items():
+        if None in fields and len(fields) > 1:
+            errors.append(f"{s}: 분야가 있는 책과 없는 책이 섞여 있습니다")
+    for i, r in enumerate(raw["routes"]):
+        if not isinstance(r, dict):
+            errors.append(f"routes[{i}]: 객체({{...}})가 아닙니다")
+            continue
+        if not all(r.get(name) is None or isinstance(r[name], str) for name in ("subject", "field", "grade")):
+            errors.append(f"routes[{i}]: subject/field/grade 는 문자열 또는 null")
+            continue
+        if not isinstance(r.get("route"), str) or not isinstance(r.get("reason"), str):
+            errors.append(f"routes[{i}]: route/reason 은 문자열")
+        if not any(k[0] == r.get("subject") and k[1] == r.get("field")
+                   and (r.get("grade") is None or k[2] == r.get("grade")) for k in keys):
+            errors.append(f"routes[{i}]: 해당하는 책이 없는 루트 "
+                          f"({r.get('subject')}, {r.get('field')}, {r.get('grade')})")
+    return errors
+
+
+class WorkbookCatalog:
+    # 한 번 만들면 바꾸지 않는 스냅샷 (다시 읽으면 새 객체로 교체)
+    # 예외: 검색 색인은 책이 추가만 된 다음 스냅샷과 공유하며 늘어난다 (BookIndex.add 는 검색과 같은 잠금)
+    def __init__(self, books, routes, mtime=None, prev=None):
+        from cards import build_blocks
+
+        self.books = tuple(books)
+        self.mtime = mtime
+        self._by_key = {}
+        subjects, fields = {}, {}
+        for i, b in enumerate(self.books):
+            self._by_key.setdefault((b.subject, b.field, b.grade), []).append(i)
+            subjects.setdefault(b.subject, None)
+            if b.field is not None:
+                fields.setdefault(b.subject, {}).setdefault(b.field, None)
+        self._by_key = {k: tuple(v) for k, v in self._by_key.items()}
+        self.subjects = tuple(subjects)
+        self.fields = {s: tuple(fs) for s, fs in fields.items()}
+        self._routes = dict(routes)
+        self.blocks = build_blocks(self.entries())
+        self.index, self.added = self._index_from(prev)
+
+    def _index_from(self, prev):
+        # → (색인, 이전 색인에 추가한 책 수). 새로 만들었으면 추가 수는 None
+        from book_search import BookIndex
+
+        if prev is not None:
+            old, new = Counter(prev.books), Counter(self.books)
+            if not old - new:  # 빠지거나 바뀐 책이 없다
+                extra = new - old
+                added = sum(extra.values())
+                for b in self.books:  # 파일 순서대로
+                    if extra[b]:
+                        extra[b] -= 1
+                        prev.index.add(b.as_item(), b.subject, b.field, b.grade)
+                return prev.index, added
+        return BookIndex().add_many(self.entries()), None
+
+    def __len__(self):
+        return len(self.books)
+
+    def entries(self):
+        # ((과목, 분야, 등급), 카드 dict 목록) — cards.build_blocks / BookIndex.add_many 입력
+        for key, ids in self._by_key.items():
+            yield key, [self.books[i].as_item() for i in ids]
+
+    def fields_of(self, subject):
+        return self.fields.get(subject, ())
+
+    def books_for(self, subject, field, grade):
+        return [self.books[i] for i in self._by_key.get((subject, field, grade), ())]
+
+    def route_for(self, subject, field, grade):
+        # 등급별 루트가 있으면 그것, 없으면 분야(과목) 단위 루트
+        return self._routes.get((subject, field, grade)) or self._routes.get((subject, field, None))
+
+
+def parse_workbooks(raw, mtime=None, prev=None):
+    errors = validate(raw)
+    if errors:
+        raise ValueError("workbooks 검증 실패:\n  " + "\n  ".join(errors[:20]))
+    books = [Book(_s(b["subject"]), _s(b.get("field")), _s(b["grade"]), b["title"], b["description"], b["link"])
+             for b in raw["books"]]
+    routes = {(_s(r["subject"]), _s(r.get("field")), _s(r.get("grade"))): StudyRoute(r["route"], r["reason"])
+              for r in raw["routes"]}
+    return WorkbookCatalog(books, routes, mtime, prev)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_workbooks(path=DEFAULT_PATH, prev=None):
+    stamp = _stamp(path)
+    with open(path, encoding="utf-8") as f:
+        return parse_workbooks(json.load(f), stamp, prev)
+
+
+class WorkbookSource:
+    def __init__(self, path=DEFAULT_PATH, interval=RELOAD_INTERVAL):
+        self.path = str(path)
+        self.interval = interval
+        self.current = load_workbooks(self.path)  # 처음 한 번은 동기로 (깨진 파일이면 여기서 실패)
+        self.stats = {"reloads": 0, "incremental": 0, "failures": 0, "missing": False, "last_error": None,
+                      "last_reload_ms": None}
+        self._thread = None
+        self._lock = threading.Lock()
+        self._bad_stamp = None  # 검증에 실패한 파일 상태 (같은 파일을 매번 다시 읽지 않도록)
+
+    def check(self):
+        """파일이 바뀌었으면 다시 읽어 교체. 교체했으면 True."""
+        with self._lock:
+            stamp = None
+            try:
+                stamp = _stamp(self.path)
+                if self.stats["missing"]:
+                    self.stats["missing"] = False
+                    self.stats["last_error"] = None
+                if stamp in (self.current.mtime, self._bad_stamp):
+                    return False
+                t0 = time.perf_counter()
+                fresh = load_workbooks(self.path, prev=self.current)
+            except FileNotFoundError:
+                # 지워졌거나 옮기는 중 → 실패가 아니라 "안 바뀜". 현재 스냅샷을 두고 처음 한 번만 기록
+                if not self.stats["missing"]:
+                    self.stats["missing"] = True
+                    self.stats["last_error"] = f"{self.path} 없음 — 이전 스냅샷 유지"
+                return False
+            except (OSError, ValueError) as e:  # json.JSONDecodeError 도 ValueError
+                self._bad_stamp = stamp
+                self.stats["failures"] += 1
+                self.stats["last_error"] = str(e)
+                return False
+            # 참조 하나만 바꾸므로 읽는 쪽은 이전/새 스냅샷 중 하나를 온전히 본다
+            self.current = fresh
+            self.stats["reloads"] += 1
+            self.stats["incremental"] += fresh.added is not None
+            self.stats["last_error"] = None
+            self.stats["last_reload_ms"] = (time.perf_counter() - t0) * 1000
+            return True
+
+    def start(self):
+        if self._thread is None and self.interval > 0:
+            def loop():
+                while True:
+                    time.sleep(self.interval)
+                    try:
+                        self.check()
+                    except Exception as e:  # 예상 못 한 오류도 이 스냅샷만 거절하고 감시는 계속
+                        with self._lock:
+                            self.stats["failures"] += 1
+                            self.stats["last_error"] = f"{type(e).__name__}: {e}"
+
+            self._thread = threading.Thread(target=loop, name="workbooks-reload", daemon=True)
+            self._thread.start()
+        return self
+
+
+_sources_lock = threading.Lock()
+_sources = {}
+
+
+def get_source(path=DEFAULT_PATH):
+    # 프로세스당 하나 (감시 스레드도 하나)
+    path = str(path)
+    src = _sources.get(path)
+    if src is None:
+        with _sources_lock:
+            src = _sources.get(path)
+            if src is None:
+                src = _sources[path] = WorkbookSource(path).start()
+    return src